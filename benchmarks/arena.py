@@ -0,0 +1,88 @@
+"""
+Benchmark of memory allocated per request with and without request-scoped
+arenas.
+
+Usage::
+
+    $ python benchmarks/arena.py
+
+"""
+
+from __future__ import print_function
+
+import timeit
+import tracemalloc
+
+from traversalkit import Resource, DEC_ID
+
+
+class Root(Resource):
+    """ Site root """
+
+
+@Root.mount('users')
+class Users(Resource):
+    """ Collection of users """
+
+
+@Users.mount_set(DEC_ID, metaname='user_id')
+class User(Resource):
+    """ User resource """
+
+
+@User.mount('posts')
+class Posts(Resource):
+    """ Collection of posts """
+
+
+@Posts.mount_set(DEC_ID, metaname='post_id')
+class Post(Resource):
+    """ Post resource """
+
+
+PATHS = [('users', str(i), 'posts', str(i * 10)) for i in range(10)]
+REQUESTS = 1000
+
+
+def traverse(root):
+    for path in PATHS:
+        resource = root
+        for name in path:
+            resource = resource[name]
+        resource.__route__
+
+
+def plain():
+    traverse(Root())
+
+
+def arena():
+    with Root.request_tree() as root:
+        traverse(root)
+
+
+def peak_memory(func):
+    """ Returns peak memory allocated during single request """
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    print('%-8s %14s %12s' % ('tree', 'peak bytes/req', 'us/req'))
+    for title, func in (('plain', plain), ('arena', arena)):
+        func()      # Warm up the pool
+        peaks = sorted(peak_memory(func) for i in range(REQUESTS))
+        duration = timeit.timeit(func, number=REQUESTS)
+        print('%-8s %14d %12.1f' % (
+            title,
+            peaks[len(peaks) // 2],
+            duration * 1e6 / REQUESTS,
+        ))
+
+
+if __name__ == '__main__':
+    main()
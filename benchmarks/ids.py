@@ -0,0 +1,46 @@
+"""
+Benchmark of stock ID matchers against the regular expressions
+they are described by.
+
+Usage::
+
+    $ python benchmarks/ids.py
+
+"""
+
+from __future__ import print_function
+
+import timeit
+
+from traversalkit.ids import ANY_ID, DEC_ID, HEX_ID, TEXT_ID, UUID_ID
+
+
+CASES = [
+    ('ANY_ID', ANY_ID, ['Jane Doe.1984', '']),
+    ('DEC_ID', DEC_ID, ['1984', 'john']),
+    ('HEX_ID', HEX_ID, ['2fa0c1', 'john']),
+    ('TEXT_ID', TEXT_ID, ['Jane_Doe-1984', 'Jane Doe.1984']),
+    ('UUID_ID', UUID_ID, ['6ba7b810-9dad-11d1-80b4-00c04fd430c8', 'john']),
+]
+NUMBER = 1000000
+
+
+def main():
+    print('%-8s %-40s %10s %10s' % ('ID', 'name', 'regex, ns', 'fast, ns'))
+    for title, id_, names in CASES:
+        for name in names:
+            regex = timeit.timeit(
+                lambda: id_.regex.match(name),
+                number=NUMBER,
+            )
+            fast = timeit.timeit(
+                lambda: id_.match(name),
+                number=NUMBER,
+            )
+            print('%-8s %-40r %10.1f %10.1f' % (
+                title, name, regex * 1e9 / NUMBER, fast * 1e9 / NUMBER,
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark of deep ``lineage()`` walks with weak and strong parent links.
+
+Usage::
+
+    $ python benchmarks/lineage.py
+
+"""
+
+from __future__ import print_function
+
+import timeit
+
+from traversalkit import Resource, DEC_ID
+
+
+DEPTH = 50
+NUMBER = 20000
+
+
+class WeakNode(Resource):
+    """ Recursive node with weak parent link """
+    __parentlink__ = 'weak'
+
+
+class StrongNode(Resource):
+    """ Recursive node with strong parent link """
+    __parentlink__ = 'strong'
+
+
+WeakNode.mount_set(DEC_ID, WeakNode)
+StrongNode.mount_set(DEC_ID, StrongNode)
+CLASSES = {'weak': WeakNode, 'strong': StrongNode}
+
+
+def tree(link):
+    root = resource = CLASSES[link]()
+    for i in range(DEPTH):
+        resource = resource[str(i)]
+    return root, resource
+
+
+def walk(resource):
+    for parent in resource.lineage():
+        pass
+
+
+def main():
+    print('depth %d' % DEPTH)
+    print('%-8s %12s %14s' % ('link', 'lineage, us', 'build, us'))
+    for link in ('weak', 'strong'):
+        root, leaf = tree(link)
+        assert len(list(leaf.lineage())) == DEPTH + 1
+        lineage = timeit.timeit(lambda: walk(leaf), number=NUMBER)
+        build = timeit.timeit(lambda: tree(link), number=NUMBER // 100)
+        print('%-8s %12.2f %14.1f' % (
+            link,
+            lineage * 1e6 / NUMBER,
+            build * 1e6 / (NUMBER // 100),
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+import pytest
+
+from traversalkit import Resource, DEC_ID
+from traversalkit.arena import Arena, Pool
+
+
+@pytest.fixture
+def resources():
+    class Root(Resource):
+        """ Root resource """
+
+    @Root.mount('users')
+    class Users(Resource):
+        """ Collection of users """
+
+    @Users.mount_set(DEC_ID, metaname='user_id')
+    class User(Resource):
+        """ User resource """
+
+        def on_init(self, payload):
+            self.payload = payload
+
+    return Root, Users, User
+
+
+def test_request_tree(resources):
+    Root, Users, User = resources
+    pool = Pool()
+
+    with Root.request_tree(pool=pool) as root:
+        user = root['users'].get('1', payload='John')
+        assert user.uri == '/users/1/'
+        assert user.payload == 'John'
+        assert root.__arena__ is user.__arena__
+        caches = {id(root.__cache__), id(root['users'].__cache__)}
+
+    assert user.__dict__ == {}
+    assert not root.__dict__
+    assert len(pool) == 5      # 3 resources and 2 caches
+
+    with Root.request_tree(pool=pool) as root:
+        users = root['users']
+        assert {id(root.__cache__), id(users.__cache__)} == caches
+        assert len(users.__cache__) == 0
+        assert users['2'] is user
+        assert user.uri == '/users/2/'
+        assert user.payload is None
+        assert len(pool) == 0
+
+    assert len(pool) == 5
+
+
+def test_pool_maxsize(resources):
+    Root, Users, User = resources
+    pool = Pool(maxsize=1)
+
+    with Root.request_tree(pool=pool) as root:
+        root['users']['1']
+        root['users']['2']
+
+    assert len(pool._resources[User]) == 1
+
+
+def test_release_on_error(resources):
+    Root, Users, User = resources
+    pool = Pool()
+
+    with pytest.raises(ValueError):
+        with Root.request_tree(pool=pool) as root:
+            root['users']
+            raise ValueError()
+
+    assert len(pool._resources[Users]) == 1
+
+
+def test_arena(resources):
+    Root, Users, User = resources
+    arena = Arena()
+    root = arena.create(Root)
+    assert root['users'].__arena__ is arena
+    assert len(arena.resources) == 2
+    arena.release()
+    assert arena.resources == []
@@ -0,0 +1,97 @@
+import pytest
+
+from traversalkit import Resource, DEC_ID
+from traversalkit.budget import Budget
+
+
+@pytest.fixture
+def root():
+    class Root(Resource):
+        """ Root resource """
+
+    @Root.mount('users')
+    class Users(Resource):
+        """ Collection of users """
+
+    @Users.mount_set(DEC_ID, metaname='user_id')
+    class User(Resource):
+        """ User resource """
+
+    @User.mount('posts')
+    class Posts(Resource):
+        """ Collection of posts """
+
+    @Posts.mount_set(DEC_ID, metaname='post_id')
+    class Post(Resource):
+        """ Post resource """
+
+    return Root()
+
+
+def test_budget(root):
+    budget = Budget(10).attach(root)
+    users = root['users']
+    for i in range(10):
+        root['users'][str(i)]['posts']['1']
+        root['users']['0']
+    assert budget.size <= 10
+    assert '0' in users.__cache__
+    assert root['users'] is users
+    assert len(list(budget.resources())) == budget.size
+    occupancy = budget.occupancy()
+    assert sum(occupancy.values()) == budget.size
+    assert occupancy['/users/'] == 1
+
+
+def test_budget_attach(root):
+    root['users']['1']['posts']['1']
+    root['users']['2']
+    budget = Budget(100).attach(root)
+    assert budget.size == 5
+    assert root['users']['1'].__budget__ is budget
+
+
+def test_budget_forgets_removed_resources(root):
+    budget = Budget(3).attach(root)
+    root['users']['1']['posts']
+    root.invalidate('/users/1/')
+    assert budget.size == 3
+    root['users']['2']
+    assert budget.size == 3
+    root['users']['3']
+    assert budget.size == 3
+    assert sorted(root['users'].__cache__) == ['2', '3']
+
+
+def test_budget_weigh(root):
+    budget = Budget(7, weigh=lambda resource: len(resource.__name__))
+    budget.attach(root)
+    root['users']['1']
+    assert budget.size == 6
+    root['users']['10']
+    assert budget.size == 7
+    assert list(root['users'].__cache__) == ['10']
+    assert budget.occupancy() == {'/users/': 5, '/users/{user_id}/': 2}
+
+
+def test_budget_fork(root):
+    Budget(3).attach(root)
+    users = root['users']
+    users['1']
+    users['2']
+    assert len(users.__cache__) == 2
+
+    for i in range(5):
+        fork = root.fork()
+        assert fork.__budget__ is None
+        for j in range(3):
+            fork['users'][str(10 + j)]
+        assert fork['users'].__budget__ is None
+    assert sorted(users.__cache__) == ['1', '2']
+    assert root['users'] is users
+
+    budget = Budget(2).attach(fork)
+    for j in range(3):
+        fork['users'][str(20 + j)]
+    assert budget.size <= 2
+    assert sorted(users.__cache__) == ['1', '2']
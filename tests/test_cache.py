@@ -1,4 +1,8 @@
-from traversalkit.cache import Cache
+import pytest
+
+from traversalkit.cache import (
+    Cache, ForkCache, RefreshAheadCache, LRU, TTL, Weak,
+)
 
 
 def test_cache():
@@ -27,3 +31,304 @@ def test_cache():
 
     cache['z'] = 3
     assert cache == {'x': 1, 'y': 2, 'z': 3}
+
+
+def test_cache_reset():
+    cache = Cache(x=1)
+    with cache.readonly():
+        cache.reset()
+        assert cache == {}
+        cache['x'] = 1
+        assert cache == {'x': 1}
+
+
+class ResourceMock(object):
+
+    def __init__(self, name, parent=None):
+        self.name = name
+        self.parent = parent
+
+    def fork(self, parent):
+        return ResourceMock(self.name, parent)
+
+
+def test_fork_cache():
+    owner = ResourceMock('owner')
+    template = Cache(x=ResourceMock('x'), y=ResourceMock('y'))
+    cache = ForkCache(template, owner)
+    assert sorted(cache) == ['x', 'y']
+    assert len(cache) == 2
+
+    x = cache['x']
+    assert x is not template['x']
+    assert x.parent is owner
+    assert cache.get('x') is x
+    assert cache.get('z') is None
+
+    cache['z'] = ResourceMock('z')
+    assert 'z' not in template
+    assert sorted(cache) == ['x', 'y', 'z']
+
+    del cache['y']
+    assert 'y' in template
+    assert 'y' not in cache
+    assert cache.get('y') is None
+    assert sorted(cache) == ['x', 'z']
+    with pytest.raises(KeyError):
+        del cache['y']
+
+    cache['y'] = template['y']
+    assert cache['y'] is template['y']
+
+    with cache.readonly():
+        del cache['y']
+        cache['w'] = 1
+    assert sorted(cache) == ['x', 'y', 'z']
+
+    cache.reset()
+    assert sorted(cache) == ['x', 'y']
+
+
+class SyncExecutor(object):
+
+    def submit(self, func, *args):
+        func(*args)
+
+
+def test_refresh_ahead_cache():
+    from traversalkit import Resource, DEC_ID
+
+    now = [0]
+    exists = set(['1', '2'])
+
+    class UsersCache(RefreshAheadCache):
+        soft_ttl = 10
+        hard_ttl = 20
+        executor = SyncExecutor()
+        clock = staticmethod(lambda: now[0])
+
+    class Users(Resource):
+        """ Collection of users """
+        __cacheclass__ = UsersCache
+
+    @Users.mount_set(DEC_ID)
+    class User(Resource):
+        """ User resource """
+        __not_exist__ = LookupError
+
+        def on_init(self, payload):
+            if self.__name__ not in exists:
+                raise LookupError()
+
+    users = Users()
+    user_1 = users['1']
+    user_2 = users['2']
+    now[0] = 5
+    assert users['1'] is user_1
+
+    now[0] = 10
+    exists.discard('2')
+    assert users.__cache__.get('1') is user_1   # Stale one, refreshed
+    assert users['1'] is not user_1
+    assert users.__cache__.get('2') is user_2   # Stale one, removed
+    assert '2' not in users.__cache__
+    assert len(users.__cache__) == 1
+
+    user_1 = users['1']
+    now[0] = 40
+    assert users.__cache__.get('1') is None
+    assert users['1'] is not user_1
+
+    user_1 = users['1']
+    now[0] = 50
+    users.__cache__.refresh()
+    assert users['1'] is not user_1
+
+    users.__cache__.reset()
+    assert len(users.__cache__) == 0
+
+
+def test_refresh_ahead_cache_in_thread():
+    import threading
+    from traversalkit import Resource, DEC_ID
+
+    now = [0]
+    refreshed = threading.Event()
+
+    class UsersCache(RefreshAheadCache):
+        clock = staticmethod(lambda: now[0])
+
+    class Users(Resource):
+        """ Collection of users """
+        __cacheclass__ = UsersCache
+
+    @Users.mount_set(DEC_ID)
+    class User(Resource):
+        """ User resource """
+
+        def on_init(self, payload):
+            if now[0]:
+                refreshed.set()
+
+    users = Users()
+    user = users['1']
+    now[0] = UsersCache.soft_ttl
+    assert users['1'] is user
+    assert refreshed.wait(5)
+
+
+def test_cache_put():
+    cache = Cache(x=1)
+    policy = LRU(2)
+    cache.put('y', 2, policy)
+    cache.put('z', 3, policy)
+    assert cache == {'x': 1, 'y': 2, 'z': 3}
+    assert cache['y'] == 2
+    assert cache.get('z') == 3
+    assert cache.get('w') is None
+    with pytest.raises(KeyError):
+        cache['w']
+
+    cache.put('w', 4, policy)
+    assert cache == {'x': 1, 'z': 3, 'w': 4}
+
+    del cache['z']
+    assert cache == {'x': 1, 'w': 4}
+    with pytest.raises(KeyError):
+        del cache['z']
+
+    with cache.readonly():
+        cache.put('y', 2, policy)
+    assert 'y' not in cache
+
+    cache.reset()
+    assert cache == {}
+
+
+def test_lru_store():
+    store = LRU(2).create()
+    store['x'] = 1
+    store['y'] = 2
+    assert store['x'] == 1
+    store['z'] = 3
+    assert sorted(store) == ['x', 'z']
+    del store['x']
+    assert len(store) == 1
+
+
+def test_ttl_store():
+    now = [0]
+    store = TTL(10).create()
+    store.clock = lambda: now[0]
+    store['x'] = 1
+    now[0] = 5
+    store['y'] = 2
+    assert store['x'] == 1
+    assert len(store) == 2
+    now[0] = 10
+    assert sorted(store) == ['y']
+    assert store.get('x') is None
+    del store['y']
+    assert len(store) == 0
+
+
+def test_weak_store():
+    class Value(object):
+        pass
+
+    store = Weak().create()
+    value = store['x'] = Value()
+    assert store['x'] is value
+    del value
+    assert 'x' not in store
+
+
+def test_policies_repr():
+    assert repr(LRU(10)) == 'LRU(maxsize=10)'
+    assert repr(TTL(60)) == 'TTL(ttl=60)'
+    assert repr(Weak()) == 'Weak()'
+
+
+def test_cache_peek():
+    import sys
+
+    class Value(object):
+        pass
+
+    now = [0]
+    lru, ttl, weak = LRU(2), TTL(10), Weak()
+    cache = Cache(x=1)
+    cache.put('y', 2, lru)
+    cache.put('z', 3, lru)
+    cache.put('t', 4, ttl)
+    cache._stores[ttl].clock = lambda: now[0]
+    cache.put('t', 4, ttl)
+    value = Value()
+    cache.put('w', value, weak)
+    empty = sys.getsizeof(Cache())
+    assert sys.getsizeof(cache) > empty
+
+    assert sorted(cache.peek(), key=id) == sorted([1, 2, 3, 4, value], key=id)
+    assert list(cache._stores[lru]) == ['y', 'z']
+    now[0] = 10
+    del value
+    assert sorted(cache.peek()) == [1, 2, 3]
+
+    template = Cache(x=object())
+    fork = ForkCache(template, Value())
+    fork['y'] = 1
+    assert list(fork.peek()) == [1]
+    assert sys.getsizeof(fork) > 0
+
+
+def test_frozen_cache():
+    from traversalkit.cache import FrozenCache
+
+    cache = FrozenCache([('x', 1)], y=2)
+    assert cache == {'x': 1, 'y': 2}
+    assert cache.get('x') == 1
+    assert sorted(cache.peek()) == [1, 2]
+    with pytest.raises(TypeError):
+        cache['z'] = 3
+    with pytest.raises(TypeError):
+        del cache['x']
+    with pytest.raises(TypeError):
+        cache.put('z', 3, LRU(1))
+    with pytest.raises(TypeError):
+        cache.reset()
+    with cache.readonly() as readonly:
+        assert readonly is cache
+    assert cache == {'x': 1, 'y': 2}
+
+
+def test_cache_getitem_override():
+    from traversalkit import Resource, DEC_ID
+
+    class ExpiringCache(Cache):
+
+        expired = False
+
+        def __getitem__(self, key):
+            if self.expired:
+                raise KeyError(key)
+            return super(ExpiringCache, self).__getitem__(key)
+
+    cache = ExpiringCache({'x': 1})
+    assert cache.get('x') == 1
+    cache.expired = True
+    assert cache.get('x') is None
+    assert cache.get('x', 2) == 2
+
+    class Users(Resource):
+        """ Collection of users """
+        __cacheclass__ = ExpiringCache
+
+    @Users.mount_set(DEC_ID, metaname='user_id')
+    class User(Resource):
+        """ User resource """
+
+    users = Users()
+    user = users['1']
+    assert users['1'] is user
+    users.__cache__.expired = True
+    assert users['1'] is not user
@@ -0,0 +1,123 @@
+import pytest
+
+from traversalkit import Resource, DEC_ID
+from traversalkit.columns import Columns
+
+
+def test_columns():
+    columns = Columns(['name', ('age', 'B')])
+    columns.extend([
+        ('1', {'name': 'John', 'age': 42}),
+        ('2', {'name': 'Jane', 'age': 24, 'extra': True}),
+    ])
+    assert len(columns) == 2
+    assert list(columns) == ['1', '2']
+    assert '1' in columns
+    assert '3' not in columns
+    assert columns.row('2') == {'name': 'Jane', 'age': 24}
+
+    columns.append('1', {'name': 'Jonh', 'age': 43})
+    assert len(columns) == 2
+    assert columns.row('1') == {'name': 'Jonh', 'age': 43}
+    assert list(columns.column('name')) == ['Jonh', 'Jane']
+    assert list(columns.select('age', 'name')) == [
+        ('1', 43, 'Jonh'),
+        ('2', 24, 'Jane'),
+    ]
+    assert list(columns.where('age', lambda age: age > 30)) == ['1']
+
+    columns.append('3', {'age': 1})
+    assert columns.row('3') == {'name': None, 'age': 1}
+
+    columns.clear()
+    assert len(columns) == 0
+    assert columns.row('1') is None
+    assert list(columns.column('age')) == []
+
+
+def test_resource_columns():
+    class Users(Resource):
+        """ Collection of users """
+
+        def on_init(self, payload):
+            self.columns('user_id').append('1', {'name': 'John'})
+
+    @Users.mount_set(DEC_ID, metaname='user_id', columns=['name'])
+    class User(Resource):
+        """ User resource """
+
+        def on_init(self, payload):
+            self.payload = payload
+
+    @User.mount('profile')
+    class Profile(Resource):
+        """ User profile """
+
+    users = Users()
+    assert users['1'].payload == {'name': 'John'}
+    assert users['2'].payload is None
+    assert users.get('3', {'name': 'Jane'}).payload == {'name': 'Jane'}
+
+    with pytest.raises(KeyError):
+        users.columns('nonexistent')
+    with pytest.raises(KeyError):
+        users['1'].columns('profile')
+
+
+def test_columns_failed_append():
+    columns = Columns(['name', ('age', 'B'), 'email'])
+    columns.append('1', {'name': 'John', 'age': 42, 'email': 'john@'})
+    columns.append('2', {'name': 'Jane', 'age': 7})
+
+    with pytest.raises(TypeError):
+        columns.append('3', {'name': 'Jack'})
+    with pytest.raises(OverflowError):
+        columns.append('3', {'name': 'Jack', 'age': 1000})
+    assert len(columns) == 2
+    assert columns.row('3') is None
+    assert [len(columns.column(field)) for field in columns.fields] == \
+        [2, 2, 2]
+
+    with pytest.raises(TypeError):
+        columns.append('1', {'name': 'Jonh', 'email': 'jonh@'})
+    assert columns.row('1') == {'name': 'John', 'age': 42, 'email': 'john@'}
+
+    columns.append('3', {'name': 'Jack', 'age': 3})
+    assert columns.row('3') == {'name': 'Jack', 'age': 3, 'email': None}
+    assert columns.row('2') == {'name': 'Jane', 'age': 7, 'email': None}
+
+
+def test_columns_copy():
+    columns = Columns(['name', ('age', 'B')])
+    columns.append('1', {'name': 'John', 'age': 42})
+    copy = columns.copy()
+    copy.append('2', {'name': 'Jane', 'age': 24})
+    copy.append('1', {'name': 'Jonh', 'age': 43})
+    assert list(columns) == ['1']
+    assert columns.row('1') == {'name': 'John', 'age': 42}
+    assert list(copy) == ['1', '2']
+    assert copy.row('1') == {'name': 'Jonh', 'age': 43}
+
+
+def test_fork_columns():
+    class Users(Resource):
+        """ Collection of users """
+
+        def on_init(self, payload):
+            self.columns('user_id').append('1', {'name': 'John'})
+
+    @Users.mount_set(DEC_ID, metaname='user_id', columns=['name'])
+    class User(Resource):
+        """ User resource """
+
+        def on_init(self, payload):
+            self.payload = payload
+
+    template = Users()
+    fork = template.fork()
+    assert fork.columns('user_id') is not template.columns('user_id')
+    fork.columns('user_id').append('2', {'name': 'Jane'})
+    assert fork['2'].payload == {'name': 'Jane'}
+    assert fork['1'].payload == {'name': 'John'}
+    assert list(template.columns('user_id')) == ['1']
+    assert template['2'].payload is None
@@ -1,4 +1,6 @@
-from traversalkit.condition import Under, Recursion
+from traversalkit.condition import (
+    Condition, Under, Recursion, Not, AdaptiveAnd, AdaptiveOr, adaptive,
+)
 
 
 class A(object):
@@ -57,3 +59,47 @@ def test_repr():
         "And(Under(<class A>, 'a'), Recursion(maxdepth=1)))"
     repr(Under(A) | Recursion(maxdepth=1)) == \
         "Or(Under(<class A>, 'a'), Recursion(maxdepth=1)))"
+
+
+class Counter(Condition):
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    def __call__(self, route):
+        self.calls += 1
+        return self.result
+
+
+def test_adaptive():
+    always, never = Counter(True), Counter(False)
+    condition = adaptive(always & Under(A) & never, period=2)
+    assert isinstance(condition, AdaptiveAnd)
+    route = [NodeMock(A, 'a')]
+    assert condition(route) is False
+    assert condition(route) is False
+    assert [s['condition'] for s in condition.stats()][0] is never
+    assert condition(route) is False
+    assert always.calls == 2
+    assert never.calls == 3
+    assert [s['calls'] for s in condition.stats()] == [3, 2, 2]
+    assert [s['passes'] for s in condition.stats()] == [0, 2, 2]
+    assert condition.commutative is False
+
+    condition = adaptive(never | (always & Under(A)) | ~Recursion(1), 1)
+    assert isinstance(condition, AdaptiveOr)
+    assert len(condition.operands) == 3
+    assert isinstance(condition.operands[1].condition, AdaptiveAnd)
+    assert isinstance(condition.operands[2].condition, Not)
+    assert condition(route) is True
+    assert condition.operands[0].condition.__class__ is Not
+    assert condition(route) is True
+    assert condition.operands[2].condition is never
+    assert never.calls == 4
+
+    condition = adaptive(Under(A) & Recursion(1))
+    assert condition.commutative is True
+    assert repr(condition) == \
+        'AdaptiveAnd(%r, Recursion(maxdepth=1))' % Under(A)
+    assert adaptive(always) is always
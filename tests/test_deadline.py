@@ -0,0 +1,66 @@
+import pytest
+
+from traversalkit import Resource, DEC_ID, TraversalTimeout
+from traversalkit import deadline as module
+from traversalkit.deadline import deadline, remaining
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(module, 'clock', lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def tree(clock):
+
+    class Root(Resource):
+        """ Root resource """
+
+    @Root.mount_set(DEC_ID)
+    class Slow(Resource):
+        """ Resource, which takes a second to initialize """
+
+        def on_init(self, payload):
+            self.budget = remaining()
+            clock[0] += 1
+
+    Slow.mount_set(DEC_ID, Slow)
+    return Root
+
+
+def test_deadline(tree, clock):
+    root = tree()
+    assert remaining() is None
+    with deadline(1.5):
+        assert remaining() == 1.5
+        assert root['1']['2'].budget == 0.5
+        with pytest.raises(TraversalTimeout) as info:
+            root['1']['2']['3']
+        assert info.value.name == '3'
+        assert info.value.resource is root['1']['2']
+        assert info.value.args == ('3', '/1/2/')
+        assert remaining() == 0
+    assert remaining() is None
+    assert root['1']['2']['3'].budget is None
+
+
+def test_deadline_nested(clock):
+    with deadline(2):
+        with deadline(5):
+            assert remaining() == 2
+        with deadline(1):
+            assert remaining() == 1
+        assert remaining() == 2
+    assert remaining() is None
+
+
+def test_deadline_lookup(tree, clock):
+    root = tree()
+    with deadline(0):
+        with pytest.raises(TraversalTimeout):
+            root.lookup('1')
+        with pytest.raises(TraversalTimeout):
+            root.find('1')
+        assert root.lookup('x').reason == 'no_route'
@@ -1,4 +1,12 @@
-from traversalkit.ids import ANY_ID, DEC_ID, HEX_ID, TEXT_ID
+# -*- coding: utf-8 -*-
+import re
+
+import pytest
+
+from traversalkit.ids import (
+    ANY_ID, DEC_ID, HEX_ID, TEXT_ID, UUID_ID,
+    Matcher, Predicate, matcher,
+)
 
 
 def test_any_id():
@@ -9,13 +17,59 @@ def test_any_id():
 def test_text_id():
     assert TEXT_ID.match('Jane_Doe-1984')
     assert not TEXT_ID.match('Jane Doe.1984')
+    assert not TEXT_ID.match('')
 
 
 def test_dec_id():
     assert DEC_ID.match('42')
     assert not DEC_ID.match('2A')
+    assert not DEC_ID.match('')
 
 
 def test_hex_id():
     assert HEX_ID.match('2Af')
     assert not HEX_ID.match('2h')
+
+
+def test_uuid_id():
+    assert UUID_ID.match('6ba7b810-9dad-11d1-80b4-00c04fd430c8')
+    assert UUID_ID.match('6BA7B810-9DAD-11D1-80B4-00C04FD430C8')
+    assert not UUID_ID.match('6ba7b810-9dad-11d1-80b4-00c04fd430cx')
+    assert not UUID_ID.match('6ba7b8109dad11d180b400c04fd430c8')
+    assert not UUID_ID.match('6ba7b810-9dad-11d1-80b4-00c04fd430c8a')
+
+
+def test_stock_ids_comply_regex():
+    names = [
+        '', '42', '2A', '2Af', '2h', 'Jane_Doe-1984', 'Jane Doe.1984',
+        '42\n', '4\n2', u'٤٢', u'²', u'Жанна', '-', '_',
+        '6ba7b810-9dad-11d1-80b4-00c04fd430c8',
+        '6ba7b810-9dad-11d1-80b4-00c04fd430c8\n',
+        '6ba7b810-9dad-11d1-80b4-00c04fd430-8',
+        u'6ba7b810-9dad-11d1-80b4-00c04fd430c٤',
+    ]
+    for id_ in (ANY_ID, DEC_ID, HEX_ID, TEXT_ID, UUID_ID):
+        for name in names:
+            assert bool(id_.match(name)) is bool(id_.regex.match(name)), \
+                (id_, name)
+
+
+def test_matcher():
+    assert matcher(DEC_ID) is DEC_ID
+
+    regex = re.compile(r'^\d+$')
+    assert matcher(regex) is regex
+
+    m = matcher(r'^\d+$')
+    assert isinstance(m, Matcher)
+    assert m.pattern == r'^\d+$'
+    assert m.match('42') is True
+
+    m = matcher(str.isdigit)
+    assert isinstance(m, Predicate)
+    assert m.pattern == 'isdigit'
+    assert m.match('42') is True
+    assert m.match('2A') is False
+
+    with pytest.raises(TypeError):
+        matcher(42)
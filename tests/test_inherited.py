@@ -0,0 +1,134 @@
+from traversalkit import Resource, DEC_ID, inherited
+
+
+class Base(Resource):
+    """ Base resource """
+    tenant = inherited('tenant_id')
+    acl = inherited('__acl__', default=(),
+                    merge=lambda own, parent: tuple(own) + parent)
+
+
+class Root(Base):
+    """ Root resource """
+    __acl__ = ['admin']
+
+
+@Root.mount_set(DEC_ID, metaname='tenant_id')
+class Tenant(Base):
+    """ Tenant resource """
+
+    def on_init(self, payload):
+        self.tenant_id = self.__name__
+
+
+@Tenant.mount('users')
+class Users(Base):
+    """ Collection of users """
+    __acl__ = ['manager']
+
+
+@Users.mount_set(DEC_ID, metaname='user_id')
+class User(Resource):
+    """ User resource, which does not declare inherited attributes """
+
+
+def test_inherited():
+    root = Root()
+    users = root['1']['users']
+    assert root.tenant is None
+    assert users.tenant == '1'
+    assert root['2']['users'].tenant == '2'
+    assert users.acl == ('manager', 'admin')
+    assert Base.acl.__get__(users['3']) == ('manager', 'admin')
+
+
+def test_inherited_cache():
+    calls = []
+
+    def merge(own, parent):
+        calls.append(own)
+        return parent + own
+
+    class Node(Resource):
+        """ Node """
+        path = inherited('segment', default='', merge=merge)
+
+        def on_init(self, payload):
+            if self.__name__:
+                self.segment = '/' + self.__name__
+
+    Node.mount_set(DEC_ID)(Node)
+
+    root = Node()
+    node = root['1']['2']
+    assert node.path == '/1/2'
+    assert len(calls) == 2
+    assert node.path == '/1/2'
+    assert root['1']['3'].path == '/1/3'
+    assert len(calls) == 3
+
+
+def test_inherited_invalidation():
+    root = Root()
+    users = root['1']['users']
+    assert users.acl == ('manager', 'admin')
+
+    root.acl = ['root']
+    assert root.__acl__ == ['root']
+    assert users.acl == ('manager', 'root')
+
+    root.__acl__ = ['admin']
+    assert users.acl == ('manager', 'root')
+    Base.acl.invalidate()
+    assert users.acl == ('manager', 'admin')
+
+
+def test_inherited_scoped_invalidation():
+    calls = []
+
+    def merge(own, parent):
+        calls.append(own)
+        return parent + own
+
+    class Node(Resource):
+        """ Node """
+        path = inherited('segment', default='', merge=merge)
+
+        def on_init(self, payload):
+            if self.__name__:
+                self.segment = '/' + self.__name__
+
+    Node.mount_set(DEC_ID)(Node)
+
+    root = Node()
+    other = Node()
+    node = root['1']['2']
+    sibling = root['3']['4']
+    assert node.path == '/1/2'
+    assert sibling.path == '/3/4'
+    assert other['5'].path == '/5'
+    del calls[:]
+
+    root['1'].path = '/one'
+    assert node.path == '/one/2'
+    assert sibling.path == '/3/4'
+    assert other['5'].path == '/5'
+    assert calls == ['/one', '/2']
+
+    del calls[:]
+    root['3'].segment = '/three'
+    assert sibling.path == '/3/4'
+    Node.path.invalidate(root['3'])
+    assert sibling.path == '/three/4'
+    assert node.path == '/one/2'
+    assert calls == ['/three', '/4']
+
+
+def test_inherited_fork():
+    root = Root()
+    tenant = root['1']
+    assert tenant['users'].tenant == '1'
+    clone = tenant.fork()
+    clone.tenant_id = '2'
+    assert clone['users'].tenant == '2'
+    assert tenant['users'].tenant == '1'
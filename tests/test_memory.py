@@ -0,0 +1,172 @@
+"""
+Memory footprint regression tests.
+
+Footprints are measured by tracemalloc and compared against baseline
+stored in ``tests/memory.json`` per interpreter.  The test fails, if
+footprint grows more than ``TRAVERSALKIT_MEMORY_TOLERANCE`` percent
+(10 by default).  To record the baseline of the current interpreter,
+run the tests with ``TRAVERSALKIT_MEMORY_UPDATE=1``.  Interpreters
+without a baseline only measure footprints and emit
+:class:`MemoryBaselineWarning`, so the missing baseline is visible
+in the test summary.
+
+"""
+
+import gc
+import json
+import os
+import platform
+import sys
+import warnings
+
+import pytest
+
+from traversalkit import Resource, DEC_ID
+from traversalkit.condition import Recursion
+from traversalkit.route import Node, Route, RouteRegistry
+
+tracemalloc = pytest.importorskip('tracemalloc')
+
+
+BASELINE = os.path.join(os.path.dirname(__file__), 'memory.json')
+TOLERANCE = float(os.environ.get('TRAVERSALKIT_MEMORY_TOLERANCE', 10))
+UPDATE = bool(os.environ.get('TRAVERSALKIT_MEMORY_UPDATE'))
+INTERPRETER = '%s-%s.%s' % (
+    platform.python_implementation().lower(),
+    sys.version_info[0],
+    sys.version_info[1],
+)
+COUNT = 1000
+
+
+class MemoryBaselineWarning(UserWarning):
+    """ There is no memory baseline for the current interpreter """
+
+
+class Users(Resource):
+    """ Wide collection """
+
+
+@Users.mount_set(DEC_ID, metaname='user_id')
+class User(Resource):
+    """ Cached child resource """
+
+
+@Users.mount('streamed')
+class Streamed(Resource):
+    """ Collection of uncached resources """
+
+
+Streamed.mount_set(DEC_ID, User, metaname='user_id', cache=False)
+
+
+class Categories(Resource):
+    """ Deep recursive tree """
+
+
+@Categories.mount_set(DEC_ID, metaname='category_id')
+class Category(Resource):
+    """ Category resource """
+
+
+Category.mount('categories', Categories, complies=Recursion(COUNT))
+
+
+def resources(keep):
+    users = Users()
+    streamed = users['streamed']
+    for i in range(len(keep)):
+        keep[i] = streamed[str(i)]
+        keep[i].__route__
+
+
+def cached_children(keep):
+    users = Users()
+    keep[0] = users
+    for i in range(len(keep)):
+        users[str(i)].__route__
+
+
+def recursion(keep):
+    resource = keep[0] = Categories()
+    for i in range(len(keep) // 2):
+        resource = resource[str(i)]['categories']
+        resource.__route__
+
+
+def routes(keep):
+    registry = RouteRegistry()
+    route = registry.intern(Route(Node(Users, name='')))
+    for i in range(len(keep)):
+        node = Node(User, name=str(i))
+        node.mounted = True
+        keep[i] = registry.child(route, node)
+    keep[0] = registry
+
+
+SCENARIOS = {
+    'resource': resources,
+    'cached_child': cached_children,
+    'recursion': recursion,
+    'route': routes,
+}
+
+
+def measure(scenario):
+    scenario([None] * 10)   # Warm up class-level caches
+    keep = [None] * COUNT
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        scenario(keep)
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    stats = after.filter_traces(filters).compare_to(
+        before.filter_traces(filters), 'filename',
+    )
+    return {
+        'bytes': float(sum(s.size_diff for s in stats)) / COUNT,
+        'objects': float(sum(s.count_diff for s in stats)) / COUNT,
+    }
+
+
+def load_baseline():
+    if not os.path.exists(BASELINE):
+        return {}
+    with open(BASELINE) as f:
+        return json.load(f)
+
+
+def save_baseline(name, result):
+    baseline = load_baseline()
+    baseline.setdefault(INTERPRETER, {})[name] = dict(
+        (key, round(value, 1)) for key, value in result.items()
+    )
+    with open(BASELINE, 'w') as f:
+        json.dump(baseline, f, indent=4, sort_keys=True)
+        f.write('\n')
+
+
+@pytest.mark.parametrize('name', sorted(SCENARIOS))
+def test_memory(name):
+    result = measure(SCENARIOS[name])
+    if UPDATE:
+        save_baseline(name, result)
+        return
+    expected = load_baseline().get(INTERPRETER, {}).get(name)
+    if expected is None:
+        warnings.warn(
+            'No memory baseline of %s for %s: %r. Record it with '
+            'TRAVERSALKIT_MEMORY_UPDATE=1' % (name, INTERPRETER, result),
+            MemoryBaselineWarning,
+        )
+        return
+    for key, value in result.items():
+        limit = expected[key] * (1 + TOLERANCE / 100)
+        assert value <= limit, '%s per %s: %.1f, baseline %.1f' % (
+            key, name, value, expected[key],
+        )
@@ -0,0 +1,94 @@
+import logging
+
+import pytest
+
+from traversalkit import Resource, DEC_ID
+from traversalkit.metrics import Histogram, Metrics
+
+
+@pytest.fixture
+def tree():
+
+    class Root(Resource):
+        """ Root resource """
+
+    @Root.mount_set(DEC_ID, metaname='user_id')
+    class User(Resource):
+        """ User resource """
+        __not_exist__ = LookupError
+
+        def on_init(self, payload):
+            if self.__name__ == '0':
+                raise LookupError(self.__name__)
+
+    @User.mount('posts')
+    class Posts(Resource):
+        """ Collection of posts """
+
+    return Root
+
+
+def test_histogram():
+    histogram = Histogram([1, 2])
+    for value in (0.5, 1, 1.5, 2, 3):
+        histogram.observe(value)
+    assert histogram.counts == [2, 2, 1]
+    assert histogram.sum == 8.0
+    assert histogram.cumulative() == [(1, 2), (2, 4), (float('inf'), 5)]
+
+
+def test_metrics(tree):
+    metrics = Metrics(buckets=[1, 2])
+    ticks = iter(range(100))
+    metrics.clock = lambda: next(ticks)
+    root = metrics.attach(tree())
+    assert metrics.resolve(root, '/1/posts/') is root['1']['posts']
+    assert root['1'].__metrics__ is metrics
+    assert root.find('0') is None
+    root['2']
+
+    create = metrics.histograms('create')
+    assert sorted(create) == ['/{user_id}/', '/{user_id}/posts/']
+    assert create['/{user_id}/'].count == 2
+    assert create['/{user_id}/posts/'].count == 1
+    resolve = metrics.histograms('resolve')
+    assert sorted(resolve) == ['/{user_id}/posts/']
+    assert resolve['/{user_id}/posts/'].counts == [0, 0, 1]
+
+    with pytest.raises(KeyError):
+        metrics.resolve(root, '/1/comments/')
+
+    text = metrics.export(prefix='app')
+    assert '# TYPE app_create_seconds histogram' in text
+    assert 'app_create_seconds_count{route="/{user_id}/"} 2' in text
+    assert 'app_resolve_seconds_bucket{route="/{user_id}/posts/",' \
+           'le="+Inf"} 1' in text
+    assert 'app_resolve_seconds_sum{route="/{user_id}/posts/"} ' in text
+
+
+def test_slow_log(tree, caplog):
+    metrics = Metrics(slow=1.0, maxlog=1)
+    now = [0.0]
+
+    def clock():
+        now[0] += 0.2
+        return now[0]
+
+    metrics.clock = clock
+    root = metrics.attach(tree())
+    with caplog.at_level(logging.WARNING, logger='traversalkit.metrics'):
+        metrics.resolve(root, '/1/')
+        metrics.resolve(root, '/2/posts/')
+        metrics.resolve(root, '/3/posts/')
+    assert len(metrics.slow_log) == 1
+    entry = metrics.slow_log[0]
+    assert entry['path'] == '/3/posts/'
+    assert [uri for uri, _ in entry['levels']] == \
+        ['/{user_id}/', '/{user_id}/posts/']
+    assert len(caplog.records) == 2
+    assert 'Slow traversal /3/posts/' in caplog.records[-1].getMessage()
+
+
+def test_metrics_disabled(tree):
+    root = tree()
+    assert root['1'].__metrics__ is None
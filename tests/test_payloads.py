@@ -0,0 +1,233 @@
+import pickle
+
+import pytest
+
+from traversalkit import Resource, DEC_ID, TraversalTimeout
+from traversalkit.cache import RefreshAheadCache
+from traversalkit.deadline import deadline
+from traversalkit.payloads import PayloadCache, MemoryBackend, SQLiteBackend
+
+
+class Clock(object):
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def backend(request, tmpdir, clock):
+    if request.param == 'memory':
+        result = MemoryBackend()
+    else:
+        result = SQLiteBackend(str(tmpdir.join('payloads.db')))
+    result.clock = clock
+    yield result
+    if request.param == 'sqlite':
+        result.close()
+
+
+def test_backend(backend, clock):
+    assert backend.get('a') is None
+    backend.set('a', {'x': 1}, 10)
+    backend.set('b', [1, 2], 20)
+    assert backend.get('a') == {'x': 1}
+    assert backend.get('b') == [1, 2]
+
+    clock.now += 15
+    assert backend.get('a') is None
+    assert backend.get('b') == [1, 2]
+
+    backend.set('a', 'replaced', 10)
+    assert backend.get('a') == 'replaced'
+
+    clock.now += 10
+    backend.purge()
+    assert backend.get('a') is None
+    assert backend.get('b') is None
+
+    backend.set('c', 1, 10)
+    backend.clear()
+    assert backend.get('c') is None
+
+
+def test_sqlite_backend_shared(tmpdir):
+    path = str(tmpdir.join('payloads.db'))
+    writer = SQLiteBackend(path)
+    reader = SQLiteBackend(path)
+    writer.set('key', {'name': 'John'}, 60)
+    assert reader.get('key') == {'name': 'John'}
+    row = reader._connection().execute(
+        'SELECT value FROM payloads WHERE key = ?', ('key',),
+    ).fetchone()
+    assert pickle.loads(bytes(row[0])) == {'name': 'John'}
+    assert reader._connection().execute(
+        'PRAGMA journal_mode',
+    ).fetchone()[0] == 'wal'
+    writer.close()
+    reader.close()
+
+
+@pytest.fixture
+def tree():
+    calls = []
+
+    def fetch_user(parent, name):
+        calls.append((parent.uri, name))
+        if name == '0':
+            return None
+        return {'name': 'User %s' % name}
+
+    def fetch_post(parent, name):
+        calls.append((parent.uri, name))
+        return {'title': 'Post %s' % name}
+
+    class Users(Resource):
+        """ Collection of users """
+
+    class User(Resource):
+        """ User resource """
+
+        def on_init(self, payload):
+            self.payload = payload
+
+    class Posts(Resource):
+        """ Collection of posts """
+
+    class Post(Resource):
+        """ Post resource """
+
+        def on_init(self, payload):
+            self.payload = payload
+
+    backend = MemoryBackend()
+    users = PayloadCache(fetch_user, backend, ttl=60)
+    posts = PayloadCache(fetch_post, backend, ttl=60)
+    Users.mount_set(DEC_ID, User, metaname='user_id', payloads=users)
+    User.mount('posts', Posts)
+    Posts.mount_set(DEC_ID, Post, metaname='post_id', payloads=posts)
+    return Users, users, posts, calls
+
+
+def test_cache(tree):
+    Users, users, posts, calls = tree
+
+    assert Users()['1'].payload == {'name': 'User 1'}
+    assert Users()['1'].payload == {'name': 'User 1'}
+    assert Users()['2'].payload == {'name': 'User 2'}
+    assert calls == [('/', '1'), ('/', '2')]
+
+    for user_id in '121':
+        root = Users()
+        assert root[user_id]['posts']['3'].payload == {'title': 'Post 3'}
+    assert calls[2:] == [('/1/posts/', '3'), ('/2/posts/', '3')]
+
+    # ``None`` payloads are not cached
+    assert Users()['0'].payload is None
+    assert Users()['0'].payload is None
+    assert calls[4:] == [('/', '0'), ('/', '0')]
+
+    # Explicit payloads bypass the cache
+    assert Users().get('5', {'name': 'Explicit'}).payload == \
+        {'name': 'Explicit'}
+    assert len(calls) == 6
+
+
+def test_stats(tree):
+    Users, users, posts, calls = tree
+
+    assert users.stats() == {
+        'hits': 0, 'misses': 0, 'hit_rate': None, 'routes': {},
+    }
+    for user_id in '1121':
+        root = Users()
+        root[user_id]['posts']['3']
+    assert users.stats() == {
+        'hits': 2,
+        'misses': 2,
+        'hit_rate': 0.5,
+        'routes': {
+            '/{user_id}/': {'hits': 2, 'misses': 2, 'hit_rate': 0.5},
+        },
+    }
+    assert posts.stats() == {
+        'hits': 2,
+        'misses': 2,
+        'hit_rate': 0.5,
+        'routes': {
+            '/{user_id}/posts/{post_id}/': {
+                'hits': 2, 'misses': 2, 'hit_rate': 0.5,
+            },
+        },
+    }
+
+
+def test_version_and_ttl(tree, clock):
+    Users, users, posts, calls = tree
+    users.backend.clock = clock
+
+    Users()['1']
+    Users()['1']
+    assert len(calls) == 1
+
+    users.version = 2
+    Users()['1']
+    assert len(calls) == 2
+
+    clock.now += 61
+    Users()['1']
+    assert len(calls) == 3
+
+
+def test_key():
+    cache = PayloadCache(lambda parent, name: None, version='v1')
+    assert isinstance(cache.backend, MemoryBackend)
+    assert cache.key('/{user_id}/', '1') == 'v1:/{user_id}/:1'
+
+
+def test_load_after_checks(tree):
+    Users, users, posts, calls = tree
+
+    with deadline(0):
+        with pytest.raises(TraversalTimeout):
+            Users()['1']
+    assert calls == []
+
+    class Items(Resource):
+        """ Collection with converter """
+
+    class Item(Resource):
+        """ Item resource """
+
+    Items.mount_set(DEC_ID, Item, converter=lambda name: int(name, 8),
+                    payloads=users)
+    assert Items().find('9') is None
+    assert calls == []
+    Items()['7']
+    assert calls == [('/', '7')]
+
+
+def test_refresh_ahead(tree):
+    Users, users, posts, calls = tree
+    now = [0]
+
+    class UsersCache(RefreshAheadCache):
+        clock = staticmethod(lambda: now[0])
+
+    Users.__cacheclass__ = UsersCache
+    root = Users()
+    user = root['1']
+    assert user.payload == {'name': 'User 1'}
+
+    now[0] = UsersCache.soft_ttl
+    root.__cache__.refresh()
+    assert root['1'] is not user
+    assert root['1'].payload == {'name': 'User 1'}
+    assert calls == [('/', '1')]
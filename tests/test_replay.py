@@ -0,0 +1,148 @@
+import io
+
+import pytest
+
+from traversalkit import Resource, DEC_ID, UUID_ID
+from traversalkit.cache import Cache
+from traversalkit.replay import (
+    Zipf, load_paths, synthesize, percentile, replay, format_report, main,
+    tracemalloc,
+)
+
+
+class Root(Resource):
+    """ Root resource """
+
+
+@Root.mount('users')
+class Users(Resource):
+    """ Collection of users """
+
+
+@Users.mount_set(DEC_ID, metaname='user_id')
+class User(Resource):
+    """ User resource """
+
+
+@Root.mount('sessions')
+class Sessions(Resource):
+    """ Collection of sessions """
+
+
+@Sessions.mount_set(UUID_ID, metaname='session_id')
+class Session(Resource):
+    """ Session resource """
+
+
+class Nothing(Resource):
+    """ Resource without routes """
+
+
+def test_load_paths():
+    lines = [
+        '/users/1/\n',
+        '\n',
+        '# comment\n',
+        '127.0.0.1 - - [10/Oct/2000:13:55:36 -0700] '
+        '"GET /users/2/?x=1 HTTP/1.0" 200 2326\n',
+    ]
+    assert load_paths(lines) == ['/users/1/', '/users/2/']
+
+
+def test_zipf():
+    class Rand(object):
+        value = 0.0
+
+        def random(self):
+            return self.value
+
+    rand = Rand()
+    zipf = Zipf(3, skew=1.0, rand=rand)
+    assert zipf() == 1
+    rand.value = 0.99
+    assert zipf() == 3
+    assert Zipf(3, skew=0).cumulative == [1.0, 2.0, 3.0]
+
+
+def test_synthesize():
+    paths = synthesize(Root, 200, ids=5, seed=1)
+    assert len(paths) == 200
+    assert paths == synthesize(Root, 200, ids=5, seed=1)
+    assert set(paths) <= set(
+        ['/users/', '/sessions/'] +
+        ['/users/%s/' % i for i in range(1, 6)] +
+        ['/sessions/00000000-0000-0000-0000-00000000000%s/' % i
+         for i in range(1, 6)]
+    )
+    with pytest.raises(ValueError):
+        synthesize(Nothing, 10)
+
+
+def test_percentile():
+    assert percentile([], 50) is None
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+    assert percentile(values, 0) == 1
+
+
+def test_replay():
+    paths = ['/users/1/', '/users/1/', '/groups/', '/users/2/']
+    report = replay(Root, paths)
+    assert report['requests'] == 4
+    assert report['misses'] == 1
+    assert report['hit_ratio'] == 0
+    assert report['latency']['p50'] <= report['latency']['max']
+    assert report['peak_memory'] is None
+
+    report = replay(Root, paths, shared=True, memory=True)
+    assert report['requests'] == 4
+    assert report['hit_ratio'] == 3.0 / 7
+    if tracemalloc is not None:
+        assert report['peak_memory'] > 0
+    else:
+        assert report['peak_memory'] is None
+    assert 'Requests:    4 (1 misses)' in format_report(report)
+
+    report = replay(Root, paths * 100, concurrency=4, shared=True)
+    assert report['requests'] == 400
+    assert report['misses'] == 100
+
+
+def test_replay_single_lookup():
+    lookups = []
+
+    class CountingCache(Cache):
+
+        def get(self, key, default=None):
+            lookups.append(key)
+            return super(CountingCache, self).get(key, default)
+
+    class Counted(Resource):
+        """ Root resource with counting cache """
+        __cacheclass__ = CountingCache
+
+    @Counted.mount('users')
+    class CountedUsers(Resource):
+        """ Collection of users """
+
+    report = replay(Counted, ['/users/', '/users/', '/groups/'], shared=True)
+    assert report['hit_ratio'] == 1.0 / 3
+    assert lookups == ['users', 'users', 'groups']
+
+
+def test_main(tmpdir):
+    path = tmpdir.join('paths.log')
+    path.write('/users/1/\n/users/2/\n')
+    stdout = io.StringIO() if str is not bytes else io.BytesIO()
+    report = main(['tests.test_replay:Root', str(path)], stdout=stdout)
+    assert report['requests'] == 2
+    assert 'Throughput:' in stdout.getvalue()
+
+    report = main(['tests.test_replay:Root', '--synthesize', '10'],
+                  stdout=stdout)
+    assert report['requests'] == 10
+
+    with pytest.raises(SystemExit):
+        main(['tests.test_replay:Root'], stdout=stdout)
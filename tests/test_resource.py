@@ -1,8 +1,9 @@
+import gc
 import re
 
 import pytest
 
-from traversalkit import Resource, ANY_ID, TEXT_ID, condition
+from traversalkit import Resource, Miss, ANY_ID, DEC_ID, TEXT_ID, condition
 
 
 @pytest.fixture
@@ -236,3 +237,390 @@ def test_ignoring_not_exist(resources):
 def test_error_propagation(root):
     with pytest.raises(Exception):
         root['error']
+
+
+def test_prefetch(root):
+    result = root.prefetch([
+        '/',
+        '/user/john/',
+        'user/john/blog',
+        '/user/jane/',
+        '/group/1/',
+        '/blog/1/',
+    ])
+    assert result['/'] is root
+    assert result['/user/john/'] is root['user']['john']
+    assert result['user/john/blog'] is root['user']['john']['blog']
+    assert result['/user/jane/'] is root['user']['jane']
+    assert result['/group/1/'].reason == Miss.NO_ROUTE
+    assert result['/group/1/'].error().args == ('group', '/')
+    assert result['/blog/1/'].reason == Miss.NO_ROUTE
+    assert result['/blog/1/'].error().args == ('1', '/blog/')
+
+
+def test_prefetch_with_executor():
+    from concurrent.futures import ThreadPoolExecutor
+
+    created = []
+
+    class Root(Resource):
+        """ Root resource """
+
+    @Root.mount('user')
+    class Users(Resource):
+        """ Collection of users """
+
+        def on_init(self, payload):
+            created.append(self.__name__)
+
+    @Users.mount_set(TEXT_ID)
+    class User(Resource):
+        """ User resource """
+
+        def on_init(self, payload):
+            created.append(self.__name__)
+
+    root = Root()
+    paths = ['/user/%s/' % i for i in range(10)]
+    with ThreadPoolExecutor(4) as executor:
+        result = root.prefetch(paths, executor=executor)
+    assert created.count('user') == 1
+    assert len(created) == 11
+    assert [result[path].uri for path in paths] == paths
+
+
+def test_named_node_without_cache(root):
+    blog = root['user']['john']['blog']
+    with blog.node('post_id') as add_child:
+        post_1 = add_child('1-post_1', cache=False)
+        post_2 = add_child('2-post_2')
+
+    assert post_1.uri == '/user/john/blog/1-post_1/'
+    assert '1-post_1' not in blog.__cache__
+    assert blog['1-post_1'] is not post_1
+    assert blog['2-post_2'] is post_2
+
+
+def test_mount_set_callable(root, resources):
+    resources['User'].mount_set(str.isupper, resources['File'])
+    assert repr(root['user']['john']['README']) == \
+        '<File: /user/john/README/>'
+    with pytest.raises(KeyError):
+        root['user']['john']['readme']
+
+
+def test_key(root, resources):
+    import uuid
+    from traversalkit.ids import UUID_ID, Predicate
+
+    assert root.__key__ == ''
+    assert root['user'].__key__ == 'user'
+    assert root['user']['john'].__key__ == 'john'
+
+    class Items(Resource):
+        """ Collection of items """
+
+    Items.mount_set(Predicate(str.isdigit, convert=int), resources['File'])
+    Items.mount_set(UUID_ID, resources['File'], converter=uuid.UUID)
+    items = Items()
+    assert items['42'].__key__ == 42
+    name = '6ba7b810-9dad-11d1-80b4-00c04fd430c8'
+    assert items[name].__key__ == uuid.UUID(name)
+
+
+def test_key_error_on_conversion(resources):
+    import datetime
+
+    def date(name):
+        return datetime.datetime.strptime(name, '%Y-%m-%d').date()
+
+    class Archive(Resource):
+        """ Blog archive """
+
+    Archive.mount_set(re.compile(r'^\d{4}-\d{2}-\d{2}$'), resources['File'],
+                      converter=date)
+    archive = Archive()
+    assert archive['2017-01-31'].__key__ == datetime.date(2017, 1, 31)
+    with pytest.raises(KeyError) as info:
+        archive['2017-02-31']
+    assert info.value.args == ('2017-02-31', '/')
+
+
+def test_find(root):
+    assert root.find('user') is root['user']
+    assert root.find('group') is None
+    assert root.find('group', default=42) == 42
+
+
+def test_lookup(root):
+    assert root.lookup('user') is root['user']
+
+    miss = root.lookup('group')
+    assert not miss
+    assert miss.reason == Miss.NO_ROUTE
+    assert miss.name == 'group'
+    assert miss.parent is root
+    assert repr(miss) == '<Miss: no_route group>'
+
+    post = root['blog']['1-some_post']
+    assert 'uri' not in post.__dict__
+
+    miss = post.lookup('comments')
+    assert miss.reason == Miss.CONDITION
+    assert 'uri' not in post.__dict__
+
+    miss = post.lookup('nonexistent-file')
+    assert miss.reason == Miss.NOT_EXIST
+    assert 'uri' not in post.__dict__
+    assert miss.error().args == ('nonexistent-file', '/blog/1-some_post/')
+
+
+def test_fork(root):
+    template_post = root['user']['john']['blog']['1-post']
+    fork = root.fork()
+    assert fork.__parent__ is None
+    assert fork.uri == '/'
+
+    post = fork['user']['john']['blog']['1-post']
+    assert post is not template_post
+    assert post.uri == '/user/john/blog/1-post/'
+    assert post.__parent__ is fork['user']['john']['blog']
+    assert post.parent(cls='SiteRoot') is fork
+    assert fork['user']['john']['blog']['1-post'] is post
+
+    comments = post['comments']
+    assert 'comments' not in template_post.__cache__
+    assert comments.__parent__ is post
+    assert list(fork.__cache__) == ['user']
+
+    fork['blog']
+    assert 'blog' not in root.__cache__
+    assert sorted(fork.__cache__) == ['blog', 'user']
+
+
+def test_invalidate(root, resources):
+    invalidated = []
+    resources['User'].on_invalidate = \
+        lambda self: invalidated.append(self.uri)
+    resources['Blog'].on_invalidate = \
+        lambda self: invalidated.append(self.uri)
+
+    john = root['user']['john']
+    john['blog']
+    jane = root['user']['jane']
+
+    assert root.invalidate('/user/bob/') == 0
+    assert root.invalidate('/group/1/') == 0
+    assert root.invalidate('/user/john/', recursive=False) == 1
+    assert invalidated == ['/user/john/']
+    assert root['user']['john'] is not john
+    assert root['user']['jane'] is jane
+
+    del invalidated[:]
+    root['user']['john']['blog']
+    assert root.invalidate('user') == 4
+    assert sorted(invalidated) == [
+        '/user/jane/', '/user/john/', '/user/john/blog/',
+    ]
+
+    root['user']['john']
+    assert root.invalidate('/') == 2
+    assert len(root.__cache__) == 0
+
+
+def test_invalidate_where(root):
+    post_1 = root['user']['john']['blog']['1-post']
+    post_2 = root['user']['jane']['blog']['2-post']
+    blog = root['blog']
+    admin_post = blog['1-post']
+
+    with pytest.raises(TypeError):
+        root.invalidate_where()
+
+    assert root.invalidate_where(cls='BlogPost',
+                                 route='/user/{username}/blog/{post_id}/') == 2
+    assert root['user']['john']['blog']['1-post'] is not post_1
+    assert root['user']['jane']['blog']['2-post'] is not post_2
+    assert root['blog']['1-post'] is admin_post
+
+    assert root.invalidate_where(prefix='/user/j', cls='Blog') == 4
+    assert root['blog'] is blog
+
+    assert root.invalidate_where(prefix='/blog/', cls=type(blog)) == 2
+    assert root['blog'] is not blog
+
+
+def test_cache_policy(resources):
+    from traversalkit.cache import LRU, Weak
+
+    class Root(Resource):
+        """ Root resource """
+
+    Root.mount('search', resources['File'], cache=False)
+    Root.mount('settings', resources['File'])
+    Root.mount_set(DEC_ID, resources['User'], cache=LRU(1))
+    Root.mount_set(TEXT_ID, resources['Users'], cache=Weak())
+    root = Root()
+
+    assert root['search'] is not root['search']
+    assert root['settings'] is root['settings']
+
+    user_1 = root['1']
+    assert root['1'] is user_1
+    root['2']
+    assert root['1'] is not user_1
+
+    users = root['users']
+    assert root['users'] is users
+    del users
+    gc.collect()
+    assert 'users' not in root.__cache__
+
+    assert sorted(root.__cache__) == ['1', 'settings']
+    assert root.invalidate('/1/') == 1
+    assert sorted(root.__cache__) == ['settings']
+
+
+def test_census(root, resources):
+    from traversalkit.cache import LRU
+
+    class Root(Resource):
+        """ Root resource """
+
+    Root.mount_set(DEC_ID, resources['User'], metaname='user_id',
+                   cache=LRU(10))
+    Root.mount('blog', resources['Blog'])
+    root = Root()
+    root['1']['blog']['1-post']
+    root['2']
+    root['blog']
+
+    census = root.census()
+    assert census['count'] == 6
+    assert census['classes'][resources['User']]['count'] == 2
+    assert census['classes'][resources['Blog']]['count'] == 2
+    assert census['routes']['/{user_id}/blog/']['count'] == 1
+    assert census['routes']['/blog/']['count'] == 1
+    assert dict((depth, stat['count'])
+                for depth, stat in census['depths'].items()) == \
+        {0: 1, 1: 3, 2: 1, 3: 1}
+    assert census['size'] == sum(
+        stat['size'] for stat in census['classes'].values()
+    )
+    assert 'uri' not in root['1'].__dict__
+
+
+def test_census_fork(root):
+    root['user']['john']
+    fork = root.fork()
+    fork['blog']
+    census = fork.census()
+    assert census['count'] == 2
+    assert 'user' not in fork.__cache__._payload
+
+
+def test_census_sizeof(root, resources):
+
+    class Users(Resource):
+        """ Resource with payload """
+        payload = None
+
+        def sizeof(self):
+            size = super(Users, self).sizeof()
+            if self.payload is not None:
+                size += len(self.payload)
+            return size
+
+    users = Users()
+    empty = users.census()['size']
+    users.payload = b'x' * 10000
+    assert users.census()['size'] > empty + 10000
+
+
+def test_parent_link():
+    import gc
+
+    class Root(Resource):
+        """ Root resource """
+
+    @Root.mount_set(DEC_ID)
+    class Strong(Resource):
+        """ Resource with strong link to parent """
+        __parentlink__ = 'strong'
+
+    @Strong.mount_set(DEC_ID)
+    class Inherited(Strong):
+        """ Resource, which inherits strong link """
+
+    @Inherited.mount_set(DEC_ID)
+    class Weak(Inherited):
+        """ Resource with weak link to parent """
+        __parentlink__ = 'weak'
+
+    weak = Root()['1']['2']['3']
+    assert '__parent__' in weak.__parent__.__dict__
+    assert weak.__parent__.uri == '/1/2/'
+    names = list(r.__name__ for r in weak.__parent__.lineage())
+    assert names == ['2', '1', '']
+    gc.collect()
+    assert weak.__parent__ is None
+
+    strong = Root()['1']['2']
+    strong.__parent__ = None
+    assert strong.__parent__ is None
+
+    with pytest.raises(ValueError):
+        class Invalid(Resource):
+            """ Resource with unsupported parent link """
+            __parentlink__ = 'invalid'
+
+
+def test_freeze(root):
+    import threading
+    from traversalkit.budget import Budget
+    from traversalkit.cache import FrozenCache
+
+    post = root['user']['john']['blog']['1-post']
+    Budget(100).attach(root)
+    blog = root['blog']
+    assert root.freeze() is root
+
+    assert root.__frozen__ and post.__frozen__
+    assert isinstance(post.__parent__.__cache__, FrozenCache)
+    assert root['user']['john']['blog']['1-post'] is post
+    assert root['blog'] is blog
+    assert blog.__budget__ is None
+    assert post.__dict__['uri'] == '/user/john/blog/1-post/'
+
+    jane = root['user']['jane']
+    assert root['user']['jane'] is not jane
+    assert not jane.__frozen__
+    assert jane['blog'] is jane['blog']
+    assert 'jane' not in root['user'].__cache__
+    assert post.__cache__ is blog.__cache__
+    assert len(post.__cache__) == 0
+
+    with pytest.raises(TypeError):
+        root.invalidate('/user/john/')
+
+    fork = root.fork()
+    assert not fork.__frozen__
+    assert fork['user'] is not root['user']
+    assert fork['user']['jane'] is fork['user']['jane']
+
+    errors = []
+
+    def read():
+        try:
+            for i in range(100):
+                assert root['user']['john']['blog']['1-post'] is post
+                assert root['user'][str(i)].__name__ == str(i)
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=read) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
@@ -1,6 +1,12 @@
+import gc
 import re
+import weakref
 
-from traversalkit.route import Node, Route
+import pytest
+
+from traversalkit import Resource, DEC_ID
+from traversalkit.condition import Condition, Recursion, Under
+from traversalkit.route import Node, Route, RouteRegistry
 
 
 def test_node():
@@ -40,3 +46,175 @@ def test_path():
     assert path.uri == '/foo/{bar}/'
     assert repr(path) == '<Route: /foo/{bar}/>'
     assert len(path) == 3
+
+
+def test_node_pattern():
+    node = Node(object, pattern=str.isdigit)
+    assert str(node) == '{isdigit}'
+    assert node.pattern.match('42')
+    assert not node.pattern.match('foo')
+
+
+@pytest.fixture
+def categories():
+    class Root(Resource):
+        """ Root resource """
+
+    @Root.mount('categories')
+    class Categories(Resource):
+        """ Categories collection """
+
+    @Categories.mount_set(DEC_ID, metaname='category_id')
+    class Category(Resource):
+        """ Category resource """
+
+    @Category.mount('related')
+    class Related(Resource):
+        """ Related categories """
+
+    Category.mount('categories', Categories, complies=Recursion(maxdepth=4))
+    Related.mount_set(DEC_ID, Category, metaname='related_id',
+                      complies=Recursion(maxdepth=4) & ~Under('archive'))
+    Root.mount('archive', Categories)
+    return Root
+
+
+def test_route_graph(categories):
+    graph = categories.route_graph()
+    routes = [route.uri for route in categories.routes()]
+
+    assert graph._memoizable
+    assert graph.count() == len(routes)
+    assert [r.uri for r in graph.routes()] == routes
+    assert [r.uri for r in graph.routes(offset=7, limit=20)] == routes[7:27]
+    assert [r.uri for r in graph.routes(offset=len(routes))] == []
+    assert graph.classes()
+    assert [str(node) for node in graph.edges(categories)] == \
+        ['archive', 'categories']
+
+    assert graph.reachable('/')
+    assert graph.reachable('/categories/{category_id}/related/{related_id}/')
+    assert not graph.reachable('/archive/{category_id}/related/{related_id}/')
+    assert not graph.reachable('/categories/{related_id}/')
+    assert graph.find('/categories/').uri == '/categories/'
+
+
+def test_route_graph_without_memoization(categories):
+    class Custom(Condition):
+        def __call__(self, route):
+            return len(route) < 8
+
+    categories.mount('custom', categories, complies=Custom())
+    graph = categories.route_graph()
+    routes = [route.uri for route in categories.routes()]
+
+    assert not graph._memoizable
+    assert graph.count() == len(routes)
+    assert [r.uri for r in graph.routes(offset=3, limit=5)] == routes[3:8]
+
+
+def test_route_registry():
+    registry = RouteRegistry()
+    root = Node(object, name='')
+    node = Node(object, name='foo')
+    node.mounted = True
+
+    route = registry.intern(Route(root))
+    assert route.id == 0
+    assert registry.intern(Route(Node(object, name=''))) is route
+    bar = registry.intern(Route(Node(object, name='bar')))
+    assert bar.id == 1
+
+    child = registry.child(route, node)
+    assert child.id == 2
+    assert child.uri == '/foo/'
+    assert registry.child(route, node) is child
+    assert registry.intern(route + node) is child
+    foo = registry.intern(Route(root, Node(object, name='foo')))
+    assert foo is not child
+
+    assert len(registry) == 4
+    assert registry[2] is child
+    assert list(registry) == [route, bar, child, foo]
+    assert Route(root).id is None
+
+
+def test_route_registry_adhoc_routes():
+    registry = RouteRegistry()
+    root = registry.intern(Route(Node(object, name='')))
+
+    for i in range(100):
+        child = registry.child(root, Node(object, name=str(i)))
+        assert child.id is None
+        assert child.uri == '/%s/' % i
+    node = Node(object, name='mounted')
+    node.mounted = True
+    assert registry.child(child, node).id is None
+    assert list(registry) == [root]
+
+    class Dynamic(Resource):
+        """ Dynamically created root resource class """
+        __registry__ = registry
+
+    @Dynamic.mount_set(DEC_ID, metaname='id')
+    class Child(Resource):
+        """ Child resource """
+
+    ref = weakref.ref(Dynamic)
+    resources = [Dynamic(name='root%s' % i) for i in range(10)]
+    assert set(r['1'].__routeid__ for r in resources) == set([None])
+    assert resources[0]['1'].__route__.uri == 'root0/{id}/'
+    with pytest.warns(DeprecationWarning):
+        assert resources[0].child(Child, 'x').__routeid__ is None
+    assert list(registry) == [root]
+    del resources, Dynamic, Child
+    gc.collect()
+    assert ref() is None
+
+
+def test_resource_route_id_stable():
+
+    class Root(Resource):
+        """ Root resource """
+
+    @Root.mount('users')
+    class Users(Resource):
+        """ Collection of users """
+
+    @Users.mount_set(DEC_ID)
+    class User(Resource):
+        """ User resource """
+
+    route_ids = set()
+    for i in range(5):
+        root = Root()
+        route_ids.add(root['users']['1'].__routeid__)
+        del root
+        gc.collect()
+    assert len(route_ids) == 1
+    assert None not in route_ids
+
+
+def test_route_registry_adopts_route():
+    registry = RouteRegistry()
+    route = Route(Node(object, name=''), Node(object, name='foo'))
+    assert registry.intern(route) is route
+    assert route.id == 0
+    assert registry.intern(Route(*route)) is route
+
+    other = RouteRegistry()
+    copy = other.intern(route)
+    assert copy is not route
+    assert tuple(copy) == tuple(route)
+    assert (copy.id, route.id) == (0, 0)
+
+
+def test_resource_route_id(categories):
+    root = categories()
+    first = root['categories']['1']['categories']['2']
+    second = root['categories']['3']['categories']['4']
+    assert first.__route__ is second.__route__
+    assert first.__routeid__ == second.__routeid__
+    assert first.__routeid__ != root['categories']['1'].__routeid__
+    assert categories().__route__ is root.__route__
+    assert root.__registry__[first.__routeid__] is first.__route__
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+
+from traversalkit import Resource, TEXT_ID
+from traversalkit.store import PayloadStore, zero_copy
+
+
+@pytest.fixture
+def path(tmpdir):
+    path = str(tmpdir.join('store.tkps'))
+    PayloadStore.build(path, [
+        (str(i), ('payload %s' % i).encode('utf-8')) for i in range(100)
+    ] + [(u'ключ', b'')])
+    return path
+
+
+def test_store(path):
+    store = PayloadStore(path)
+    assert len(store) == 101
+    assert '42' in store
+    assert '100' not in store
+    assert u'ключ' in store
+    assert sorted(store) == sorted([str(i) for i in range(100)] + [u'ключ'])
+
+    payload = store.get('42')
+    assert isinstance(payload, memoryview if zero_copy is None else zero_copy)
+    assert bytes(payload) == b'payload 42'
+    assert bytes(store.get(u'ключ')) == b''
+    assert store.get('100') is None
+    assert store.get('100', 42) == 42
+
+    if zero_copy is None:
+        payload.release()
+    store.close()
+
+
+def test_store_rebuild(path):
+    store = PayloadStore(path)
+    PayloadStore.build(path, [('1', b'new')])
+    assert bytes(store.get('1')) == b'payload 1'
+    assert bytes(PayloadStore(path).get('1')) == b'new'
+    assert os.listdir(os.path.dirname(path)) == ['store.tkps']
+
+
+def test_store_build_error(tmpdir):
+    path = str(tmpdir.join('store.tkps'))
+    with pytest.raises(TypeError):
+        PayloadStore.build(path, [('1', None)])
+    assert os.listdir(str(tmpdir)) == []
+
+
+def test_store_invalid_file(tmpdir):
+    path = tmpdir.join('store.tkps')
+    path.write(b'NOT A STORE FILE', mode='wb')
+    with pytest.raises(ValueError):
+        PayloadStore(str(path))
+
+
+def test_store_payloads(path):
+    store = PayloadStore(path)
+
+    class Catalog(Resource):
+        """ Catalog """
+
+    @Catalog.mount_set(TEXT_ID, payloads=store)
+    class Product(Resource):
+        """ Product """
+
+        def on_init(self, payload):
+            self.payload = payload
+
+    catalog = Catalog()
+    assert bytes(catalog['1'].payload) == b'payload 1'
+    assert catalog['100'].payload is None
+    assert catalog.get('101', b'explicit').payload == b'explicit'
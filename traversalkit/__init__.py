@@ -1,10 +1,13 @@
-from .resource import Resource, ResourceMeta
-from .ids import ANY_ID, DEC_ID, HEX_ID, TEXT_ID
+from .resource import Resource, ResourceMeta, Miss
+from .ids import ANY_ID, DEC_ID, HEX_ID, TEXT_ID, UUID_ID
+from .inherited import inherited
+from .deadline import TraversalTimeout
 
 
 __all__ = [
-    'Resource', 'ResourceMeta',
-    'ANY_ID', 'DEC_ID', 'HEX_ID', 'TEXT_ID',
+    'Resource', 'ResourceMeta', 'Miss', 'inherited',
+    'TraversalTimeout',
+    'ANY_ID', 'DEC_ID', 'HEX_ID', 'TEXT_ID', 'UUID_ID',
 ]
 __version__ = '0.3.1'
 __author__ = 'Dmitry Vakhrushev <self@kr41.net>'
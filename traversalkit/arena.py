@@ -0,0 +1,138 @@
+"""
+The module provides request-scoped arenas of resources.
+
+Regular resource tree is created for each request and dropped at the end
+of it.  Arena tracks all resources of the tree, and when the request is
+over, it tears the tree down in bulk and returns resource and cache objects
+into :class:`Pool`, so that the next request can reuse them instead of
+allocating new ones.
+
+The gain depends on the interpreter and its allocator, so measure it
+on your workload using ``benchmarks/arena.py`` before switching.
+
+Arena should not be used directly.  Use
+:meth:`traversalkit.resource.Resource.request_tree` instead.
+
+"""
+
+
+class Pool(object):
+    """
+    Pool of recycled resource and cache objects.
+
+    The pool can be shared between threads.
+
+    :param int maxsize: Maximum number of recycled objects per class.
+
+    """
+
+    def __init__(self, maxsize=1000):
+        self.maxsize = maxsize
+        self._resources = {}
+        self._caches = {}
+
+    def take(self, class_, storage):
+        """
+        Takes recycled object of the given class from the storage.
+
+        :param type class_: Class of the object.
+        :param dict storage: Either ``_resources`` or ``_caches``.
+        :return: Recycled object or ``None``.
+
+        """
+        try:
+            return storage[class_].pop()
+        except (KeyError, IndexError):
+            return None
+
+    def give(self, obj, storage):
+        """
+        Puts object into the storage, if the storage is not full.
+
+        :param obj: Object to recycle.
+        :param dict storage: Either ``_resources`` or ``_caches``.
+
+        """
+        free = storage.setdefault(obj.__class__, [])
+        if len(free) < self.maxsize:
+            free.append(obj)
+
+    def resource(self, class_):
+        """
+        Returns uninitialized resource object of the given class.
+
+        :param Resource class_: Resource class.
+        :return: Recycled resource or new one, created by ``__new__``.
+
+        """
+        resource = self.take(class_, self._resources)
+        if resource is None:
+            resource = class_.__new__(class_)
+        cache = self.take(class_.__cacheclass__, self._caches)
+        if cache is not None:
+            resource.__cache__ = cache
+        return resource
+
+    def recycle(self, resource):
+        """
+        Resets resource state and puts it with its cache into the pool.
+
+        :param Resource resource: Resource to recycle.
+
+        """
+        state = resource.__dict__
+        cache = state.get('__cache__')
+        state.clear()
+        if cache is not None and cache.__class__ is resource.__cacheclass__:
+            cache.reset()
+            self.give(cache, self._caches)
+        self.give(resource, self._resources)
+
+    def __len__(self):
+        return sum(
+            len(free)
+            for storage in (self._resources, self._caches)
+            for free in storage.values()
+        )
+
+
+default_pool = Pool()
+
+
+class Arena(object):
+    """
+    Request-scoped arena of resources.
+
+    :param Pool pool: Pool to take objects from and to recycle them into.
+
+    """
+
+    def __init__(self, pool=None):
+        self.pool = pool if pool is not None else default_pool
+        self.resources = []
+
+    def create(self, class_, **kw):
+        """
+        Creates resource within the arena.
+
+        :param Resource class_: Resource class.
+        :param kw: Keyword arguments of resource constructor.
+        :return: Initialized resource.
+
+        """
+        resource = self.pool.resource(class_)
+        resource.__arena__ = self
+        self.resources.append(resource)
+        resource.__init__(**kw)
+        return resource
+
+    def release(self):
+        """
+        Tears all resources of the arena down and recycles them.
+
+        Resources must not be used after the release.
+
+        """
+        resources, self.resources = self.resources, []
+        for resource in resources:
+            self.pool.recycle(resource)
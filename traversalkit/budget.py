@@ -0,0 +1,191 @@
+"""
+The module provides tree-wide memory budget of cached resources.
+
+Cache policies (see :class:`traversalkit.cache.Policy`) bound caches of each
+parent resource separately.  It does not bound a tree, whose fan-out is
+spread across many parents.  :class:`Budget` bounds all the caches of the
+tree at once.
+
+"""
+
+import threading
+import weakref
+from collections import deque
+
+
+def dead():
+    return None
+
+
+class Budget(object):
+    """
+    Tree-wide budget of cached resources.
+
+    All cached resources of the tree are tracked by a single CLOCK list.
+    When a cached resource is accessed, it is marked as referenced.
+    When the budget is exceeded, the clock hand sweeps the list: referenced
+    resources get their mark cleared and a second chance, unreferenced ones
+    are evicted from the cache of their parents with their whole cached
+    subtrees.  Resources, that have been removed from the cache
+    by other means (i.e. by :meth:`traversalkit.resource.Resource.invalidate`
+    or by cache policy), are dropped from the list by the sweep.
+
+    :param int limit: Maximum total weight of cached resources.
+    :param callable weigh: Optional function, that accepts resource and
+                           returns its weight, i.e. estimated size in bytes.
+                           Each resource weighs 1 by default, i.e. the limit
+                           is maximum number of cached resources.
+
+    ..  attribute:: size
+
+        Current total weight of cached resources.
+
+    ..  doctest::
+
+        >>> from traversalkit import Resource, DEC_ID
+
+        >>> class Users(Resource):
+        ...     ''' Collection of users '''
+
+        >>> @Users.mount_set(DEC_ID, metaname='user_id')
+        ... class User(Resource):
+        ...     ''' User resource '''
+
+        >>> @User.mount('posts')
+        ... class Posts(Resource):
+        ...     ''' Collection of posts '''
+
+        >>> users = Users()
+        >>> budget = Budget(4).attach(users)
+        >>> posts = users['1']['posts']
+        >>> posts = users['2']['posts']
+        >>> budget.size
+        4
+        >>> sorted(budget.occupancy().items())
+        [('/{user_id}/', 2), ('/{user_id}/posts/', 2)]
+
+        >>> users['1'] is users['1']    # Mark as referenced
+        True
+        >>> posts = users['3']['posts']
+        >>> sorted(users.__cache__)
+        ['1', '3']
+
+    """
+
+    def __init__(self, limit, weigh=None):
+        self.limit = limit
+        self.weigh = weigh
+        self.size = 0
+        self._ring = deque()
+        self._lock = threading.RLock()
+
+    def attach(self, root):
+        """
+        Attaches the budget to the resource tree.
+
+        Cached resources of the tree are admitted to the budget.
+        Resources of a fork, which are still shared with its template,
+        are not admitted.
+        All the resources, that will be cached within the tree later,
+        will be admitted automatically.
+
+        :param Resource root: Root resource of the tree.
+        :return: The budget itself.
+
+        """
+        root.__budget__ = self
+        stack = [root]
+        while stack:
+            cache = stack.pop().__dict__.get('__cache__')
+            if cache:
+                for child in cache.peek():
+                    self.admit(child)
+                    stack.append(child)
+        return self
+
+    def admit(self, resource):
+        """
+        Admits cached resource to the budget.
+
+        It is called by :class:`traversalkit.resource.Resource` automatically.
+        If the budget is exceeded, cold resources are evicted.
+
+        :param Resource resource: Cached resource.
+
+        """
+        weight = self.weigh(resource) if self.weigh is not None else 1
+        entry = [weakref.ref(resource), False, weight]
+        with self._lock:
+            resource.__budget__ = self
+            resource.__clock__ = entry
+            self._ring.append(entry)
+            self.size += weight
+            if self.size > self.limit:
+                self._sweep()
+
+    def _sweep(self):
+        # There are at most two full turns: the first one clears marks,
+        # the second one evicts.
+        turns = 2 * len(self._ring) + 1
+        while self.size > self.limit and self._ring and turns:
+            turns -= 1
+            entry = self._ring.popleft()
+            resource = entry[0]()
+            if resource is None or not self._cached(resource):
+                self._forget(entry)
+            elif entry[1]:
+                entry[1] = False
+                self._ring.append(entry)
+            else:
+                self._evict(resource)
+
+    def _cached(self, resource):
+        parent = resource.__parent__
+        if parent is None:
+            return False
+        cache = parent.__dict__.get('__cache__')
+        return cache is not None and \
+            cache.get(resource.__name__) is resource
+
+    def _forget(self, entry):
+        if entry[0] is not dead:
+            entry[0] = dead
+            self.size -= entry[2]
+
+    def _evict(self, resource):
+        del resource.__parent__.__cache__[resource.__name__]
+        stack = [resource]
+        while stack:
+            resource = stack.pop()
+            entry = resource.__dict__.get('__clock__')
+            if entry is not None:
+                self._forget(entry)
+            cache = resource.__dict__.get('__cache__')
+            if cache:
+                stack.extend(cache.values())
+
+    def resources(self):
+        """
+        Iterates over live resources admitted to the budget.
+
+        """
+        for entry in list(self._ring):
+            resource = entry[0]()
+            if resource is not None:
+                yield resource
+
+    def occupancy(self):
+        """
+        Returns total weight of cached resources per route.
+
+        :return: Dictionary, where keys are route templates,
+                 i.e. :attr:`traversalkit.route.Route.uri`,
+                 and values are total weights.
+        :rtype: dict
+
+        """
+        result = {}
+        for resource in self.resources():
+            uri = resource.__route__.uri
+            result[uri] = result.get(uri, 0) + resource.__clock__[2]
+        return result
@@ -1,6 +1,17 @@
-from collections import MutableMapping
+import sys
+import time
+import threading
+import weakref
+from collections import MutableMapping, OrderedDict
 from contextlib import contextmanager
 
+from .miss import Miss
+
+
+def _function(cls, name):
+    method = getattr(cls, name)
+    return getattr(method, '__func__', method)
+
 
 class Cache(MutableMapping):
     """
@@ -52,11 +63,40 @@ class Cache(MutableMapping):
 
     def __init__(self, *args, **kw):
         self._payload = {}
+        self._stores = {}
         self._readonly = False
+        cls = self.__class__
+        if '_direct' not in cls.__dict__:
+            # Derived classes, which override ``__getitem__`` only, expect
+            # ``get`` to go through it, as it does in regular mapping.
+            cls._direct = (
+                _function(cls, '__getitem__') is
+                _function(Cache, '__getitem__') or
+                _function(cls, 'get') is not _function(Cache, 'get')
+            )
         self.update(*args, **kw)
 
     def __getitem__(self, key):
-        return self._payload[key]
+        try:
+            return self._payload[key]
+        except KeyError:
+            if not self._stores:
+                raise
+            return self._stored(key)
+
+    def get(self, key, default=None):
+        if not self._direct:
+            try:
+                return self[key]
+            except KeyError:
+                return default
+        value = self._payload.get(key)
+        if value is None and self._stores:
+            for store in self._stores.values():
+                value = store.get(key)
+                if value is not None:
+                    break
+        return default if value is None else value
 
     def __setitem__(self, key, value):
         if not self._readonly:
@@ -64,13 +104,87 @@ class Cache(MutableMapping):
 
     def __delitem__(self, key):
         if not self._readonly:
-            del self._payload[key]
+            try:
+                del self._payload[key]
+            except KeyError:
+                for store in self._stores.values():
+                    if key in store:
+                        del store[key]
+                        return
+                raise
 
     def __iter__(self):
-        return iter(self._payload)
+        for key in self._payload:
+            yield key
+        for store in list(self._stores.values()):
+            for key in list(store):
+                yield key
 
     def __len__(self):
-        return len(self._payload)
+        return len(self._payload) + \
+            sum(len(store) for store in self._stores.values())
+
+    def peek(self):
+        """
+        Iterates over cached values without side effects.
+
+        Unlike regular mapping interface, it does not update recency
+        of values, schedule refreshes, or fork template values.
+        Values of :class:`ForkCache`, which are still shared with
+        the template, are not included.
+
+        """
+        for value in list(self._payload.values()):
+            yield value
+        for store in list(self._stores.values()):
+            peek = getattr(store, 'peek', None)
+            values = peek() if peek is not None else store.values()
+            for value in list(values):
+                yield value
+
+    def __sizeof__(self):
+        return object.__sizeof__(self) + \
+            sys.getsizeof(self._payload) + \
+            sys.getsizeof(self._stores) + \
+            sum(sys.getsizeof(store) for store in self._stores.values())
+
+    def _stored(self, key):
+        for store in self._stores.values():
+            value = store.get(key)
+            if value is not None:
+                return value
+        raise KeyError(key)
+
+    def put(self, key, value, policy):
+        """
+        Stores value using cache policy.
+
+        The value is stored in a separate store, which is created by the
+        policy (see :class:`Policy`).  The value is available through regular
+        mapping interface of the cache.
+
+        :param key: Key of the value.
+        :param value: Value to store.
+        :param Policy policy: Cache policy.
+
+        """
+        if self._readonly:
+            return
+        store = self._stores.get(policy)
+        if store is None:
+            store = self._stores.setdefault(policy, policy.create())
+        store[key] = value
+
+    def reset(self):
+        """
+        Resets cache into its initial state, so that it can be reused.
+
+        It removes all items regardless :meth:`readonly` state.
+
+        """
+        self._payload.clear()
+        self._stores.clear()
+        self._readonly = False
 
     @contextmanager
     def readonly(self):
@@ -79,3 +193,472 @@ class Cache(MutableMapping):
             yield self
         finally:
             self._readonly = False
+
+
+class FrozenCache(Cache):
+    """
+    Immutable resource cache.
+
+    It is created by :meth:`traversalkit.resource.Resource.freeze` and should
+    not be instantiated directly.
+
+    All the methods, that modify the cache, raise ``TypeError``.
+    The cache has no mutable state at all, including :meth:`readonly` flag,
+    so it can be read from concurrent threads without locking.
+
+    """
+
+    def __init__(self, *args, **kw):
+        super(FrozenCache, self).__init__()
+        self._payload.update(*args, **kw)
+
+    def __setitem__(self, key, value):
+        raise TypeError('Frozen cache does not support item assignment')
+
+    def __delitem__(self, key):
+        raise TypeError('Frozen cache does not support item deletion')
+
+    def put(self, key, value, policy):
+        raise TypeError('Frozen cache does not support item assignment')
+
+    def reset(self):
+        raise TypeError('Frozen cache cannot be reset')
+
+    @contextmanager
+    def readonly(self):
+        yield self
+
+
+class Policy(object):
+    """
+    Base class of cache policy.
+
+    Cache policy can be passed into
+    :meth:`traversalkit.resource.Resource.mount` and
+    :meth:`traversalkit.resource.Resource.mount_set` as ``cache`` parameter
+    to control caching of child resources of the mounted route node.
+    Children of each policy are kept in a separate store within the parent
+    cache, see :meth:`Cache.put`.  So one parent can mix different policies.
+
+    Besides policy objects, ``cache`` parameter accepts ``None``
+    (default, child resources are kept in the parent cache as usual)
+    and ``False`` (child resources are never cached).
+
+    Derived class should only override :meth:`create` method.
+
+    ..  doctest::
+
+        >>> from traversalkit import Resource, DEC_ID, TEXT_ID
+
+        >>> class Root(Resource):
+        ...     ''' Site root '''
+
+        >>> @Root.mount('search')
+        ... class Search(Resource):
+        ...     ''' Search '''
+
+        >>> @Search.mount_set(TEXT_ID, metaname='query', cache=False)
+        ... class Query(Resource):  #                    ^^^^^^^^^^^
+        ...     ''' Search query '''
+
+        >>> @Root.mount('users')
+        ... class Users(Resource):
+        ...     ''' Collection of users '''
+
+        >>> @Users.mount_set(DEC_ID, metaname='user_id', cache=LRU(2))
+        ... class User(Resource):  #                     ^^^^^^^^^^^^
+        ...     ''' User resource '''
+
+        >>> root = Root()
+        >>> root['search']['foo'] is root['search']['foo']
+        False
+        >>> user_1 = root['users']['1']
+        >>> user_1 is root['users']['1']
+        True
+        >>> user_2, user_3 = root['users']['2'], root['users']['3']
+        >>> user_1 is root['users']['1']
+        False
+
+    """
+
+    def create(self):
+        """
+        Creates store of the policy.
+
+        :return: Mutable mapping.
+
+        """
+        raise NotImplementedError('The method should be overridden')
+
+    def __repr__(self):
+        params = (
+            '%s=%r' % (key, value)
+            for key, value in sorted(self.__dict__.items())
+        )
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(params))
+
+
+class LRU(Policy):
+    """
+    Policy, that keeps limited number of the least recently used children.
+
+    :param int maxsize: Maximum number of children per parent.
+
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+
+    def create(self):
+        return LRUStore(self.maxsize)
+
+
+class TTL(Policy):
+    """
+    Policy, that keeps children during the given time.
+
+    :param float ttl: Time to live in seconds.
+
+    """
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+
+    def create(self):
+        return TTLStore(self.ttl)
+
+
+class Weak(Policy):
+    """
+    Policy, that keeps children while they are referenced somewhere else.
+
+    """
+
+    def create(self):
+        return weakref.WeakValueDictionary()
+
+
+class LRUStore(MutableMapping):
+    """
+    Store of :class:`LRU` policy.
+
+    :param int maxsize: Maximum number of items.
+
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = self._items.pop(key)
+            self._items[key] = value
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = value
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self._items[key]
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __len__(self):
+        return len(self._items)
+
+    def peek(self):
+        return list(self._items.values())
+
+    def __sizeof__(self):
+        return object.__sizeof__(self) + sys.getsizeof(self._items)
+
+
+class TTLStore(MutableMapping):
+    """
+    Store of :class:`TTL` policy.
+
+    :param float ttl: Time to live of items in seconds.
+
+    """
+
+    clock = staticmethod(getattr(time, 'monotonic', time.time))
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._items = {}
+
+    def __getitem__(self, key):
+        value, deadline = self._items[key]
+        if self.clock() >= deadline:
+            self._items.pop(key, None)
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._items[key] = (value, self.clock() + self.ttl)
+
+    def __delitem__(self, key):
+        del self._items[key]
+
+    def __iter__(self):
+        now = self.clock()
+        return iter([
+            key for key, (value, deadline) in list(self._items.items())
+            if now < deadline
+        ])
+
+    def __len__(self):
+        return sum(1 for key in self)
+
+    def peek(self):
+        now = self.clock()
+        return [
+            value for value, deadline in list(self._items.values())
+            if now < deadline
+        ]
+
+    def __sizeof__(self):
+        return object.__sizeof__(self) + sys.getsizeof(self._items)
+
+
+class ForkCache(Cache):
+    """
+    Copy-on-write cache of forked resource.
+
+    It is created by :meth:`traversalkit.resource.Resource.fork` and should
+    not be instantiated directly.
+
+    The cache reads through to the cache of the template resource, but never
+    writes into it.  When a child resource is read from the template cache,
+    it is forked (see :meth:`traversalkit.resource.Resource.fork`) to be
+    attached to the owner of the cache, and the fork is stored into the cache
+    itself.  So template resources are shared read-only, and private copies
+    of them are materialized on access.
+
+    :param Mapping template: Cache of the template resource.
+    :param Resource owner: Forked resource, that owns the cache.
+
+    """
+
+    def __init__(self, template, owner):
+        self._template = template
+        self._owner = weakref.ref(owner)
+        self._masked = set()
+        super(ForkCache, self).__init__()
+
+    def _fork(self, key):
+        if key in self._masked:
+            raise KeyError(key)
+        child = self._template[key].fork(self._owner())
+        return self._payload.setdefault(key, child)
+
+    def __getitem__(self, key):
+        try:
+            return self._payload[key]
+        except KeyError:
+            pass
+        try:
+            return self._fork(key)
+        except KeyError:
+            return self._stored(key)
+
+    def get(self, key, default=None):
+        child = self._payload.get(key)
+        if child is not None:
+            return child
+        if key in self._masked or key not in self._template:
+            return super(ForkCache, self).get(key, default)
+        return self._fork(key)
+
+    def __setitem__(self, key, value):
+        if not self._readonly:
+            self._payload[key] = value
+            self._masked.discard(key)
+
+    def __delitem__(self, key):
+        if self._readonly:
+            return
+        if key in self._masked:
+            raise KeyError(key)
+        if key in self._template:
+            self._payload.pop(key, None)
+            self._masked.add(key)
+        else:
+            super(ForkCache, self).__delitem__(key)
+
+    def __iter__(self):
+        for key in super(ForkCache, self).__iter__():
+            yield key
+        for key in self._template:
+            if key not in self._payload and key not in self._masked:
+                yield key
+
+    def __len__(self):
+        return sum(1 for key in self)
+
+    def reset(self):
+        super(ForkCache, self).reset()
+        self._masked.clear()
+
+    def __sizeof__(self):
+        return super(ForkCache, self).__sizeof__() + \
+            sys.getsizeof(self._masked)
+
+
+class RefreshAheadCache(Cache):
+    """
+    Cache with refresh-ahead expiry of child resources.
+
+    Each cached child resource has soft and hard deadlines.  Before the soft
+    one, the child is served as usual.  After the soft deadline, the stale
+    child is still served, but a background refresh is started.  It creates
+    a new child resource using the same route node (with ``None`` payload)
+    and atomically swaps it in, so lookups never wait for the refresh.
+    After the hard deadline, the child is treated as missing, so it is
+    created again by the lookup.  If the refreshed resource does not exist
+    anymore, it is removed from the cache.
+
+    The cache is configured by class attributes, so it should be subclassed
+    to be used as :attr:`traversalkit.resource.Resource.__cacheclass__`:
+
+    ..  attribute:: soft_ttl
+
+        Time in seconds, after that the child should be refreshed.
+        Default is 60.
+
+    ..  attribute:: hard_ttl
+
+        Time in seconds, after that the child should not be served.
+        Default is 300.
+
+    ..  attribute:: executor
+
+        Object with ``submit(func)`` method, i.e. an instance of
+        :class:`concurrent.futures.ThreadPoolExecutor`, that runs refreshes.
+        If it is ``None`` (default), each refresh runs in a new daemon thread.
+
+    ..  doctest::
+
+        >>> from traversalkit import Resource, DEC_ID
+
+        >>> class UsersCache(RefreshAheadCache):
+        ...     soft_ttl = 30
+        ...     hard_ttl = 600
+
+        >>> class Users(Resource):
+        ...     ''' Collection of users '''
+        ...     __cacheclass__ = UsersCache
+
+        >>> @Users.mount_set(DEC_ID, metaname='user_id')
+        ... class User(Resource):
+        ...     ''' User resource '''
+
+        >>> users = Users()
+        >>> users['1'] is users['1']
+        True
+
+    """
+
+    soft_ttl = 60
+    hard_ttl = 300
+    executor = None
+    clock = staticmethod(getattr(time, 'monotonic', time.time))
+
+    def __init__(self, *args, **kw):
+        self._deadlines = {}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        super(RefreshAheadCache, self).__init__(*args, **kw)
+
+    def __getitem__(self, key):
+        try:
+            value = self._payload[key]
+        except KeyError:
+            return self._stored(key)
+        soft, hard = self._deadlines[key]
+        now = self.clock()
+        if now >= hard:
+            raise KeyError(key)
+        if now >= soft:
+            self._schedule(key, value)
+        return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value):
+        if not self._readonly:
+            now = self.clock()
+            self._deadlines[key] = (now + self.soft_ttl, now + self.hard_ttl)
+            self._payload[key] = value
+
+    def __delitem__(self, key):
+        super(RefreshAheadCache, self).__delitem__(key)
+        if not self._readonly:
+            self._deadlines.pop(key, None)
+
+    def reset(self):
+        super(RefreshAheadCache, self).reset()
+        self._deadlines.clear()
+
+    def __sizeof__(self):
+        return super(RefreshAheadCache, self).__sizeof__() + \
+            sys.getsizeof(self._deadlines)
+
+    def _schedule(self, key, stale):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        try:
+            if self.executor is not None:
+                self.executor.submit(self._refresh, key, stale)
+            else:
+                thread = threading.Thread(target=self._refresh,
+                                          args=(key, stale))
+                thread.daemon = True
+                thread.start()
+        except Exception:
+            self._refreshing.discard(key)
+            raise
+
+    def _refresh(self, key, stale):
+        try:
+            parent = stale.__parent__
+            if parent is None:
+                return
+            fresh = parent._create(stale.__node__, stale.__name__,
+                                   cache=False, load=True)
+            with self._lock:
+                if self._payload.get(key) is not stale:
+                    return
+                if isinstance(fresh, Miss):
+                    del self[key]
+                else:
+                    self[key] = fresh
+        finally:
+            self._refreshing.discard(key)
+
+    def refresh(self):
+        """
+        Synchronously refreshes all stale child resources.
+
+        It is useful for testing and warming up.
+
+        """
+        now = self.clock()
+        for key, (soft, hard) in list(self._deadlines.items()):
+            if now >= soft:
+                self._refreshing.add(key)
+                self._refresh(key, self._payload[key])
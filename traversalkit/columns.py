@@ -0,0 +1,196 @@
+"""
+The module provides column-wise storage of child resource payloads.
+
+Collection resources, that hold a lot of small child resources, can keep
+payloads of the children column-wise within the collection itself.
+Child resources are created only when they are accessed, and the stored
+payload is passed into their :meth:`traversalkit.resource.Resource.on_init`.
+Iteration and filtering over the columns do not create child resources.
+
+See :meth:`traversalkit.resource.Resource.columns` for usage example.
+
+"""
+
+from array import array
+
+
+class Columns(object):
+    """
+    Column-wise storage of payloads.
+
+    Each payload is a dictionary, that is stored as a row of the columns.
+    Each column is a list or an :class:`array.array`, so rows with numeric
+    fields can be stored compactly.
+
+    :param fields: Sequence of field names.  Each item can also be a pair
+                   of field name and :mod:`array` type code, i.e.
+                   ``('id', 'l')``, to store the field in an array.
+
+    ..  doctest::
+
+        >>> columns = Columns(['name', ('age', 'B')])
+        >>> columns.append('1', {'name': 'John', 'age': 42})
+        >>> columns.append('2', {'name': 'Jane', 'age': 24})
+        >>> len(columns)
+        2
+        >>> columns.row('1') == {'name': 'John', 'age': 42}
+        True
+        >>> columns.row('3') is None
+        True
+        >>> columns.column('age')
+        array('B', [42, 24])
+        >>> list(columns.where('age', lambda age: age < 30))
+        ['2']
+        >>> list(columns.select('name'))
+        [('1', 'John'), ('2', 'Jane')]
+
+    """
+
+    def __init__(self, fields):
+        self.fields = []
+        self._data = {}
+        for field in fields:
+            if isinstance(field, tuple):
+                field, typecode = field
+                self._data[field] = array(typecode)
+            else:
+                self._data[field] = []
+            self.fields.append(field)
+        self._names = []
+        self._index = {}
+
+    def append(self, name, payload):
+        """
+        Appends payload of the child resource.
+
+        If the payload of the resource has been already stored,
+        it is replaced.
+
+        :param str name: Name of the child resource.
+        :param dict payload: Payload.  Missing fields of list columns
+                             are stored as ``None``, extra fields are
+                             ignored.  Fields of array columns are required.
+        :raises TypeError: If the value cannot be stored into array column,
+                           i.e. it is missing.  The columns are left
+                           unchanged in this case.
+        :raises OverflowError: If the value is out of range of array column.
+
+        """
+        row = self._index.get(name)
+        columns = [(self._data[field], payload.get(field))
+                   for field in self.fields]
+        if row is not None:
+            previous = [column[row] for column, value in columns]
+            try:
+                for column, value in columns:
+                    column[row] = value
+            except (TypeError, OverflowError):
+                for (column, value), old in zip(columns, previous):
+                    column[row] = old
+                raise
+            return
+        done = 0
+        try:
+            for column, value in columns:
+                column.append(value)
+                done += 1
+        except (TypeError, OverflowError):
+            for column, value in columns[:done]:
+                column.pop()
+            raise
+        self._index[name] = len(self._names)
+        self._names.append(name)
+
+    def extend(self, items):
+        """
+        Appends multiple payloads.
+
+        :param items: Iterable of pairs of names and payloads.
+
+        """
+        for name, payload in items:
+            self.append(name, payload)
+
+    def clear(self):
+        """ Removes all stored payloads """
+        for field in self.fields:
+            del self._data[field][:]
+        del self._names[:]
+        self._index.clear()
+
+    def copy(self):
+        """
+        Returns copy of the storage.
+
+        :rtype: Columns
+
+        """
+        result = self.__class__.__new__(self.__class__)
+        result.fields = list(self.fields)
+        result._data = dict(
+            (field, column[:]) for field, column in self._data.items()
+        )
+        result._names = list(self._names)
+        result._index = dict(self._index)
+        return result
+
+    def row(self, name):
+        """
+        Returns payload of the child resource.
+
+        :param str name: Name of the child resource.
+        :return: Payload or ``None``, if it is not stored.
+        :rtype: dict
+
+        """
+        row = self._index.get(name)
+        if row is None:
+            return None
+        return dict((field, self._data[field][row]) for field in self.fields)
+
+    def column(self, field):
+        """
+        Returns column of the field.
+
+        The column should not be modified.
+
+        :param str field: Field name.
+        :return: List or :class:`array.array` of field values,
+                 in the same order as names are iterated.
+
+        """
+        return self._data[field]
+
+    def select(self, *fields):
+        """
+        Iterates over values of given fields.
+
+        :param str fields: Field names.
+        :return: Iterator over tuples of name and values of the fields.
+
+        """
+        columns = [self._names] + [self._data[field] for field in fields]
+        return zip(*columns)
+
+    def where(self, field, predicate):
+        """
+        Iterates over names of the child resources, that match predicate.
+
+        :param str field: Field name.
+        :param callable predicate: Function, that accepts field value
+                                   and returns ``True`` on match.
+        :return: Iterator over names.
+
+        """
+        for name, value in zip(self._names, self._data[field]):
+            if predicate(value):
+                yield name
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name in self._index
@@ -3,6 +3,8 @@ The module provides condition descriptors of routes.
 
 """
 
+from timeit import default_timer
+
 # For compatibility between Python 2.x and Python 3.x
 try:  # pragma: no cover
     string = basestring
@@ -29,8 +31,20 @@ class Condition(object):
 
     Derived class should only override :meth:`__call__` method.
 
+    ..  attribute:: commutative
+
+        Whether the result of the condition does not depend on order
+        of route nodes (except the last one, which is the node under test),
+        i.e. it depends on set of their classes and names and on number
+        of their occurrences only.  It is ``False`` by default.
+        Derived class should set it to ``True``, if the condition meets
+        the requirement.  It allows to memoize route counting within
+        :class:`traversalkit.route.RouteGraph`.
+
     """
 
+    commutative = False
+
     def __call__(self, route):  # pragma: no cover
         """
         Test route against the condition.
@@ -80,6 +94,10 @@ class Not(Condition):
     def __init__(self, condition):
         self.condition = condition
 
+    @property
+    def commutative(self):
+        return self.condition.commutative
+
     def __call__(self, route):
         return not self.condition(route)
 
@@ -107,6 +125,10 @@ class And(Condition):
         self.left = left
         self.rigth = rigth
 
+    @property
+    def commutative(self):
+        return self.left.commutative and self.rigth.commutative
+
     def __call__(self, route):
         return self.left(route) and self.rigth(route)
 
@@ -134,6 +156,10 @@ class Or(Condition):
         self.left = left
         self.rigth = rigth
 
+    @property
+    def commutative(self):
+        return self.left.commutative and self.rigth.commutative
+
     def __call__(self, route):
         return self.left(route) or self.rigth(route)
 
@@ -192,6 +218,8 @@ class Under(Condition):
 
     """
 
+    commutative = True
+
     def __init__(self, *parents):
         self.parents = parents
 
@@ -256,6 +284,8 @@ class Recursion(Condition):
 
     """
 
+    commutative = True
+
     def __init__(self, maxdepth):
         self.maxdepth = maxdepth
 
@@ -266,3 +296,240 @@ class Recursion(Condition):
             if node.class_ is target.class_:
                 depth += 1
         return self.maxdepth >= depth
+
+
+class Operand(object):
+    """
+    Statistics of operand of adaptive condition.
+
+    ..  attribute:: condition
+
+        Wrapped condition.
+
+    ..  attribute:: calls
+
+        Number of evaluations of the condition.
+
+    ..  attribute:: passes
+
+        Number of evaluations, which have returned ``True``.
+
+    ..  attribute:: time
+
+        Total time of evaluations in seconds.
+
+    """
+
+    __slots__ = ('condition', 'calls', 'passes', 'time')
+
+    def __init__(self, condition):
+        self.condition = condition
+        self.calls = 0
+        self.passes = 0
+        self.time = 0.0
+
+    def __call__(self, route):
+        start = default_timer()
+        result = self.condition(route)
+        self.time += default_timer() - start
+        self.calls += 1
+        if result:
+            self.passes += 1
+        return result
+
+    @property
+    def cost(self):
+        """ Average evaluation time """
+        return self.time / self.calls if self.calls else 0.0
+
+    @property
+    def rate(self):
+        """ Pass rate, i.e. ``passes / calls`` """
+        return float(self.passes) / self.calls if self.calls else 0.5
+
+    def __repr__(self):
+        return '<%s: %r calls=%s passes=%s time=%.6f>' % (
+            self.__class__.__name__, self.condition,
+            self.calls, self.passes, self.time,
+        )
+
+
+class Adaptive(Condition):
+    """
+    Base class of n-ary condition, that reorders its operands.
+
+    Each operand is wrapped by :class:`Operand`, which tracks its evaluation
+    time and pass rate.  Every ``period`` evaluations the operands are sorted
+    by ratio of average cost to probability of short-circuit.  So cheap
+    and selective operands are evaluated first.  Operands, that have not been
+    evaluated yet, go first to collect their statistics.
+
+    Statistics are collected without locking, so they are approximate
+    under concurrent evaluation.
+
+    It does not have to be used directly.  Use :func:`adaptive` instead.
+
+    :param conditions: Sequence of conditions.
+    :param int period: Number of evaluations between reorderings.
+
+    ..  attribute:: operands
+
+        List of :class:`Operand` objects in the current evaluation order.
+
+    """
+
+    def __init__(self, conditions, period=1000):
+        self.operands = [Operand(condition) for condition in conditions]
+        self.period = period
+        self._countdown = period
+
+    @property
+    def commutative(self):
+        return all(op.condition.commutative for op in self.operands)
+
+    def _shortcut(self, operand):  # pragma: no cover
+        raise NotImplementedError('The method should be overridden')
+
+    def _rank(self, operand):
+        if not operand.calls:
+            return -1.0
+        probability = self._shortcut(operand)
+        if not probability:
+            return float('inf')
+        return operand.cost / probability
+
+    def reorder(self):
+        """
+        Sorts operands by their statistics.
+
+        It is called automatically every ``period`` evaluations.
+
+        """
+        self._countdown = self.period
+        self.operands = sorted(self.operands, key=self._rank)
+
+    def _tick(self):
+        self._countdown -= 1
+        if self._countdown <= 0:
+            self.reorder()
+
+    def stats(self):
+        """
+        Returns statistics of operands.
+
+        :return: List of dictionaries with keys ``condition``, ``calls``,
+                 ``passes``, and ``time`` in the current evaluation order.
+        :rtype: list
+
+        """
+        return [
+            {
+                'condition': op.condition,
+                'calls': op.calls,
+                'passes': op.passes,
+                'time': op.time,
+            }
+            for op in self.operands
+        ]
+
+    def __repr__(self):
+        conditions = ', '.join(repr(op.condition) for op in self.operands)
+        return '%s(%s)' % (self.__class__.__name__, conditions)
+
+
+class AdaptiveAnd(Adaptive):
+    """
+    Adaptive n-ary version of :class:`And`.
+
+    Operand short-circuits the condition, when it returns ``False``.
+
+    """
+
+    def _shortcut(self, operand):
+        return 1.0 - operand.rate
+
+    def __call__(self, route):
+        result = all(operand(route) for operand in self.operands)
+        self._tick()
+        return result
+
+
+class AdaptiveOr(Adaptive):
+    """
+    Adaptive n-ary version of :class:`Or`.
+
+    Operand short-circuits the condition, when it returns ``True``.
+
+    """
+
+    def _shortcut(self, operand):
+        return operand.rate
+
+    def __call__(self, route):
+        result = any(operand(route) for operand in self.operands)
+        self._tick()
+        return result
+
+
+def _flatten(condition, class_):
+    if condition.__class__ is class_:
+        return _flatten(condition.left, class_) + \
+            _flatten(condition.rigth, class_)
+    return [condition]
+
+
+def adaptive(condition, period=1000):
+    """
+    Converts condition into adaptive one.
+
+    Nested :class:`And` and :class:`Or` conditions are flattened
+    into :class:`AdaptiveAnd` and :class:`AdaptiveOr` ones.
+    Other conditions are returned as is.
+
+    :param Condition condition: Condition to convert.
+    :param int period: Number of evaluations between reorderings
+                       of operands.
+    :return: Adaptive condition.
+
+    ..  doctest::
+
+        >>> from traversalkit import Resource, DEC_ID
+
+        >>> class Expensive(Condition):
+        ...     def __call__(self, route):
+        ...         return sum(range(10000)) > 0
+
+        >>> class Blog(Resource):
+        ...     ''' Blog root resource '''
+
+        >>> @Blog.mount('posts')
+        ... @Blog.mount('drafts')
+        ... class Posts(Resource):
+        ...     ''' Blog posts collection '''
+
+        >>> condition = adaptive(Expensive() & ~Under('drafts'), period=10)
+        >>> condition
+        AdaptiveAnd(Expensive(), Not(Under('drafts')))
+
+        >>> @Posts.mount_set(DEC_ID, metaname='post_id', complies=condition)
+        ... class Post(Resource):
+        ...     ''' Blog post '''
+
+        >>> blog = Blog()
+        >>> blog['posts']['1']
+        <Post: /posts/1/>
+        >>> for i in range(20):
+        ...     assert blog['drafts'].find(str(i)) is None
+        >>> condition
+        AdaptiveAnd(Not(Under('drafts')), Expensive())
+        >>> [stat['calls'] for stat in condition.stats()]
+        [21, 10]
+
+    """
+    if condition.__class__ in (And, Or):
+        class_ = AdaptiveAnd if condition.__class__ is And else AdaptiveOr
+        conditions = _flatten(condition, condition.__class__)
+        return class_([adaptive(c, period) for c in conditions], period)
+    if condition.__class__ is Not:
+        return Not(adaptive(condition.condition, period))
+    return condition
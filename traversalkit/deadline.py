@@ -0,0 +1,139 @@
+"""
+The module provides per-traversal deadlines.
+
+A single slow :meth:`traversalkit.resource.Resource.on_init` deep in a path
+can take the whole request time.  Deadline is attached to the current thread
+by :func:`deadline` context manager.  It is checked before each child
+resource is created, and when it is exceeded, :class:`TraversalTimeout`
+is raised.  Cached resources are returned regardless of the deadline,
+because they cost nothing.
+
+Implementations of :meth:`traversalkit.resource.Resource.on_init` can use
+:func:`remaining` to set timeouts of their own I/O.
+
+..  doctest::
+
+    >>> from traversalkit import Resource, DEC_ID
+
+    >>> class Users(Resource):
+    ...     ''' Collection of users '''
+
+    >>> @Users.mount_set(DEC_ID, metaname='user_id')
+    ... class User(Resource):
+    ...     ''' User resource '''
+    ...     def on_init(self, payload):
+    ...         self.timeout = remaining()
+
+    >>> @User.mount('posts')
+    ... class Posts(Resource):
+    ...     ''' Collection of posts '''
+
+    >>> users = Users()
+    >>> users['1'].timeout is None
+    True
+    >>> with deadline(5):
+    ...     0 < users['2'].timeout <= 5
+    True
+
+    >>> try:
+    ...     with deadline(0):
+    ...         posts = users['1']['posts']
+    ... except TraversalTimeout as e:
+    ...     timeout = e
+    >>> timeout.name
+    'posts'
+    >>> timeout.resource    # Partial result
+    <User: /1/>
+
+Deadline is bound to the current thread, so it is not propagated into
+executors, i.e. the one passed into
+:meth:`traversalkit.resource.Resource.prefetch`.
+
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+
+clock = getattr(time, 'monotonic', time.time)
+
+
+class State(threading.local):
+    """ Deadline of the current thread """
+
+    deadline = None
+
+
+state = State()
+
+
+class TraversalTimeout(Exception):
+    """
+    Exception, which is raised, when traversal deadline is exceeded.
+
+    ..  attribute:: name
+
+        Name of the child resource, that has not been created.
+
+    ..  attribute:: resource
+
+        The last resource, that has been reached, i.e. partial result
+        of the traversal.
+
+    """
+
+    def __init__(self, name, resource):
+        super(TraversalTimeout, self).__init__(name, resource.uri)
+        self.name = name
+        self.resource = resource
+
+
+@contextmanager
+def deadline(timeout):
+    """
+    Context manager, which sets deadline of traversal.
+
+    Nested deadlines cannot extend outer ones.
+
+    :param float timeout: Time budget in seconds.
+
+    """
+    previous = state.deadline
+    current = clock() + timeout
+    if previous is not None and previous < current:
+        current = previous
+    state.deadline = current
+    try:
+        yield
+    finally:
+        state.deadline = previous
+
+
+def remaining():
+    """
+    Returns remaining time budget of the current traversal.
+
+    :return: Seconds until the deadline, which is never negative,
+             or ``None``, if there is no deadline.
+    :rtype: float
+
+    """
+    if state.deadline is None:
+        return None
+    return max(state.deadline - clock(), 0.0)
+
+
+def check(name, resource):
+    """
+    Raises :class:`TraversalTimeout`, if the deadline is exceeded.
+
+    It is called by :class:`traversalkit.resource.Resource` before
+    creating child resource.
+
+    :param str name: Name of the child resource.
+    :param Resource resource: Parent resource.
+
+    """
+    if state.deadline is not None and clock() >= state.deadline:
+        raise TraversalTimeout(name, resource)
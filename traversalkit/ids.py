@@ -1,6 +1,12 @@
-"""
+r"""
 The module provides most common ID patterns.
 
+Each pattern is a matcher object, i.e. an object with ``match`` method,
+that accepts resource name and returns true value if the name matches the
+pattern.  Stock patterns avoid regular expression calls on the most common
+cases, but give the same results as the regular expressions they
+are described by.  Original regular expression is available through
+``regex`` attribute of the matcher, and its source through ``pattern`` one.
 
 ..  data:: ANY_ID
 
@@ -20,12 +26,239 @@ The module provides most common ID patterns.
 
     Matches single word: ``^[\w\-]+$``
 
+
+..  data:: UUID_ID
+
+    Matches UUID in canonical form:
+    ``^[a-f\d]{8}-[a-f\d]{4}-[a-f\d]{4}-[a-f\d]{4}-[a-f\d]{12}$``
+
+Besides stock patterns and compiled regular expressions,
+:meth:`traversalkit.resource.Resource.mount_set` accepts plain callables,
+which are wrapped by :class:`Predicate`.
+
 """
 
 import re
+from string import ascii_letters, digits, hexdigits
+
+# For compatibility between Python 2.x and Python 3.x
+try:  # pragma: no cover
+    string = basestring
+except NameError:  # pragma: no cover
+    string = str
+
+# ``str.isascii`` is available since Python 3.7.  Without it, the fast path
+# does not pay off the overhead of Python-level call, so stock matchers
+# use their regular expressions directly.
+try:
+    isascii = str.isascii
+except AttributeError:  # pragma: no cover
+    isascii = None
+
+
+class Matcher(object):
+    """
+    Base class of ID matcher.
+
+    Matches resource name using regular expression.  Derived classes
+    should override :meth:`match` method to provide fast path
+    and fall back to the regular expression via ``super()``.
+
+    :param str pattern: Regular expression.
+    :param int flags: Regular expression flags.
+    :param callable convert: Optional function to convert matched name
+                             into resource key.  See ``converter``
+                             parameter of
+                             :meth:`traversalkit.resource.Resource.mount_set`.
+
+    ..  doctest::
+
+        >>> matcher = Matcher(r'^[a-z]+$')
+        >>> matcher.match('foo')
+        True
+        >>> matcher.match('Foo')
+        False
+        >>> matcher.pattern
+        '^[a-z]+$'
+
+        >>> matcher = Matcher(r'^-?[0-9]+$', convert=int)
+        >>> matcher.convert('-42')
+        -42
+
+    """
+
+    def __init__(self, pattern, flags=0, convert=None):
+        self.pattern = pattern
+        self.regex = re.compile(pattern, flags)
+        self.convert = convert
+
+    def match(self, name):
+        """
+        Tests resource name.
+
+        :param str name: Resource name.
+        :return: ``True`` if name matches the pattern.
+        :rtype: bool
+
+        """
+        return self.regex.match(name) is not None
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self.pattern)
+
+
+class AnyMatcher(Matcher):
+    """ Matcher, that matches everything """
+
+    def __init__(self):
+        super(AnyMatcher, self).__init__(r'.*')
+
+    def match(self, name):
+        return True
+
+    def __repr__(self):
+        return '%s()' % self.__class__.__name__
+
+
+class CharsetMatcher(Matcher):
+    """
+    Matcher of non-empty names, that consist of the given characters.
+
+    :param str pattern: Regular expression equivalent to the charset.
+    :param str chars: Allowed characters.
+    :param int flags: Regular expression flags.
+    :param callable convert: Optional function to convert matched name
+                             into resource key.
+
+    The fast path is a single ``str.strip`` call.  If it fails on a name
+    that contains non-ASCII characters or a trailing newline, the name is
+    tested by the regular expression, so that the result is the same,
+    even if the expression matches characters out of the charset
+    (i.e. unicode ones).
+
+    The fast path requires ``str.isascii``, which is available since
+    Python 3.7.  On older versions, :meth:`match` is the ``match`` method
+    of the regular expression, which returns match object or ``None``.
+
+    ..  doctest::
+
+        >>> matcher = CharsetMatcher(r'^[ab]+$', 'ab')
+        >>> bool(matcher.match('abba'))
+        True
+        >>> bool(matcher.match('abc'))
+        False
+        >>> bool(matcher.match(''))
+        False
+
+    """
+
+    def __init__(self, pattern, chars, flags=0, convert=None):
+        super(CharsetMatcher, self).__init__(pattern, flags, convert)
+        self.chars = chars
+        if isascii is None:  # pragma: no cover
+            self.match = self.regex.match
+
+    def match(self, name):
+        rest = name.strip(self.chars)
+        if not rest:
+            return bool(name)
+        if isascii(rest) and rest[-1] != '\n':
+            return False
+        return self.regex.match(name) is not None
+
+
+class UUIDMatcher(Matcher):
+    """ Matcher of UUID in canonical form """
+
+    def __init__(self):
+        super(UUIDMatcher, self).__init__(
+            r'^[a-f\d]{8}-[a-f\d]{4}-[a-f\d]{4}-[a-f\d]{4}-[a-f\d]{12}$',
+            re.I,
+        )
+        self.chars = hexdigits + '-'
+        if isascii is None:  # pragma: no cover
+            self.match = self.regex.match
+
+    def match(self, name):
+        if len(name) == 36 and name[8:24:5] == '----' and \
+           name.count('-') == 4 and not name.strip(self.chars):
+            return True
+        if isascii(name) and name[-1:] != '\n':
+            return False
+        return self.regex.match(name) is not None
+
+    def __repr__(self):
+        return '%s()' % self.__class__.__name__
+
+
+class Predicate(object):
+    """
+    Matcher, that wraps a callable.
+
+    :param callable func: Function, that accepts resource name and returns
+                          a value, which is treated as a boolean.
+    :param str pattern: Pattern description, that is used for
+                        documentation purposes.  Name of the function
+                        is used by default.
+    :param callable convert: Optional function to convert matched name
+                             into resource key.
+
+    ..  doctest::
+
+        >>> matcher = Predicate(str.isupper)
+        >>> matcher.match('ABC')
+        True
+        >>> matcher.match('abc')
+        False
+        >>> matcher.pattern
+        'isupper'
+
+    """
+
+    def __init__(self, func, pattern=None, convert=None):
+        self.func = func
+        self.pattern = pattern or getattr(func, '__name__', repr(func))
+        self.convert = convert
+
+    def match(self, name):
+        return bool(self.func(name))
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self.func)
+
+
+def matcher(pattern):
+    """
+    Converts pattern to matcher.
+
+    :param pattern: Matcher, i.e. object with ``match`` method
+                    (compiled regular expression is also a matcher),
+                    string with regular expression, or callable.
+    :return: Matcher.
+
+    ..  doctest::
+
+        >>> matcher(DEC_ID) is DEC_ID
+        True
+        >>> matcher(r'^[a-z]+$')
+        Matcher('^[a-z]+$')
+        >>> matcher(str.isupper)  # DOCTEST: +ellipsis
+        Predicate(<method 'isupper' of 'str' objects>)
+
+    """
+    if hasattr(pattern, 'match'):
+        return pattern
+    if isinstance(pattern, string):
+        return Matcher(pattern)
+    if callable(pattern):
+        return Predicate(pattern)
+    raise TypeError('Unsupported pattern: %r' % (pattern,))
 
 
-ANY_ID = re.compile(r'.*')
-DEC_ID = re.compile(r'^[\d]+$')
-HEX_ID = re.compile(r'^[a-f\d]+$', re.I)
-TEXT_ID = re.compile(r'^[\w\-]+$', re.I)
+ANY_ID = AnyMatcher()
+DEC_ID = CharsetMatcher(r'^[\d]+$', digits)
+HEX_ID = CharsetMatcher(r'^[a-f\d]+$', hexdigits, re.I)
+TEXT_ID = CharsetMatcher(r'^[\w\-]+$',
+                         ascii_letters + digits + '_-',
+                         re.I)
+UUID_ID = UUIDMatcher()
@@ -0,0 +1,139 @@
+"""
+The module provides inherited attributes of resources.
+
+Some attributes of resources, i.e. ``__acl__``, tenant, locale, or feature
+flags, are inherited from parent resources.  Resolving them by walking
+:meth:`traversalkit.resource.Resource.lineage` on every access is costly.
+:class:`inherited` resolves the effective value once per resource
+from the cached effective value of the parent and the own value
+of the resource.
+
+"""
+
+import threading
+
+
+MISSING = object()
+
+
+class inherited(object):
+    """
+    Descriptor of inherited attribute.
+
+    :param str name: Name of the own attribute of resources.
+    :param callable merge: Optional function, that accepts own value of
+                           resource and effective value of its parent
+                           and returns effective value of the resource.
+                           By default, own value overrides inherited one.
+    :param default: Effective value of the root resource, which does not
+                    have own value.
+
+    Effective values are cached by resources.  Each cached value refers
+    to the cached value of the parent, which it has been resolved from.
+    So access walks the lineage to validate the cache, but values are
+    merged again only for the changed resource and its descendants.
+    The cache of the resource is invalidated, when its own value is changed
+    through the descriptor (i.e. ``resource.effective_acl = [...]`` sets
+    ``resource.__acl__``).  If the own attribute is changed directly,
+    call :meth:`invalidate` passing the resource.
+
+    ..  doctest::
+
+        >>> from traversalkit import Resource, DEC_ID
+
+        >>> class Base(Resource):
+        ...     ''' Base resource '''
+        ...     locale = inherited('__locale__', default='en')
+        ...     acl = inherited('__acl__', default=[],
+        ...                     merge=lambda own, parent: own + parent)
+
+        >>> class Root(Base):
+        ...     ''' Site root '''
+        ...     __acl__ = [('Allow', 'admin', 'edit')]
+
+        >>> @Root.mount('users')
+        ... class Users(Base):
+        ...     ''' Collection of users '''
+        ...     __locale__ = 'fr'
+
+        >>> @Users.mount_set(DEC_ID, metaname='user_id')
+        ... class User(Base):
+        ...     ''' User resource '''
+        ...     def on_init(self, payload):
+        ...         self.__acl__ = [('Allow', 'user:' + self.__name__, 'edit')]
+
+        >>> root = Root()
+        >>> user = root['users']['1']
+        >>> user.locale
+        'fr'
+        >>> user.acl
+        [('Allow', 'user:1', 'edit'), ('Allow', 'admin', 'edit')]
+        >>> root.locale
+        'en'
+
+        >>> root.locale = 'de'
+        >>> root['users'].locale = None
+        >>> user.locale
+        'de'
+
+    """
+
+    def __init__(self, name, merge=None, default=None):
+        self.name = name
+        self.merge = merge
+        self.default = default
+        self.generation = 0
+        self._lock = threading.Lock()
+
+    def __get__(self, resource, class_=None):
+        if resource is None:
+            return self
+        return self._entry(resource)[2]
+
+    def _entry(self, resource):
+        # Entry is a tuple of generation, entry of the parent, which it
+        # has been resolved from, and effective value.  Entries are
+        # replaced, but never modified, so the parent entry is compared
+        # by identity.
+        generation = self.generation
+        entry = None
+        for resource in reversed(list(resource.lineage())):
+            cache = resource.__dict__.get('__inherited__')
+            cached = cache.get(self) if cache is not None else None
+            if cached is not None and cached[0] == generation and \
+               cached[1] is entry:
+                entry = cached
+                continue
+            value = self.default if entry is None else entry[2]
+            own = getattr(resource, self.name, MISSING)
+            if own is not MISSING and own is not None:
+                value = own if self.merge is None else self.merge(own, value)
+            entry = (generation, entry, value)
+            if cache is None:
+                cache = resource.__dict__.setdefault('__inherited__', {})
+            cache[self] = entry
+        return entry
+
+    def __set__(self, resource, value):
+        setattr(resource, self.name, value)
+        self.invalidate(resource)
+
+    def invalidate(self, resource=None):
+        """
+        Invalidates cached effective values.
+
+        :param Resource resource: Resource, which own value has been changed.
+                                  Cached values of the resource and its
+                                  descendants are invalidated.  If it is not
+                                  passed, cached values of all resources
+                                  of all trees are invalidated, so they will
+                                  be merged again on next access.
+
+        """
+        if resource is not None:
+            cache = resource.__dict__.get('__inherited__')
+            if cache is not None:
+                cache.pop(self, None)
+            return
+        with self._lock:
+            self.generation += 1
@@ -0,0 +1,273 @@
+"""
+The module provides latency metrics of resource trees.
+
+Latencies are aggregated per route template, i.e. :attr:`Route.uri`
+like ``/users/{user_id}/posts/``, rather than per concrete path.
+So the number of series is bounded by the number of routes.
+
+..  doctest::
+
+    >>> from traversalkit import Resource, DEC_ID
+
+    >>> class Users(Resource):
+    ...     ''' Collection of users '''
+
+    >>> @Users.mount_set(DEC_ID, metaname='user_id')
+    ... class User(Resource):
+    ...     ''' User resource '''
+
+    >>> @User.mount('posts')
+    ... class Posts(Resource):
+    ...     ''' Collection of posts '''
+
+    >>> metrics = Metrics(buckets=[0.001, 0.1])
+    >>> users = metrics.attach(Users())
+    >>> metrics.resolve(users, '/1/posts/')
+    <Posts: /1/posts/>
+    >>> posts = users['2']['posts']
+    >>> print(metrics.export())  # DOCTEST: +ellipsis
+    # HELP traversalkit_create_seconds Time of child resource creation.
+    # TYPE traversalkit_create_seconds histogram
+    traversalkit_create_seconds_bucket{route="/{user_id}/",le="0.001"} 2
+    traversalkit_create_seconds_bucket{route="/{user_id}/",le="0.1"} 2
+    traversalkit_create_seconds_bucket{route="/{user_id}/",le="+Inf"} 2
+    traversalkit_create_seconds_sum{route="/{user_id}/"} ...
+    traversalkit_create_seconds_count{route="/{user_id}/"} 2
+    ...
+    traversalkit_resolve_seconds_count{route="/{user_id}/posts/"} 1
+
+"""
+
+import bisect
+import logging
+import threading
+import time
+from collections import deque
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+)
+
+
+class Histogram(object):
+    """
+    Latency histogram with fixed buckets.
+
+    :param buckets: Sorted sequence of upper bounds of buckets in seconds.
+
+    ..  doctest::
+
+        >>> histogram = Histogram([0.1, 1.0])
+        >>> histogram.observe(0.05)
+        >>> histogram.observe(0.5)
+        >>> histogram.observe(5)
+        >>> histogram.counts
+        [1, 1, 1]
+        >>> histogram.count
+        3
+        >>> histogram.cumulative()
+        [(0.1, 1), (1.0, 2), (inf, 3)]
+
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        """
+        Adds observed value into the histogram.
+
+        :param float value: Latency in seconds.
+
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self):
+        """
+        Returns cumulative counts of buckets.
+
+        :return: List of pairs of upper bound and number of values,
+                 that are less than or equal to the bound.  The last bound
+                 is infinity.
+
+        """
+        result = []
+        total = 0
+        for bound, count in zip(self.buckets + [float('inf')], self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class Metrics(object):
+    """
+    Route-keyed latency metrics of resource tree.
+
+    There are two families of histograms:
+
+    *   ``create`` is time of child resource creation, including its
+        :meth:`traversalkit.resource.Resource.on_init`.  It is observed
+        automatically for all resources of the tree, which the metrics
+        are attached to by :meth:`attach`.
+    *   ``resolve`` is time of full path resolution by :meth:`resolve`,
+        including cached levels.
+
+    :param buckets: Upper bounds of histogram buckets in seconds.
+    :param float slow: Threshold of slow traversal in seconds.  If the path
+                       resolution by :meth:`resolve` takes longer, its
+                       per-level breakdown is logged into :attr:`slow_log`
+                       and into ``traversalkit.metrics`` logger with
+                       ``WARNING`` level.  Optional.
+    :param int maxlog: Maximum number of entries in :attr:`slow_log`.
+
+    ..  attribute:: slow_log
+
+        Recent slow traversals.  Each entry is a dictionary with keys
+        ``path``, ``time``, and ``levels``, which is a list of pairs
+        of resource route templates and time spent on the level.
+
+    """
+
+    clock = staticmethod(getattr(time, 'perf_counter', time.time))
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, slow=None, maxlog=100):
+        self.buckets = buckets
+        self.slow = slow
+        self.slow_log = deque(maxlen=maxlog)
+        self._create = {}
+        self._resolve = {}
+        self._lock = threading.Lock()
+
+    def attach(self, root):
+        """
+        Attaches the metrics to the resource tree.
+
+        Child resources inherit the metrics on creation.
+
+        :param Resource root: Root resource of the tree.
+        :return: The root resource.
+
+        """
+        root.__metrics__ = self
+        return root
+
+    def _observe(self, histograms, route, value):
+        with self._lock:
+            histogram = histograms.get(route)
+            if histogram is None:
+                histogram = histograms[route] = Histogram(self.buckets)
+            histogram.observe(value)
+
+    def observe_create(self, route, value):
+        """
+        Observes time of child resource creation.
+
+        It is called by :class:`traversalkit.resource.Resource`
+        automatically.
+
+        :param Route route: Route of the created resource.
+        :param float value: Time in seconds.
+
+        """
+        self._observe(self._create, route, value)
+
+    def resolve(self, resource, path):
+        """
+        Resolves path and observes its time.
+
+        :param Resource resource: Resource to start from.
+        :param str path: Path relative to the resource,
+                         i.e. ``'/users/1/'`` or ``'users/1'``.
+        :return: Target resource.
+        :raises KeyError: If the path cannot be resolved.
+
+        """
+        levels = []
+        start = last = self.clock()
+        for name in path.split('/'):
+            if not name:
+                continue
+            resource = resource[name]
+            now = self.clock()
+            levels.append((resource.__route__.uri, now - last))
+            last = now
+        total = last - start
+        self._observe(self._resolve, resource.__route__, total)
+        if self.slow is not None and total > self.slow:
+            self.slow_log.append({
+                'path': path,
+                'time': total,
+                'levels': levels,
+            })
+            logger.warning(
+                'Slow traversal %s took %.6fs: %s', path, total,
+                ', '.join('%s %.6fs' % level for level in levels),
+            )
+        return resource
+
+    def histograms(self, family):
+        """
+        Returns histograms of the family.
+
+        :param str family: Either ``'create'`` or ``'resolve'``.
+        :return: Dictionary, where keys are route templates and values
+                 are :class:`Histogram` objects.  Histograms of different
+                 routes of the same template are merged.
+        :rtype: dict
+
+        """
+        source = self._create if family == 'create' else self._resolve
+        result = {}
+        with self._lock:
+            for route, histogram in source.items():
+                target = result.get(route.uri)
+                if target is None:
+                    target = result[route.uri] = Histogram(self.buckets)
+                for i, count in enumerate(histogram.counts):
+                    target.counts[i] += count
+                target.count += histogram.count
+                target.sum += histogram.sum
+        return result
+
+    def export(self, prefix='traversalkit'):
+        """
+        Exports histograms in Prometheus text format.
+
+        :param str prefix: Prefix of metric names.
+        :rtype: str
+
+        """
+        lines = []
+        families = (
+            ('create', 'Time of child resource creation.'),
+            ('resolve', 'Time of path resolution.'),
+        )
+        for family, description in families:
+            name = '%s_%s_seconds' % (prefix, family)
+            lines.append('# HELP %s %s' % (name, description))
+            lines.append('# TYPE %s histogram' % name)
+            histograms = self.histograms(family)
+            for uri in sorted(histograms):
+                histogram = histograms[uri]
+                label = uri.replace('\\', '\\\\').replace('"', '\\"')
+                label = 'route="%s"' % label
+                for bound, count in histogram.cumulative():
+                    bound = '+Inf' if bound == float('inf') else repr(bound)
+                    lines.append('%s_bucket{%s,le="%s"} %s' % (
+                        name, label, bound, count,
+                    ))
+                lines.append('%s_sum{%s} %r' % (name, label, histogram.sum))
+                lines.append('%s_count{%s} %s' % (
+                    name, label, histogram.count,
+                ))
+        return '\n'.join(lines)
@@ -0,0 +1,65 @@
+"""
+The module provides descriptor of missing child resource.
+
+It is separated from :mod:`traversalkit.resource`, so that modules, which
+the latter depends on, i.e. :mod:`traversalkit.cache`, can use it too.
+
+"""
+
+
+class Miss(object):
+    """
+    Descriptor of missing child resource.
+
+    It is returned by :meth:`traversalkit.resource.Resource.lookup`
+    instead of raising ``KeyError``.  It is always treated as ``False``.
+
+    :param str reason: Reason of the miss, one of the following constants.
+    :param str name: Name of the missing resource.
+    :param Resource parent: Resource, where the lookup has been done.
+
+    ..  attribute:: NO_ROUTE
+
+        Name does not match any route.
+
+    ..  attribute:: CONDITION
+
+        Current route does not comply route condition.
+
+    ..  attribute:: NOT_EXIST
+
+        Resource has raised an exception listed in
+        :attr:`traversalkit.resource.Resource.__not_exist__`.
+
+    """
+
+    NO_ROUTE = 'no_route'
+    CONDITION = 'condition'
+    NOT_EXIST = 'not_exist'
+
+    __slots__ = ('reason', 'name', 'parent')
+
+    def __init__(self, reason, name, parent):
+        self.reason = reason
+        self.name = name
+        self.parent = parent
+
+    def __bool__(self):
+        return False
+
+    __nonzero__ = __bool__
+
+    def error(self):
+        """
+        Returns ``KeyError`` equivalent to the miss.
+
+        It is the same error, that is raised by
+        :meth:`traversalkit.resource.Resource.get`.
+
+        """
+        return KeyError(self.name, self.parent.uri)
+
+    def __repr__(self):
+        return '<%s: %s %s>' % (self.__class__.__name__,
+                                self.reason,
+                                self.name)
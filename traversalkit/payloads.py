@@ -0,0 +1,299 @@
+"""
+The module provides cross-process cache of resource payloads.
+
+Each worker process creates its own resource trees, so without a shared
+cache the same payloads are fetched from the backend by each worker.
+:class:`PayloadCache` loads payloads of child resources before their
+:meth:`traversalkit.resource.Resource.on_init` is invoked and caches them
+in a pluggable backend.  :class:`MemoryBackend` keeps them within the
+process, :class:`SQLiteBackend` shares them between processes on one host.
+
+The cache is passed into :meth:`traversalkit.resource.Resource.mount_set`
+or :meth:`traversalkit.resource.Resource.mount` as ``payloads`` parameter.
+
+..  doctest::
+
+    >>> from traversalkit import Resource, DEC_ID
+
+    >>> DB = {'1': {'name': 'John'}, '2': {'name': 'Jane'}}
+    >>> def fetch_user(parent, name):
+    ...     print('Fetching user %s' % name)
+    ...     return DB.get(name)
+
+    >>> users_cache = PayloadCache(fetch_user, MemoryBackend(), ttl=60)
+
+    >>> class Users(Resource):
+    ...     ''' Collection of users '''
+
+    >>> @Users.mount_set(DEC_ID, metaname='user_id', payloads=users_cache)
+    ... class User(Resource):  #                      ^^^^^^^^^^^^^^^^^^^^
+    ...     ''' User resource '''
+    ...     def on_init(self, payload):
+    ...         self.name = payload['name']
+
+    >>> Users()['1'].name
+    Fetching user 1
+    'John'
+    >>> Users()['1'].name      # Another tree, i.e. another request
+    'John'
+    >>> users_cache.stats()['hits'], users_cache.stats()['misses']
+    (1, 1)
+
+"""
+
+import pickle
+import sqlite3
+import threading
+import time
+import os
+
+
+class MemoryBackend(object):
+    """
+    In-process backend of :class:`PayloadCache`.
+
+    Payloads are stored as is, so they should not be modified.
+
+    """
+
+    clock = staticmethod(time.time)
+
+    def __init__(self):
+        self._items = {}
+
+    def get(self, key):
+        """
+        Returns cached payload or ``None``.
+
+        """
+        item = self._items.get(key)
+        if item is None:
+            return None
+        value, expires = item
+        if self.clock() >= expires:
+            self._items.pop(key, None)
+            return None
+        return value
+
+    def set(self, key, value, ttl):
+        """
+        Stores payload for ``ttl`` seconds.
+
+        """
+        self._items[key] = (value, self.clock() + ttl)
+
+    def purge(self):
+        """
+        Removes expired payloads.
+
+        """
+        now = self.clock()
+        for key, (value, expires) in list(self._items.items()):
+            if now >= expires:
+                self._items.pop(key, None)
+
+    def clear(self):
+        """
+        Removes all payloads.
+
+        """
+        self._items.clear()
+
+
+class SQLiteBackend(object):
+    """
+    SQLite backend of :class:`PayloadCache`.
+
+    Payloads are pickled and stored into SQLite database file, which can be
+    shared by multiple processes on one host.  Each thread of each process
+    uses its own connection, which is opened on first use.  So the backend
+    can be created before worker processes are forked.
+
+    ..  warning::
+
+        Unpickling can execute arbitrary code, so the database file must be
+        trusted, i.e. it must not be writable by other users.
+
+    :param str path: Path to the database file.
+    :param str table: Name of the table.
+    :param float timeout: Timeout of database lock in seconds.
+
+    """
+
+    clock = staticmethod(time.time)
+
+    def __init__(self, path, table='payloads', timeout=5.0):
+        self.path = path
+        self.table = table
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout,
+                                         isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS %s ('
+                'key TEXT PRIMARY KEY, value BLOB, expires REAL)' % self.table
+            )
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def get(self, key):
+        """
+        Returns cached payload or ``None``.
+
+        """
+        row = self._connection().execute(
+            'SELECT value, expires FROM %s WHERE key = ?' % self.table,
+            (key,),
+        ).fetchone()
+        if row is None or self.clock() >= row[1]:
+            return None
+        return pickle.loads(bytes(row[0]))
+
+    def set(self, key, value, ttl):
+        """
+        Stores payload for ``ttl`` seconds.
+
+        """
+        value = sqlite3.Binary(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        self._connection().execute(
+            'INSERT OR REPLACE INTO %s (key, value, expires) '
+            'VALUES (?, ?, ?)' % self.table,
+            (key, value, self.clock() + ttl),
+        )
+
+    def purge(self):
+        """
+        Removes expired payloads.
+
+        """
+        self._connection().execute(
+            'DELETE FROM %s WHERE expires <= ?' % self.table,
+            (self.clock(),),
+        )
+
+    def clear(self):
+        """
+        Removes all payloads.
+
+        """
+        self._connection().execute('DELETE FROM %s' % self.table)
+
+    def close(self):
+        """
+        Closes connection of the current thread.
+
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+class PayloadCache(object):
+    """
+    Cache of resource payloads.
+
+    Payloads are keyed by version, route template of the resource
+    (i.e. :attr:`traversalkit.route.Route.uri`), and names, that substitute
+    set nodes of the template, i.e. resource ``/users/1/posts/2/`` of
+    template ``/users/{user_id}/posts/{post_id}/`` is keyed by ``1/2``.
+    So the same backend can be shared by multiple caches.
+
+    :param callable loader: Function, which accepts parent resource and
+                            name of child resource and returns payload
+                            of the child or ``None``.  ``None`` payloads
+                            are not cached.
+    :param backend: Backend, i.e. :class:`MemoryBackend` (default) or
+                    :class:`SQLiteBackend`.
+    :param float ttl: Time to live of payloads in seconds.
+    :param version: Version of payloads.  Change it to invalidate payloads
+                    cached by previous versions of code.
+
+    """
+
+    def __init__(self, loader, backend=None, ttl=300, version=1):
+        self.loader = loader
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.ttl = ttl
+        self.version = version
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def key(self, template, values):
+        """
+        Returns backend key of payload.
+
+        :param str template: Route template of the resource.
+        :param str values: Names of the resource and its ancestors, that
+                           substitute set nodes of the template, joined
+                           by ``/``.
+        :rtype: str
+
+        """
+        return '%s:%s:%s' % (self.version, template, values)
+
+    def load(self, parent, node, name):
+        """
+        Returns payload of child resource.
+
+        It is called by :class:`traversalkit.resource.Resource` before
+        the child resource is created.
+
+        :param Resource parent: Parent resource.
+        :param Node node: Route node of the child resource.
+        :param str name: Name of the child resource.
+        :return: Payload or ``None``.
+
+        """
+        template = parent.__registry__.child(parent.__route__, node).uri
+        values = [name] if node.name is None else []
+        for resource in parent.lineage():
+            if resource.__node__.name is None:
+                values.append(resource.__name__)
+        values.reverse()
+        key = self.key(template, '/'.join(values))
+        payload = self.backend.get(key)
+        hit = payload is not None
+        if not hit:
+            payload = self.loader(parent, name)
+            if payload is not None:
+                self.backend.set(key, payload, self.ttl)
+        with self._lock:
+            stats = self._stats.get(template)
+            if stats is None:
+                stats = self._stats[template] = [0, 0]
+            stats[0 if hit else 1] += 1
+        return payload
+
+    def stats(self):
+        """
+        Returns hit statistics.
+
+        :return: Dictionary with keys ``hits``, ``misses``, ``hit_rate``,
+                 and ``routes``, which is a dictionary of the same
+                 statistics per route template.
+        :rtype: dict
+
+        """
+        def summary(hits, misses):
+            total = hits + misses
+            return {
+                'hits': hits,
+                'misses': misses,
+                'hit_rate': float(hits) / total if total else None,
+            }
+
+        with self._lock:
+            stats = dict((k, list(v)) for k, v in self._stats.items())
+        result = summary(sum(v[0] for v in stats.values()),
+                         sum(v[1] for v in stats.values()))
+        result['routes'] = dict(
+            (template, summary(*value)) for template, value in stats.items()
+        )
+        return result
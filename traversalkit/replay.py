@@ -0,0 +1,364 @@
+"""
+The module provides load generator, which replays request paths
+against resource trees.
+
+Microbenchmarks do not reflect real traffic mix.  The tool replays paths
+from access log, or synthesizes them from route templates of the root
+resource class, and reports throughput, latency percentiles, cache hit
+ratio, and peak memory.  So it can be used to compare cache policies
+and library versions on own workloads.
+
+Usage::
+
+    $ python -m traversalkit.replay myapp.resources:Root access.log \\
+          --concurrency 4 --shared
+    $ python -m traversalkit.replay myapp.resources:Root \\
+          --synthesize 100000 --ids 10000 --skew 1.2 --memory
+
+Each line of the paths file is either a path, i.e. ``/users/1/``, or a line
+of access log in Common Log Format, where the path is taken from the request
+line.  Query strings are dropped.
+
+..  doctest::
+
+    >>> from traversalkit import Resource, DEC_ID
+
+    >>> class Users(Resource):
+    ...     ''' Collection of users '''
+
+    >>> @Users.mount_set(DEC_ID, metaname='user_id')
+    ... class User(Resource):
+    ...     ''' User resource '''
+
+    >>> paths = synthesize(Users, 1000, ids=100, seed=42)
+    >>> len(paths), len(set(paths)) <= 100
+    (1000, True)
+    >>> report = replay(Users, paths, concurrency=2, shared=True)
+    >>> report['requests'], report['misses']
+    (1000, 0)
+    >>> 0.5 < report['hit_ratio'] < 1
+    True
+
+"""
+
+from __future__ import division, print_function
+
+import argparse
+import bisect
+import importlib
+import math
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+
+from .miss import Miss
+
+
+clock = getattr(time, 'perf_counter', time.time)
+
+try:  # pragma: no cover
+    import tracemalloc
+except ImportError:  # pragma: no cover
+    tracemalloc = None
+
+
+LOG_LINE = re.compile(r'"[A-Z]+ (\S+)[^"]*"')
+
+
+def load_paths(lines):
+    """
+    Loads request paths.
+
+    :param lines: Iterable of lines, i.e. opened file.  Each line is either
+                  a path or a line of access log in Common Log Format.
+                  Blank lines and lines starting with ``#`` are skipped.
+    :return: List of paths.
+
+    """
+    result = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        match = LOG_LINE.search(line)
+        if match is not None:
+            line = match.group(1)
+        result.append(line.split('?', 1)[0])
+    return result
+
+
+class Zipf(object):
+    """
+    Zipf distribution of integer IDs.
+
+    :param int size: Number of IDs, i.e. IDs are in range ``1..size``.
+    :param float skew: Exponent of the distribution.  The higher it is,
+                       the more popular the first IDs are.  Zero gives
+                       uniform distribution.
+    :param random.Random rand: Random number generator.
+
+    """
+
+    def __init__(self, size, skew=1.0, rand=random):
+        self.rand = rand
+        self.cumulative = []
+        total = 0.0
+        for rank in range(1, size + 1):
+            total += 1.0 / rank ** skew
+            self.cumulative.append(total)
+
+    def __call__(self):
+        value = self.rand.random() * self.cumulative[-1]
+        return bisect.bisect_left(self.cumulative, value) + 1
+
+
+def _name(node, id_):
+    for name in (str(id_), '%x' % id_, str(uuid.UUID(int=id_))):
+        if node.pattern.match(name):
+            return name
+    return None
+
+
+def synthesize(root_class, count, ids=1000, skew=1.0, seed=None,
+               maxroutes=10000):
+    """
+    Synthesizes request paths from route templates.
+
+    Routes are taken from
+    :meth:`traversalkit.resource.Resource.route_graph`, the root route
+    is skipped.  Each path is made of a random route, where each set node
+    is replaced by ID, which follows Zipf distribution.  IDs are formatted
+    as decimal, hex, or UUID, whichever the node pattern accepts.  Routes,
+    whose patterns accept none of them, are skipped.
+
+    :param Resource root_class: Root resource class.
+    :param int count: Number of paths.
+    :param int ids: Number of distinct IDs per set node.
+    :param float skew: Exponent of Zipf distribution.
+    :param seed: Seed of random number generator.
+    :param int maxroutes: Maximum number of routes to take.
+    :return: List of paths.
+
+    """
+    rand = random.Random(seed)
+    zipf = Zipf(ids, skew, rand)
+    routes = [
+        route
+        for route in root_class.route_graph().routes(limit=maxroutes)
+        if len(route) > 1
+    ]
+    if not routes:
+        raise ValueError('There are no routes at %r' % root_class)
+    result = []
+    while len(result) < count:
+        route = rand.choice(routes)
+        names = []
+        for node in route[1:]:
+            name = node.name if node.name is not None else \
+                _name(node, zipf())
+            if name is None:
+                break
+            names.append(name)
+        else:
+            result.append('/' + '/'.join(names) + '/')
+            continue
+        routes.remove(route)
+        if not routes:
+            raise ValueError('There are no routes at %r, that accept '
+                             'generated IDs' % root_class)
+    return result
+
+
+def percentile(values, percent):
+    """
+    Returns percentile of sorted values using nearest-rank method.
+
+    :param list values: Sorted values.
+    :param float percent: Percentile in range ``0..100``.
+
+    """
+    if not values:
+        return None
+    rank = int(math.ceil(percent / 100.0 * len(values))) - 1
+    return values[min(max(rank, 0), len(values) - 1)]
+
+
+def replay(root_class, paths, concurrency=1, shared=False, memory=False):
+    """
+    Replays request paths against resource trees.
+
+    :param Resource root_class: Root resource class.
+    :param list paths: Request paths.
+    :param int concurrency: Number of threads.
+    :param bool shared: Whether to use a single tree for all requests,
+                        otherwise each request gets fresh root resource.
+    :param bool memory: Whether to trace peak memory by :mod:`tracemalloc`,
+                        which slows the replay down.
+    :return: Report, i.e. dictionary with keys ``requests``, ``misses``
+             (i.e. paths, which raise ``KeyError``), ``seconds``,
+             ``throughput`` (requests per second), ``latency`` (dictionary
+             of percentiles ``p50``, ``p90``, ``p99``, and ``max``
+             in seconds), ``hit_ratio`` (ratio of path levels, which have
+             been found in cache), and ``peak_memory`` (bytes or ``None``).
+    :rtype: dict
+
+    """
+    shared_root = root_class() if shared else None
+    queue = iter(paths)
+    lock = threading.Lock()
+    latencies = []
+    counters = {'misses': 0, 'hits': 0, 'levels': 0}
+
+    def worker():
+        local_latencies = []
+        misses = hits = levels = 0
+        while True:
+            with lock:
+                path = next(queue, None)
+            if path is None:
+                break
+            names = [name for name in path.split('/') if name]
+            start = clock()
+            resource = shared_root if shared_root is not None \
+                else root_class()
+            for name in names:
+                levels += 1
+                # The hit is sampled by the same lookup, that resolves
+                # the path, so that cache is not queried twice.
+                child = resource._cached(name)
+                if child is not None:
+                    hits += 1
+                else:
+                    child = resource._resolve(name)
+                    if isinstance(child, Miss):
+                        misses += 1
+                        break
+                resource = child
+            local_latencies.append(clock() - start)
+        with lock:
+            latencies.extend(local_latencies)
+            counters['misses'] += misses
+            counters['hits'] += hits
+            counters['levels'] += levels
+
+    tracing = memory and tracemalloc is not None
+    if tracing:
+        tracemalloc.start()
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    start = clock()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = clock() - start
+    peak = None
+    if tracing:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'misses': counters['misses'],
+        'seconds': seconds,
+        'throughput': len(latencies) / seconds if seconds else None,
+        'latency': {
+            'p50': percentile(latencies, 50),
+            'p90': percentile(latencies, 90),
+            'p99': percentile(latencies, 99),
+            'max': latencies[-1] if latencies else None,
+        },
+        'hit_ratio': (float(counters['hits']) / counters['levels']
+                      if counters['levels'] else None),
+        'peak_memory': peak,
+    }
+
+
+def format_report(report):
+    """
+    Formats report of :func:`replay` as plain text.
+
+    :param dict report: Report.
+    :rtype: str
+
+    """
+    def ms(value):
+        return '-' if value is None else '%.3f ms' % (value * 1000)
+
+    lines = [
+        'Requests:    %s (%s misses)' % (report['requests'], report['misses']),
+        'Time:        %.3f s' % report['seconds'],
+        'Throughput:  %s' % ('-' if report['throughput'] is None
+                             else '%.1f req/s' % report['throughput']),
+        'Latency:     p50 %s, p90 %s, p99 %s, max %s' % tuple(
+            ms(report['latency'][key]) for key in ('p50', 'p90', 'p99', 'max')
+        ),
+        'Hit ratio:   %s' % ('-' if report['hit_ratio'] is None
+                             else '%.1f%%' % (report['hit_ratio'] * 100)),
+        'Peak memory: %s' % ('-' if report['peak_memory'] is None
+                             else '%.1f KiB' % (report['peak_memory'] / 1024)),
+    ]
+    return '\n'.join(lines)
+
+
+def load_class(spec):
+    """
+    Imports resource class by its spec, i.e. ``package.module:Root``.
+
+    """
+    module, _, name = spec.partition(':')
+    obj = importlib.import_module(module)
+    for attr in name.split('.'):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def main(argv=None, stdout=sys.stdout):
+    """
+    Command line entry point.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m traversalkit.replay',
+        description='Replays request paths against resource trees.',
+    )
+    parser.add_argument('root', help='root resource class, '
+                                     'i.e. package.module:Root')
+    parser.add_argument('paths', nargs='?',
+                        help='file of request paths or access log')
+    parser.add_argument('--synthesize', type=int, metavar='N',
+                        help='synthesize N paths from route templates')
+    parser.add_argument('--ids', type=int, default=1000,
+                        help='distinct IDs per set node (default: 1000)')
+    parser.add_argument('--skew', type=float, default=1.0,
+                        help='exponent of Zipf distribution of IDs '
+                             '(default: 1.0)')
+    parser.add_argument('--seed', type=int, help='random seed')
+    parser.add_argument('--concurrency', type=int, default=1,
+                        help='number of threads (default: 1)')
+    parser.add_argument('--shared', action='store_true',
+                        help='use a single tree for all requests')
+    parser.add_argument('--memory', action='store_true',
+                        help='trace peak memory using tracemalloc')
+    args = parser.parse_args(argv)
+
+    root_class = load_class(args.root)
+    if args.synthesize:
+        paths = synthesize(root_class, args.synthesize, args.ids, args.skew,
+                           args.seed)
+    elif args.paths:
+        with open(args.paths) as f:
+            paths = load_paths(f)
+    else:
+        parser.error('either paths file or --synthesize is required')
+    report = replay(root_class, paths, args.concurrency, args.shared,
+                    args.memory)
+    print(format_report(report), file=stdout)
+    return report
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
@@ -1,12 +1,57 @@
+import sys
 import weakref
-from itertools import chain
 from contextlib import contextmanager
 from warnings import warn
 
 from cached_property import cached_property
 
-from .route import Node, Route
-from .cache import Cache
+from .route import Node, Route, RouteGraph, registry
+from .cache import Cache, ForkCache, FrozenCache
+from .arena import Arena
+from .columns import Columns
+from .deadline import state as deadline_state, check as check_deadline
+from .miss import Miss
+
+
+class CacheProperty(object):
+    """
+    Lazy property of resource cache.
+
+    The cache is created on first access, so leaf resources, that never
+    have children, do not allocate it.  Unlike ``cached_property``,
+    it is safe to access the property from concurrent threads.
+
+    """
+
+    def __get__(self, resource, class_):
+        if resource is None:
+            return self
+        return resource.__dict__.setdefault('__cache__',
+                                            resource.__cacheclass__())
+
+
+def orphan():
+    return None
+
+
+class WeakParent(object):
+    """
+    Weak link to parent resource.
+
+    It is used as ``__parent__`` attribute of resource classes, which have
+    ``__parentlink__ = 'weak'``.  The weak reference is stored in instance
+    dictionary.
+
+    """
+
+    def __get__(self, resource, class_):
+        if resource is None:
+            return self
+        return resource.__dict__['__weakparent__']()
+
+    def __set__(self, resource, parent):
+        resource.__dict__['__weakparent__'] = \
+            weakref.ref(parent) if parent is not None else orphan
 
 
 class ResourceMeta(type):
@@ -17,6 +62,13 @@ class ResourceMeta(type):
         cls._children_set = []
         cls._named_nodes = {}
         cls.__not_exist__ = getattr(cls, '__not_exist__', None)
+        link = attrs.get('__parentlink__')
+        if link == 'weak':
+            cls.__parent__ = WeakParent()
+        elif link == 'strong':
+            cls.__parent__ = None
+        elif link is not None:
+            raise ValueError('Unsupported parent link: %r' % link)
 
 
 # For compatibility between Python 2.x and Python 3.x
@@ -35,6 +87,12 @@ class Resource(BaseResource):
 
         Class of route.  Links to :class:`traversalkit.route.Route`.
 
+    ..  attribute:: __registry__
+
+        Registry of interned routes.  Links to
+        :data:`traversalkit.route.registry`, which is an instance of
+        :class:`traversalkit.route.RouteRegistry`.
+
     ..  attribute:: __cacheclass__
 
         Class of cache.  Links to :class:`traversalkit.cache.Cache`.
@@ -76,15 +134,53 @@ class Resource(BaseResource):
         Resource name, which has been passed to parent's :meth:`__getitem__` or
         :meth:`get` method.
 
+    ..  attribute:: __key__
+
+        Resource key, i.e. :attr:`__name__` converted by ``converter``
+        passed to :meth:`mount_set`.  It is equal to :attr:`__name__`,
+        if there is no converter.
+
     ..  attribute:: __parent__
 
-        Link to a parent resource.  It is actually a property, which
-        stores weak reference to the parent.
+        Link to a parent resource.  See :attr:`__parentlink__`.
+
+    ..  attribute:: __parentlink__
+
+        Strategy of :attr:`__parent__` link.  It is ``'weak'`` by default,
+        i.e. the link is a property, which stores weak reference to the
+        parent, so child resource does not keep its parent alive.
+
+        If it is ``'strong'``, the link is a plain attribute.  It makes
+        access to the parent faster, i.e. :meth:`lineage`, :attr:`uri`,
+        and :attr:`__route__`.  However, the tree references itself, so it
+        is freed as a unit by garbage collector, or on release by
+        :meth:`request_tree`.  And child resource keeps its parent alive.
+        It suits request-scoped trees, which are dropped wholesale.
+
+        The strategy is selected per class of child resource,
+        and it is inherited by derived classes.
+
+        ..  doctest::
+
+            >>> from traversalkit import Resource, DEC_ID
+
+            >>> class Users(Resource):
+            ...     ''' Collection of users '''
+
+            >>> @Users.mount_set(DEC_ID, metaname='user_id')
+            ... class User(Resource):
+            ...     ''' User resource '''
+            ...     __parentlink__ = 'strong'
+
+            >>> user = Users()['1']
+            >>> user.__parent__
+            <Users: />
 
     ..  attribute:: __cache__
 
         Cache of child resources.  It is used by :meth:`__getitem__` and
         :meth:`get` methods.  Instance of :attr:`__cacheclass__`.
+        It is created on first access.
 
     ..  attribute:: __node__
 
@@ -94,7 +190,36 @@ class Resource(BaseResource):
     ..  attribute:: __route__
 
         Route, which has been used to create this resource.
-        Instance of :attr:`__routeclass__`.
+        Instance of :attr:`__routeclass__`.  It is interned by
+        :attr:`__registry__`, so resources of the same route share
+        the same route object.
+
+    ..  attribute:: __routeid__
+
+        Integer ID of :attr:`__route__`, see
+        :class:`traversalkit.route.RouteRegistry`, or ``None``,
+        if the route is not interned.
+
+    ..  attribute:: __arena__
+
+        Arena of the resource tree, if the tree has been created by
+        :meth:`request_tree`, otherwise ``None``.
+
+    ..  attribute:: __budget__
+
+        Tree-wide budget of cached resources, see
+        :class:`traversalkit.budget.Budget`, or ``None``.
+        It is inherited by cached child resources.
+
+    ..  attribute:: __metrics__
+
+        Latency metrics of the resource tree, see
+        :class:`traversalkit.metrics.Metrics`, or ``None``.
+        It is inherited by child resources.
+
+    ..  attribute:: __frozen__
+
+        Whether the resource tree has been frozen by :meth:`freeze`.
 
     ..  attribute:: uri
 
@@ -105,7 +230,22 @@ class Resource(BaseResource):
 
     __nodeclass__ = Node
     __routeclass__ = Route
+    __registry__ = registry
     __cacheclass__ = Cache
+    __cache__ = CacheProperty()
+    __arena__ = None
+    __budget__ = None
+    __clock__ = None
+    __metrics__ = None
+    __parentlink__ = 'weak'
+    __frozen__ = False
+
+    # Attributes, which are not accounted by ``sizeof`` method,
+    # because they are shared with other resources or accounted separately.
+    __shared__ = frozenset([
+        '__cache__', '__node__', '__route__', '__arena__', '__budget__',
+        '__metrics__', '__parent__',
+    ])
 
     ##
     # Resource tree manipulation and introspection
@@ -121,6 +261,8 @@ class Resource(BaseResource):
         :param Condition complies: Condition of the route.
             See examples of :class:`traversalkit.condition.Under`
             and :class:`traversalkit.condition.Recursion` for details.
+        :param Policy cache: Cache policy of the child resource.
+            See :class:`traversalkit.cache.Policy` for details.
         :return: Unmodified ``class_``.
 
         The method can be used as a decorator.
@@ -146,6 +288,7 @@ class Resource(BaseResource):
                                      name=name,
                                      complies=complies,
                                      **kw)
+            node.mounted = True
             cls._children_map[name] = node
             cls._named_nodes[name] = node
             return class_
@@ -163,12 +306,30 @@ class Resource(BaseResource):
         """
         Mounts set of child resources.
 
-        :param regex pattern: Regular expression to match child name.
+        :param pattern: Pattern to match child name.  It can be
+                        a compiled regular expression, a callable,
+                        or a matcher object from :mod:`traversalkit.ids`.
+                        See :func:`traversalkit.ids.matcher`.
         :param Resource class_: Child resource class.
         :param str metaname: Name of the route.  It is used by :meth:`node`.
         :param Condition complies: Condition of the route.
             See examples of :class:`traversalkit.condition.Under`
             and :class:`traversalkit.condition.Recursion` for details.
+        :param callable converter: Optional function to convert child name
+            into its key, see :attr:`__key__`.  It is called once, when the
+            child is created.  If it raises ``ValueError``, the child will be
+            treated as nonexistent.  By default ``convert`` method of the
+            pattern is used, if the pattern has one.
+        :param Policy cache: Cache policy of child resources.
+            See :class:`traversalkit.cache.Policy` for details.
+        :param columns: Fields of child payloads to store column-wise.
+            See :meth:`columns` for details.
+        :param payloads: Source of child payloads, i.e. object with
+            ``get(name)`` method, that returns payload or ``None``.
+            The payload is used, when child resource is requested by
+            :meth:`get` without payload.
+            See :class:`traversalkit.store.PayloadStore` and
+            :class:`traversalkit.payloads.PayloadCache`.
         :return: Unmodified ``class_``.
 
         The method can be used as a decorator.
@@ -192,6 +353,20 @@ class Resource(BaseResource):
             ...
             KeyError: ('john', '/')
 
+        Using converter:
+
+        ..  doctest::
+
+            >>> class Posts(Resource):
+            ...     ''' Collection of posts '''
+
+            >>> @Posts.mount_set(DEC_ID, metaname='post_id', converter=int)
+            ... class Post(Resource):  #                     ^^^^^^^^^^^^^
+            ...     ''' Post resource '''
+
+            >>> Posts()['42'].__key__
+            42
+
         """
         def decorator(class_):
             node = cls.__nodeclass__(class_,
@@ -199,6 +374,7 @@ class Resource(BaseResource):
                                      metaname=metaname,
                                      complies=complies,
                                      **kw)
+            node.mounted = True
             cls._children_set.append(node)
             if node.metaname is not None:
                 cls._named_nodes[node.metaname] = node
@@ -239,30 +415,75 @@ class Resource(BaseResource):
             <Route: /users/{user_id}/>
 
         """
-        def walktree(class_, route):
-            yield route
+        return cls.route_graph().routes()
 
-            single_nodes = (class_._children_map[name]
-                            for name in sorted(class_._children_map.keys()))
-            set_nodes = (node for node in class_._children_set)
+    @classmethod
+    def route_graph(cls):
+        """
+        Returns route graph of the current resource.
+
+        The graph is useful to introspect large and recursive resource trees,
+        where :meth:`routes` produces too many routes.
+
+        :return: Route graph, see :class:`traversalkit.route.RouteGraph`.
+
+        """
+        return RouteGraph(cls)
+
+    @classmethod
+    @contextmanager
+    def request_tree(cls, payload=None, pool=None):
+        """
+        Returns context manager of request-scoped resource tree.
 
-            for node in chain(single_nodes, set_nodes):
-                if node.complies(route):
-                    for sub_route in walktree(node.class_, route + node):
-                        yield sub_route
+        All resources of the tree are created within
+        :class:`traversalkit.arena.Arena`.  When the context is over,
+        the tree is torn down in bulk, and its resource and cache objects
+        are recycled into the pool, so that the next tree of the same classes
+        reuses them.  Therefore, the resources must not be used (or
+        referenced) outside of the context.
 
-        start_route = cls.__routeclass__(cls.__nodeclass__(cls, name=''))
-        for route in walktree(cls, start_route):
-            yield route
+        :param payload: Optional payload of the root resource.
+        :param Pool pool: Optional pool of recycled objects.
+            :data:`traversalkit.arena.default_pool` is used by default.
+        :return: Context manager, that returns the root resource.
+
+        ..  doctest::
+
+            >>> from traversalkit import Resource, DEC_ID
+
+            >>> class Root(Resource):
+            ...     ''' Site root '''
+
+            >>> @Root.mount('users')
+            ... class Users(Resource):
+            ...     ''' Collection of users '''
+
+            >>> with Root.request_tree() as root:
+            ...     users = root['users']
+            ...     print(users)
+            <Users: /users/>
+
+            >>> with Root.request_tree() as root:
+            ...     root['users'] is users      # Recycled object
+            True
+
+        """
+        arena = Arena(pool)
+        try:
+            yield arena.create(cls, payload=payload)
+        finally:
+            arena.release()
 
     ##
     # Initialization methods and properties
     #
 
-    def __init__(self, name='', parent=None, payload=None, node=None):
+    def __init__(self, name='', parent=None, payload=None, node=None,
+                 key=None):
         self.__name__ = name
+        self.__key__ = name if key is None else key
         self.__parent__ = parent
-        self.__cache__ = self.__cacheclass__()
         self.__node__ = node or self.__nodeclass__(self.__class__, name=name)
         self.on_init(payload)
 
@@ -280,19 +501,29 @@ class Resource(BaseResource):
 
         """
 
-    @property
-    def __parent__(self):
-        return self.__parent()
+    def on_invalidate(self):
+        """
+        Invalidation callback.
 
-    @__parent__.setter
-    def __parent__(self, parent):
-        self.__parent = weakref.ref(parent) if parent else lambda: None
+        It is called, when the resource is removed from the cache of its
+        parent by :meth:`invalidate` or :meth:`invalidate_where`.
+        Derived classes can override it to clear dependent caches.
+
+        """
 
     @cached_property
     def __route__(self):
         if self.__parent__ is None:
-            return self.__routeclass__(self.__node__)
-        return self.__parent__.__route__ + self.__node__
+            route = self.__routeclass__(self.__node__)
+            if self.__name__:
+                return route
+            return self.__registry__.intern(route)
+        return self.__registry__.child(self.__parent__.__route__,
+                                       self.__node__)
+
+    @property
+    def __routeid__(self):
+        return self.__route__.id
 
     @cached_property
     def uri(self):
@@ -304,6 +535,150 @@ class Resource(BaseResource):
     def __repr__(self):
         return '<{0}: {1}>'.format(self.__class__.__name__, self.uri)
 
+    def fork(self, parent=None):
+        """
+        Returns copy-on-write fork of the resource tree.
+
+        The fork is a shallow copy of the resource, i.e. it shares state
+        built by :meth:`on_init` with the original one, but :meth:`on_init`
+        is not called again.  The original resource and its subtree are
+        used as a read-only template.  Child resources of the template are
+        forked in the same way, when they are accessed through the fork,
+        and new child resources are created within the fork only.
+        See :class:`traversalkit.cache.ForkCache` for details.
+
+        Column-wise storages of child payloads (see :meth:`columns`)
+        are copied, so they can be modified within the fork.  Forks are
+        detached from tree-wide budget of the template (see
+        :class:`traversalkit.budget.Budget`), so they do not evict cached
+        resources of the template.  Attach a budget to the fork explicitly,
+        if it is needed.
+
+        It is useful to pre-warm static upper part of the tree once,
+        and fork it for each request.
+
+        :param Resource parent: Parent of the fork.  It is used to attach
+                                forks of child resources to forked parents.
+        :return: Forked resource.
+
+        ..  doctest::
+
+            >>> from traversalkit import Resource, DEC_ID
+
+            >>> class Root(Resource):
+            ...     ''' Site root '''
+
+            >>> @Root.mount('users')
+            ... class Users(Resource):
+            ...     ''' Collection of users '''
+            ...     def on_init(self, payload):
+            ...         print('Loading users...')
+
+            >>> @Users.mount_set(DEC_ID, metaname='user_id')
+            ... class User(Resource):
+            ...     ''' User resource '''
+
+            >>> template = Root()
+            >>> template['users']
+            Loading users...
+            <Users: /users/>
+
+            >>> root = template.fork()
+            >>> users = root['users']
+            >>> users is template['users']
+            False
+            >>> users.__parent__ is root
+            True
+            >>> users['1']
+            <User: /users/1/>
+            >>> list(template['users'].__cache__)
+            []
+
+        """
+        clone = self.__class__.__new__(self.__class__)
+        state = clone.__dict__
+        state.update(self.__dict__)
+        template = state.pop('__cache__', None)
+        state.pop('__clock__', None)
+        state.pop('__budget__', None)
+        state.pop('__inherited__', None)
+        state.pop('__frozen__', None)
+        columns = state.pop('__columns__', None)
+        if columns:
+            state['__columns__'] = dict(
+                (node, storage.copy()) for node, storage in columns.items()
+            )
+        clone.__parent__ = parent
+        clone.__cache__ = ForkCache(template if template is not None else {},
+                                    clone)
+        return clone
+
+    def freeze(self):
+        """
+        Freezes the resource and all its cached descendants.
+
+        Caches of the resources are replaced by immutable ones (see
+        :class:`traversalkit.cache.FrozenCache`).  Then :meth:`get` and
+        friends return cached child resources, or create new ones without
+        caching them, i.e. throwaway resources, which are private
+        to the caller.  :attr:`__route__` and :attr:`uri` are computed
+        in advance, and the resources are detached from tree-wide budget
+        (see :class:`traversalkit.budget.Budget`).  So lookups within
+        the frozen tree do not modify shared state and can be run from
+        concurrent threads without locking.
+
+        Other lazy attributes, i.e. :class:`traversalkit.inherited.inherited`
+        ones, should be computed before freezing, if the tree must not be
+        modified at all.
+
+        Frozen tree can be forked by :meth:`fork`.  Forks are not frozen.
+
+        :return: The resource itself.
+
+        ..  doctest::
+
+            >>> from traversalkit import Resource, DEC_ID
+
+            >>> class Users(Resource):
+            ...     ''' Collection of users '''
+
+            >>> @Users.mount_set(DEC_ID, metaname='user_id')
+            ... class User(Resource):
+            ...     ''' User resource '''
+
+            >>> users = Users()
+            >>> user = users['1']
+            >>> users = users.freeze()
+            >>> users['1'] is user
+            True
+            >>> users['2'] is users['2']
+            False
+            >>> len(users.__cache__)
+            1
+
+        """
+        empty = FrozenCache()
+        stack = [self]
+        while stack:
+            resource = stack.pop()
+            resource.__route__
+            resource.uri
+            state = resource.__dict__
+            cache = state.get('__cache__')
+            if cache:
+                items = [(key, cache.get(key)) for key in list(cache)]
+                cache = FrozenCache(
+                    (key, child) for key, child in items if child is not None
+                )
+                stack.extend(cache.values())
+            else:
+                cache = empty
+            state['__cache__'] = cache
+            state.pop('__clock__', None)
+            state.pop('__budget__', None)
+            state['__frozen__'] = True
+        return self
+
     ##
     # Child creation methods
     #
@@ -324,10 +699,16 @@ class Resource(BaseResource):
 
         ..  code-block:: python
 
-            def create_child(name, payload=None):
+            def create_child(name, payload=None, cache=True):
 
         :param string name: Name of the resource.
         :param payload: Optional resource payload.
+        :param bool cache: Whether to store the resource in the cache.
+                           Pass ``False`` to stream a lot of child resources
+                           without retaining them.  Unlike
+                           :meth:`traversalkit.cache.Cache.readonly`,
+                           it does not affect any other code, that uses
+                           the same cache concurrently.
         :return: Child resource.
         :rtype: Resource
 
@@ -369,6 +750,22 @@ class Resource(BaseResource):
             >>> users['2'] is jane
             True
 
+        Streaming of child resources, that bypasses the cache:
+
+        ..  doctest::
+
+            >>> def export(users, ids):
+            ...     with users.node('user_id') as create_child:
+            ...         for id in ids:
+            ...             yield create_child(str(id), cache=False)
+            ...             #                           ^^^^^^^^^^^
+
+            >>> users = Users()
+            >>> [user.uri for user in export(users, range(3))]
+            ['/0/', '/1/', '/2/']
+            >>> len(users.__cache__)
+            0
+
         """
         try:
             node = self._named_nodes[name]
@@ -377,11 +774,71 @@ class Resource(BaseResource):
         if not node.complies(self.__route__):
             raise KeyError(name, self.uri)
 
-        def create_child(name, payload=None):
-            return self._child(node, name, payload=payload)
+        def create_child(name, payload=None, cache=True):
+            return self._child(node, name, payload=payload, cache=cache)
 
         yield create_child
 
+    def columns(self, name):
+        """
+        Returns column-wise storage of child payloads.
+
+        The route node should be mounted by :meth:`mount_set` with
+        ``columns`` parameter, which is a sequence of payload fields.
+        See :class:`traversalkit.columns.Columns` for details.
+
+        When a child resource is requested by :meth:`get` without payload,
+        its stored payload is used.  So child resources are created
+        only when they are accessed.
+
+        :param str name: Name of the route node, i.e. ``metaname`` parameter
+                         of :meth:`mount_set`.
+        :return: Storage of payloads.
+        :rtype: traversalkit.columns.Columns
+        :raises KeyError: If node does not exist or it has been mounted
+                          without ``columns`` parameter.
+
+        ..  doctest::
+
+            >>> from traversalkit import Resource, DEC_ID
+
+            >>> class Users(Resource):
+            ...     ''' Collection of users '''
+            ...     def on_init(self, payload):
+            ...         # Let's imagine these data come from DB
+            ...         users = [{'id': 1, 'name': 'John'},
+            ...                  {'id': 2, 'name': 'Jane'}]
+            ...         self.columns('user_id').extend(
+            ...             (str(user['id']), user) for user in users
+            ...         )
+
+            >>> @Users.mount_set(DEC_ID, metaname='user_id',
+            ...                  columns=[('id', 'l'), 'name'])
+            ... class User(Resource):  # ^^^^^^^^^^^^^^^^^^^^^^^^
+            ...     ''' User resource '''
+            ...     def on_init(self, payload):
+            ...         self.name = payload and payload['name']
+
+            >>> users = Users()
+            >>> list(users.columns('user_id').where('name',
+            ...                                     lambda n: n[0] == 'J'))
+            ['1', '2']
+            >>> len(users.__cache__)
+            0
+            >>> users['2'].name
+            'Jane'
+            >>> users['3'].name is None
+            True
+
+        """
+        node = self._named_nodes.get(name)
+        if node is None or node.columns is None:
+            raise KeyError(name, self.uri)
+        columns = self.__dict__.setdefault('__columns__', {})
+        if node not in columns:
+            columns.setdefault(node, Columns(node.columns))
+        return columns[node]
+
     def __getitem__(self, name):
         """
         Returns child resource by its name.
@@ -470,10 +927,94 @@ class Resource(BaseResource):
             1
 
         """
-        try:
-            return self.__cache__[name]
-        except KeyError:
-            pass
+        child = self.lookup(name, payload)
+        if isinstance(child, Miss):
+            raise child.error()
+        return child
+
+    def find(self, name, payload=None, default=None):
+        """
+        Returns child resource by its name or ``default`` value.
+
+        It works like :meth:`get`, but does not raise ``KeyError``,
+        if the child resource does not exist.
+
+        :param str name: Resource name.
+        :param payload: Optional resource payload.
+        :param default: Value to return, if the child resource does not exist.
+        :return: Child resource or ``default``.
+
+        ..  doctest::
+
+            >>> from traversalkit import Resource, DEC_ID
+
+            >>> class Users(Resource):
+            ...     ''' Collection of users '''
+
+            >>> @Users.mount_set(DEC_ID, metaname='user_id')
+            ... class User(Resource):
+            ...     ''' User resource '''
+
+            >>> users = Users()
+            >>> users.find('1')
+            <User: /1/>
+            >>> users.find('john') is None
+            True
+
+        """
+        child = self.lookup(name, payload)
+        if isinstance(child, Miss):
+            return default
+        return child
+
+    def lookup(self, name, payload=None):
+        """
+        Returns child resource by its name or :class:`Miss` descriptor.
+
+        It works like :meth:`get`, but does not raise ``KeyError``,
+        if the child resource does not exist.  Returned :class:`Miss`
+        describes the reason.  Unlike ``KeyError`` it does not compute
+        :attr:`uri` of the resource, until it is requested.
+
+        :param str name: Resource name.
+        :param payload: Optional resource payload.
+        :return: Child resource or :class:`Miss`.
+
+        ..  doctest::
+
+            >>> from traversalkit import Resource, DEC_ID
+
+            >>> class Users(Resource):
+            ...     ''' Collection of users '''
+
+            >>> @Users.mount_set(DEC_ID, metaname='user_id')
+            ... class User(Resource):
+            ...     ''' User resource '''
+
+            >>> users = Users()
+            >>> users.lookup('1')
+            <User: /1/>
+            >>> miss = users.lookup('john')
+            >>> miss
+            <Miss: no_route john>
+            >>> miss.reason == Miss.NO_ROUTE
+            True
+            >>> bool(miss)
+            False
+
+        """
+        child = self._cached(name)
+        if child is not None:
+            return child
+        return self._resolve(name, payload)
+
+    def _cached(self, name):
+        child = self.__cache__.get(name)
+        if child is not None and child.__clock__ is not None:
+            child.__clock__[1] = True
+        return child
+
+    def _resolve(self, name, payload=None):
         try:
             node = self._children_map[name]
         except KeyError:
@@ -481,26 +1022,432 @@ class Resource(BaseResource):
                 if node.pattern.match(name):
                     break
             else:
-                raise KeyError(name, self.uri)
+                return Miss(Miss.NO_ROUTE, name, self)
         if not node.complies(self.__route__):
-            raise KeyError(name, self.uri)
-        return self._child(node, name, payload=payload)
+            return Miss(Miss.CONDITION, name, self)
+        return self._create(node, name, payload, load=payload is None)
+
+    def _child(self, node, name, payload=None, cache=True):
+        child = self._create(node, name, payload, cache)
+        if isinstance(child, Miss):
+            raise child.error()
+        return child
 
-    def _child(self, node, name, payload=None):
+    def _create(self, node, name, payload=None, cache=True, load=False):
+        if deadline_state.deadline is not None:
+            check_deadline(name, self)
         try:
-            child = self.__cache__[name] = node.class_(
-                name=name,
-                parent=self,
-                payload=payload,
-                node=node,
-            )
+            key = node.key(name)
+        except ValueError:
+            return Miss(Miss.NO_ROUTE, name, self)
+        if load:
+            if node.payloads is not None:
+                payload = node.payload(self, name)
+            elif node.columns is not None:
+                columns = self.__dict__.get('__columns__')
+                if columns is not None and node in columns:
+                    payload = columns[node].row(name)
+        metrics = self.__metrics__
+        if metrics is not None:
+            start = metrics.clock()
+        try:
+            if self.__arena__ is None:
+                child = node.class_(
+                    name=name,
+                    parent=self,
+                    payload=payload,
+                    node=node,
+                    key=key,
+                )
+            else:
+                child = self.__arena__.create(
+                    node.class_,
+                    name=name,
+                    parent=self,
+                    payload=payload,
+                    node=node,
+                    key=key,
+                )
         except Exception as e:
             if node.class_.__not_exist__ and \
                isinstance(e, node.class_.__not_exist__):
-                raise KeyError(name, self.uri)
+                return Miss(Miss.NOT_EXIST, name, self)
             raise
+        if metrics is not None:
+            child.__metrics__ = metrics
+            metrics.observe_create(child.__route__, metrics.clock() - start)
+        if cache and not self.__frozen__:
+            policy = node.cache
+            if policy is None:
+                self.__cache__[name] = child
+            elif policy is not False:
+                self.__cache__.put(name, child, policy)
+            else:
+                return child
+            if self.__budget__ is not None:
+                self.__budget__.admit(child)
         return child
 
+    def prefetch(self, paths, executor=None):
+        """
+        Resolves multiple paths at once.
+
+        Paths are merged into a prefix tree, so that each shared prefix
+        is resolved exactly once.  The tree is resolved level by level.
+        If ``executor`` is passed, child resources of the same level are
+        created in parallel using its ``map`` method.  So it is useful
+        when :meth:`on_init` of resources is I/O bound.
+
+        :param paths: Iterable of paths relative to the current resource,
+                      i.e. ``'/users/1/'`` or ``'users/1'``.
+        :param executor: Optional executor, i.e. an instance of
+                         :class:`concurrent.futures.ThreadPoolExecutor`.
+        :return: Dictionary, where keys are passed paths and values are
+                 resolved resources or :class:`Miss` descriptors.
+        :rtype: dict
+
+        ..  doctest::
+
+            >>> from traversalkit import Resource, DEC_ID
+
+            >>> class Root(Resource):
+            ...     ''' Site root '''
+
+            >>> @Root.mount('users')
+            ... class Users(Resource):
+            ...     ''' Collection of users '''
+
+            >>> @Users.mount_set(DEC_ID, metaname='user_id')
+            ... class User(Resource):
+            ...     ''' User resource '''
+
+            >>> root = Root()
+            >>> result = root.prefetch(['/users/1/', '/users/2/', '/groups/'])
+            >>> result['/users/1/']
+            <User: /users/1/>
+            >>> result['/users/2/']
+            <User: /users/2/>
+            >>> result['/groups/']
+            <Miss: no_route groups>
+
+        """
+        trie = ({}, [])
+        for path in paths:
+            level = trie
+            for name in path.split('/'):
+                if name:
+                    level = level[0].setdefault(name, ({}, []))
+            level[1].append(path)
+
+        result = {}
+
+        def lookup(item):
+            parent, name, level = item
+            return parent.lookup(name), level
+
+        def collect(outcome, level):
+            children, paths = level
+            for path in paths:
+                result[path] = outcome
+            for child_level in children.values():
+                collect(outcome, child_level)
+
+        map_ = executor.map if executor is not None else map
+        for path in trie[1]:
+            result[path] = self
+        frontier = [(self, name, level) for name, level in trie[0].items()]
+        while frontier:
+            next_frontier = []
+            for outcome, level in map_(lookup, frontier):
+                if isinstance(outcome, Miss):
+                    collect(outcome, level)
+                    continue
+                children, paths = level
+                for path in paths:
+                    result[path] = outcome
+                next_frontier.extend(
+                    (outcome, name, child_level)
+                    for name, child_level in children.items()
+                )
+            frontier = next_frontier
+        return result
+
+    ##
+    # Cache invalidation methods
+    #
+
+    def invalidate(self, path, recursive=True):
+        """
+        Removes resource from the cache of its parent.
+
+        Only cached resources are walked to find the target one.
+        So if any resource of the path is not cached, nothing will happen.
+        :meth:`on_invalidate` callback is called for the removed resource.
+        If ``recursive`` is ``True``, it is also called for all cached
+        descendants of the removed resource.
+
+        :param str path: Path relative to the current resource,
+                         i.e. ``'/users/1/'`` or ``'users/1'``.
+                         If the path is empty (i.e. ``'/'``), all cached
+                         child resources of the current one are removed.
+        :param bool recursive: Whether to notify cached descendants.
+        :return: Number of notified resources.
+        :rtype: int
+
+        ..  doctest::
+
+            >>> from traversalkit import Resource, DEC_ID
+
+            >>> class Root(Resource):
+            ...     ''' Site root '''
+
+            >>> @Root.mount('users')
+            ... class Users(Resource):
+            ...     ''' Collection of users '''
+
+            >>> @Users.mount_set(DEC_ID, metaname='user_id')
+            ... class User(Resource):
+            ...     ''' User resource '''
+            ...     def on_invalidate(self):
+            ...         print('Invalidated: %s' % self.uri)
+
+            >>> root = Root()
+            >>> user = root['users']['1']
+            >>> root.invalidate('/users/1/')
+            Invalidated: /users/1/
+            1
+            >>> root['users']['1'] is user
+            False
+
+        """
+        names = [name for name in path.split('/') if name]
+        parent = self
+        for name in names[:-1]:
+            parent = parent.__cache__.get(name)
+            if parent is None:
+                return 0
+        cache = parent.__cache__
+        if names:
+            targets = [names[-1]]
+        else:
+            targets = list(cache)
+        count = 0
+        for name in targets:
+            child = cache.get(name)
+            if child is not None:
+                del cache[name]
+                count += child._notify_invalidated(recursive)
+        return count
+
+    def invalidate_where(self, prefix=None, cls=None, route=None,
+                         recursive=True):
+        """
+        Removes resources, that match given criteria, from the cache.
+
+        The method walks cached descendants of the current resource only.
+        It does not walk into branches, that cannot match the criteria.
+        All criteria are optional, but at least one of them is required.
+        The resource matches, if it matches all given criteria.
+
+        :param str prefix: Prefix of resource :attr:`uri`.
+        :param Resource,str cls: Class or class name of resource.
+        :param str route: Route template, i.e. :attr:`Route.uri` of
+                          :attr:`__route__`.
+        :param bool recursive: Whether to notify cached descendants
+                               of removed resources.
+        :return: Number of notified resources.
+        :rtype: int
+
+        ..  doctest::
+
+            >>> from traversalkit import Resource, DEC_ID
+
+            >>> class Root(Resource):
+            ...     ''' Site root '''
+
+            >>> @Root.mount('users')
+            ... class Users(Resource):
+            ...     ''' Collection of users '''
+
+            >>> @Users.mount_set(DEC_ID, metaname='user_id')
+            ... class User(Resource):
+            ...     ''' User resource '''
+
+            >>> root = Root()
+            >>> users = [root['users'][str(i)] for i in range(20)]
+            >>> root.invalidate_where(prefix='/users/1')
+            11
+            >>> sorted(root['users'].__cache__, key=int)
+            ['0', '2', '3', '4', '5', '6', '7', '8', '9']
+            >>> root.invalidate_where(route='/users/{user_id}/')
+            9
+            >>> len(root['users'].__cache__)
+            0
+
+        """
+        if prefix is None and cls is None and route is None:
+            raise TypeError('At least one criterion is required')
+        if route is not None:
+            depth = len(route.strip('/').split('/')) + 1
+        count = 0
+        stack = [self]
+        while stack:
+            parent = stack.pop()
+            cache = parent.__dict__.get('__cache__')
+            if not cache:
+                continue
+            for name in list(cache):
+                child = cache.get(name)
+                if child is None:
+                    continue
+                if prefix is not None:
+                    uri = child.uri
+                    if not uri.startswith(prefix):
+                        if prefix.startswith(uri):
+                            stack.append(child)
+                        continue
+                if route is not None:
+                    child_route = child.__route__
+                    if len(child_route) < depth:
+                        stack.append(child)
+                        continue
+                    if child_route.uri != route:
+                        continue
+                if cls is not None:
+                    if isinstance(cls, type):
+                        matches = child.__class__ is cls
+                    else:
+                        matches = child.__class__.__name__ == cls
+                    if not matches:
+                        stack.append(child)
+                        continue
+                del cache[name]
+                count += child._notify_invalidated(recursive)
+        return count
+
+    def _notify_invalidated(self, recursive):
+        count = 0
+        stack = [self]
+        while stack:
+            resource = stack.pop()
+            resource.on_invalidate()
+            count += 1
+            if recursive:
+                cache = resource.__dict__.get('__cache__')
+                if cache:
+                    stack.extend(cache.values())
+        return count
+
+    ##
+    # Memory accounting methods
+    #
+
+    def census(self):
+        """
+        Returns counts and approximate sizes of cached resources.
+
+        The current resource and all its cached descendants are walked
+        iteratively.  The walk does not create resources, forks or routes,
+        so it is safe to run it on a live tree.  Descendants of forked
+        resources (see :meth:`fork`), which are still shared with the
+        template tree, are not walked.
+
+        Size of each resource is computed by :meth:`sizeof`.
+
+        :return: Dictionary with keys ``count`` and ``size`` (totals),
+                 ``classes``, ``routes``, and ``depths``.  The last ones are
+                 dictionaries, where keys are resource classes, route
+                 templates (i.e. :attr:`traversalkit.route.Route.uri`),
+                 and depths relative to the current resource, and values
+                 are dictionaries with keys ``count`` and ``size``.
+        :rtype: dict
+
+        ..  doctest::
+
+            >>> from traversalkit import Resource, DEC_ID
+
+            >>> class Users(Resource):
+            ...     ''' Collection of users '''
+
+            >>> @Users.mount_set(DEC_ID, metaname='user_id')
+            ... class User(Resource):
+            ...     ''' User resource '''
+
+            >>> @User.mount('posts')
+            ... class Posts(Resource):
+            ...     ''' Collection of posts '''
+
+            >>> users = Users()
+            >>> posts = users['1']['posts']
+            >>> user = users['2']
+            >>> census = users.census()
+            >>> census['count']
+            4
+            >>> census['classes'][User]['count']
+            2
+            >>> census['routes']['/{user_id}/posts/']['count']
+            1
+            >>> sorted((depth, stat['count'])
+            ...        for depth, stat in census['depths'].items())
+            [(0, 1), (1, 2), (2, 1)]
+            >>> census['size'] > 0
+            True
+
+        """
+        result = {'count': 0, 'size': 0, 'classes': {}, 'routes': {},
+                  'depths': {}}
+
+        def add(group, key, size):
+            stat = result[group].get(key)
+            if stat is None:
+                stat = result[group][key] = {'count': 0, 'size': 0}
+            stat['count'] += 1
+            stat['size'] += size
+
+        stack = [(self, self.__route__, 0)]
+        while stack:
+            resource, route, depth = stack.pop()
+            size = resource.sizeof()
+            result['count'] += 1
+            result['size'] += size
+            add('classes', resource.__class__, size)
+            add('routes', route.uri, size)
+            add('depths', depth, size)
+            cache = resource.__dict__.get('__cache__')
+            if cache is None:
+                continue
+            for child in cache.peek():
+                child_route = child.__dict__.get('__route__')
+                if child_route is None:
+                    child_route = child.__registry__.child(route,
+                                                           child.__node__)
+                stack.append((child, child_route, depth + 1))
+        return result
+
+    def sizeof(self):
+        """
+        Returns approximate size of the resource in bytes.
+
+        It is used by :meth:`census`.  The default implementation sums
+        shallow sizes of the resource, its attributes, and its cache
+        (see :class:`traversalkit.cache.Cache`), excluding child resources
+        and objects shared with other resources, i.e. route nodes.
+        Derived class can override it to account payloads, that are
+        referenced by the resource.
+
+        :rtype: int
+
+        """
+        state = self.__dict__
+        size = sys.getsizeof(self) + sys.getsizeof(state)
+        for key, value in state.items():
+            if key not in self.__shared__:
+                size += sys.getsizeof(value)
+        cache = state.get('__cache__')
+        if cache is not None:
+            size += sys.getsizeof(cache)
+        return size
+
     ##
     # Lineage introspection methods
     #
@@ -7,11 +7,14 @@ They are used within :class:`traversalkit.resource.Resource` to handle routes.
 """
 
 
+import threading
 from collections import Sequence
-from itertools import chain
+from itertools import chain, islice
 
 from cached_property import cached_property
 
+from .ids import matcher
+
 
 class Node(object):
     """
@@ -19,9 +22,15 @@ class Node(object):
 
     :param Resource class_: Resource class of the node.
     :param str name: Name of the node. Optional.
-    :param regex pattern: Pattern of node name. Optional.
+    :param pattern: Pattern of node name, see :func:`traversalkit.ids.matcher`
+                    for accepted values. Optional.
     :param str metaname: Metaname of node. Optional.
     :param Condition complies: Condition that route should complie. Optional.
+    :param callable converter: Function to convert name into key. Optional.
+    :param Policy cache: Cache policy of resources. Optional.
+    :param columns: Fields of resource payloads to store column-wise.
+                    Optional.
+    :param payloads: Source of resource payloads. Optional.
 
 
     ..  attribute:: class_
@@ -39,7 +48,8 @@ class Node(object):
     ..  attribute:: pattern
 
         Pattern of the node name.  It is specified, when the node is created by
-        :meth:`traversalkit.resource.Resource.mount_set`.
+        :meth:`traversalkit.resource.Resource.mount_set`.  It is an object
+        with ``match`` method, see :mod:`traversalkit.ids`.
 
     ..  attribute:: metaname
 
@@ -47,6 +57,42 @@ class Node(object):
         :meth:`traversalkit.resource.Resource.mount_set`.
 
 
+    ..  attribute:: converter
+
+        Function to convert resource name into its key.  If it is not
+        specified, ``convert`` method of :attr:`pattern` is used, if any.
+
+
+    ..  attribute:: cache
+
+        Cache policy of the node resources.  It is ``None`` (i.e. resources
+        are cached by parent cache as usual), ``False`` (i.e. resources
+        are not cached), or instance of :class:`traversalkit.cache.Policy`.
+
+
+    ..  attribute:: columns
+
+        Fields of resource payloads, that are stored column-wise within
+        parent resource, or ``None``.
+        See :meth:`traversalkit.resource.Resource.columns`.
+
+
+    ..  attribute:: payloads
+
+        Source of resource payloads, i.e. object with ``get(name)`` method,
+        or ``None``.  See :class:`traversalkit.store.PayloadStore`.
+        If the source has ``load(parent, node, name)`` method, it is used
+        instead, see :class:`traversalkit.payloads.PayloadCache`.
+
+
+    ..  attribute:: mounted
+
+        Whether the node has been created by
+        :meth:`traversalkit.resource.Resource.mount` or
+        :meth:`traversalkit.resource.Resource.mount_set`.  Routes of such
+        nodes are interned by :class:`RouteRegistry`.
+
+
     ..  attribute:: type
 
         Type of the node.
@@ -61,12 +107,20 @@ class Node(object):
 
     """
 
+    mounted = False
+
     def __init__(self, class_, name=None, pattern=None, metaname=None,
-                 complies=None):
+                 complies=None, converter=None, cache=None, columns=None,
+                 payloads=None):
         self.class_ = class_
         self.name = name
-        self.pattern = pattern
+        self.pattern = matcher(pattern) if pattern is not None else None
         self.metaname = metaname
+        self.converter = converter or getattr(self.pattern, 'convert', None)
+        self.cache = cache
+        self.columns = columns
+        self.payloads = payloads
+        self._load = getattr(payloads, 'load', None)
         self._complies = complies
 
     @cached_property
@@ -94,6 +148,33 @@ class Node(object):
             return True
         return self._complies(route + self)
 
+    def payload(self, parent, name):
+        """
+        Returns payload of resource from :attr:`payloads` source.
+
+        :param Resource parent: Parent resource.
+        :param str name: Resource name.
+        :return: Payload or ``None``.
+
+        """
+        if self._load is not None:
+            return self._load(parent, self, name)
+        return self.payloads.get(name)
+
+    def key(self, name):
+        """
+        Converts resource name into its key using :attr:`converter`.
+
+        :param str name: Resource name.
+        :return: Resource key, or unmodified ``name``,
+                 if there is no converter.
+        :raises ValueError: If the name cannot be converted.
+
+        """
+        if self.converter is None:
+            return name
+        return self.converter(name)
+
     def __str__(self):
         """
         String representation of the node.
@@ -173,8 +254,15 @@ class Route(Sequence):
         >>> route.uri
         '/foo/{.*}/{bar}/'
 
+    ..  attribute:: id
+
+        Integer ID of the route, if it has been interned by
+        :class:`RouteRegistry`, otherwise ``None``.
+
     """
 
+    id = None
+
     def __init__(self, *nodes):
         self.nodes = nodes
 
@@ -195,3 +283,316 @@ class Route(Sequence):
     @cached_property
     def uri(self):
         return '/'.join(str(n) for n in self) + '/' if self else '*'
+
+
+class RouteRegistry(object):
+    """
+    Registry of interned routes.
+
+    The registry hash-conses routes, i.e. routes of the same sequence
+    of nodes are the same object, and assigns dense integer IDs to them.
+    So per-route data can be stored in flat lists or arrays indexed by
+    :attr:`Route.id` instead of dictionaries keyed by :attr:`Route.uri`.
+
+    Routes of resources are interned by the registry automatically,
+    see :attr:`traversalkit.resource.Resource.__routeid__`.  Root routes
+    are identified by the class of the root resource, because each root
+    resource has its own node.
+
+    Interned routes are never dropped, so IDs are stable during the process
+    lifetime.  To keep the number of IDs bounded by the number of routes
+    of the resource tree, only routes made of mounted nodes (see
+    :attr:`Node.mounted`) are interned by :meth:`child`.  Routes of ad-hoc
+    nodes, i.e. ones created by deprecated
+    :meth:`traversalkit.resource.Resource.child`, and of root resources
+    with non-empty names, are not interned, and their :attr:`Route.id`
+    is ``None``.
+
+    ..  doctest::
+
+        >>> from traversalkit import Resource, DEC_ID
+
+        >>> class Users(Resource):
+        ...     ''' Collection of users '''
+
+        >>> @Users.mount_set(DEC_ID, metaname='user_id')
+        ... class User(Resource):
+        ...     ''' User resource '''
+
+        >>> users = Users()
+        >>> users['1'].__route__ is users['2'].__route__
+        True
+        >>> route_id = users['1'].__routeid__
+        >>> registry[route_id]
+        <Route: /{user_id}/>
+        >>> another = Users()
+        >>> another['3'].__routeid__ == route_id
+        True
+
+    """
+
+    def __init__(self):
+        self._routes = []
+        self._index = {}
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def intern(self, route):
+        """
+        Returns interned route of the same sequence of nodes.
+
+        If there is no such route, the passed one is interned itself.
+
+        :param Route route: Route to intern.
+        :return: Interned route, which has :attr:`Route.id`.
+
+        """
+        if len(route) == 1:
+            key = (route[0].class_, route[0].name)
+        else:
+            key = route.nodes
+        result = self._index.get(key)
+        if result is not None:
+            return result
+        with self._lock:
+            result = self._index.get(key)
+            if result is None:
+                result = route if route.id is None else \
+                    route.__class__(*route)
+                result.id = len(self._routes)
+                self._routes.append(result)
+                self._index[key] = result
+        return result
+
+    def child(self, route, node):
+        """
+        Returns route of the child node.
+
+        It is the same as ``intern(route + node)``, but it does not create
+        a new route, if the child one has been already interned.
+        If the parent route is not interned or the node is not mounted,
+        the child route is not interned too.
+
+        :param Route route: Parent route.
+        :param Node node: Child node.
+        :return: Child route.
+
+        """
+        if route.id is None or not node.mounted:
+            return route + node
+        key = (route.id, node)
+        result = self._children.get(key)
+        if result is None:
+            result = self._children[key] = self.intern(route + node)
+        return result
+
+    def __getitem__(self, route_id):
+        return self._routes[route_id]
+
+    def __iter__(self):
+        return iter(list(self._routes))
+
+    def __len__(self):
+        return len(self._routes)
+
+
+registry = RouteRegistry()
+
+
+class RouteGraph(object):
+    """
+    Route graph of resource tree.
+
+    It is a compact representation of all routes available at the given
+    resource class, where vertices are resource classes and edges are route
+    nodes (see :class:`Node`), i.e. mounts with their conditions.  Unlike
+    :meth:`traversalkit.resource.Resource.routes`, it does not need to walk
+    all the routes to answer the most of questions about them.
+
+    Route counting is memoized, if all conditions of the graph do not depend
+    on order of route nodes (see ``commutative`` attribute of
+    :class:`traversalkit.condition.Condition`).  It makes counting and paging
+    fast even for mutually recursive resources bounded by
+    :class:`traversalkit.condition.Recursion`.
+
+    :param Resource root: Root resource class.
+
+    It should not be instantiated directly.  Use
+    :meth:`traversalkit.resource.Resource.route_graph` instead.
+
+    ..  doctest::
+
+        >>> from traversalkit import Resource, DEC_ID
+        >>> from traversalkit.condition import Recursion
+
+        >>> class Categories(Resource):
+        ...     ''' Categories collection '''
+
+        >>> @Categories.mount_set(DEC_ID, metaname='category_id')
+        ... class Category(Resource):
+        ...     ''' Category resource '''
+
+        >>> Category.mount(
+        ...     'categories', Categories,
+        ...     complies=Recursion(maxdepth=3),
+        ... )   # DOCTEST: +ellipsis
+        <class ...
+
+        >>> graph = Categories.route_graph()
+        >>> graph.count()
+        6
+        >>> graph.reachable('/{category_id}/categories/{category_id}/')
+        True
+        >>> graph.reachable('/{category_id}/{category_id}/')
+        False
+        >>> for route in graph.routes(offset=2, limit=2):
+        ...     print(route)
+        <Route: /{category_id}/categories/>
+        <Route: /{category_id}/categories/{category_id}/>
+
+    """
+
+    def __init__(self, root):
+        self.root = root.__nodeclass__(root, name='')
+        self.start = root.__routeclass__(self.root)
+        self._edges = {}
+        self._memoizable = True
+        self._counts = {}
+        queue = [root]
+        while queue:
+            class_ = queue.pop()
+            if class_ in self._edges:
+                continue
+            edges = self._edges[class_] = [
+                class_._children_map[name]
+                for name in sorted(class_._children_map.keys())
+            ]
+            edges.extend(class_._children_set)
+            for node in edges:
+                if node._complies is not None and \
+                   not getattr(node._complies, 'commutative', False):
+                    self._memoizable = False
+                queue.append(node.class_)
+
+    def edges(self, class_):
+        """
+        Returns route nodes mounted to the resource class.
+
+        :param Resource class_: Resource class.
+        :return: List of nodes in the same order as they are walked by
+                 :meth:`routes`.
+
+        """
+        return self._edges[class_]
+
+    def classes(self):
+        """
+        Returns resource classes, that are reachable from the root one.
+
+        Conditions are not taken into account.
+
+        """
+        return list(self._edges)
+
+    def _start(self):
+        if not self._memoizable:
+            return None
+        return frozenset([((self.root.class_, self.root.name), 1)])
+
+    def _footprint(self, footprint, node):
+        if footprint is None:
+            return None
+        counts = dict(footprint)
+        key = (node.class_, node.name)
+        counts[key] = counts.get(key, 0) + 1
+        return frozenset(counts.items())
+
+    def _children(self, route, footprint):
+        for node in self._edges[route[-1].class_]:
+            if node.complies(route):
+                yield route + node, self._footprint(footprint, node)
+
+    def _count(self, route, footprint):
+        key = (route[-1].class_, footprint)
+        if footprint is not None and key in self._counts:
+            return self._counts[key]
+        result = 1
+        for child, child_footprint in self._children(route, footprint):
+            result += self._count(child, child_footprint)
+        if footprint is not None:
+            self._counts[key] = result
+        return result
+
+    def count(self):
+        """
+        Returns number of routes available at the root resource.
+
+        The result is the same as ``len(list(root.routes()))``.
+
+        """
+        return self._count(self.start, self._start())
+
+    def routes(self, offset=0, limit=None):
+        """
+        Iterates over routes available at the root resource.
+
+        The order is the same as :meth:`traversalkit.resource.Resource.routes`
+        has.  Skipped subtrees are not walked, if counting is memoized.
+
+        :param int offset: Number of routes to skip.
+        :param int limit: Maximum number of routes to return.
+        :return: Iterator over routes.
+
+        """
+        skip = [offset]
+
+        def walk(route, footprint):
+            if skip[0]:
+                if footprint is not None:
+                    count = self._count(route, footprint)
+                    if count <= skip[0]:
+                        skip[0] -= count
+                        return
+                skip[0] -= 1
+            else:
+                yield route
+            for child, child_footprint in self._children(route, footprint):
+                for sub_route in walk(child, child_footprint):
+                    yield sub_route
+
+        routes = walk(self.start, self._start() if offset else None)
+        if limit is not None:
+            routes = islice(routes, limit)
+        return routes
+
+    def find(self, template):
+        """
+        Searches route by its template.
+
+        :param str template: Route template, i.e. value of :attr:`Route.uri`.
+        :return: Route or ``None``, if the route is not reachable.
+
+        """
+        names = template.strip('/').split('/') if template != '/' else []
+
+        def walk(route, names):
+            if not names:
+                return route
+            for node in self._edges[route[-1].class_]:
+                if str(node) == names[0] and node.complies(route):
+                    result = walk(route + node, names[1:])
+                    if result is not None:
+                        return result
+            return None
+
+        return walk(self.start, names)
+
+    def reachable(self, template):
+        """
+        Tests whether the route template is reachable from the root resource.
+
+        :param str template: Route template, i.e. value of :attr:`Route.uri`.
+        :rtype: bool
+
+        """
+        return self.find(template) is not None
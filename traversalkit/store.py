@@ -0,0 +1,187 @@
+"""
+The module provides memory-mapped read-only payload store.
+
+It is useful for large read-only subtrees, i.e. product catalog, which is
+rebuilt periodically.  The store is built once into a single file, which
+consists of a header, a sorted index, keys, and records.  Then the file is
+memory-mapped by each worker process, so the data are shared between the
+processes through the page cache, and payloads are returned as zero-copy
+:class:`memoryview` objects (:func:`buffer` ones on Python 2.x).
+
+The store can be passed into
+:meth:`traversalkit.resource.Resource.mount_set` as ``payloads`` parameter.
+So child resources receive their payloads on
+:meth:`traversalkit.resource.Resource.get`.
+
+..  doctest::
+
+    >>> import os, json, tempfile
+    >>> from traversalkit import Resource, TEXT_ID
+
+    >>> path = os.path.join(tempfile.mkdtemp(), 'catalog.tkps')
+    >>> PayloadStore.build(path, [
+    ...     ('sku-1', json.dumps({'title': 'Foo'}).encode('utf-8')),
+    ...     ('sku-2', json.dumps({'title': 'Bar'}).encode('utf-8')),
+    ... ])
+    >>> store = PayloadStore(path)
+
+    >>> class Catalog(Resource):
+    ...     ''' Product catalog '''
+
+    >>> @Catalog.mount_set(TEXT_ID, metaname='sku', payloads=store)
+    ... class Product(Resource):  #                 ^^^^^^^^^^^^^^
+    ...     ''' Product resource '''
+    ...     __not_exist__ = LookupError
+    ...     def on_init(self, payload):
+    ...         if payload is None:
+    ...             raise LookupError(self.__name__)
+    ...         data = json.loads(bytes(payload).decode('utf-8'))
+    ...         self.title = data['title']
+
+    >>> catalog = Catalog()
+    >>> print(catalog['sku-2'].title)
+    Bar
+    >>> catalog.find('sku-3') is None
+    True
+
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+
+
+MAGIC = b'TKPS'
+VERSION = 1
+# For compatibility between Python 2.x and Python 3.x.  Memory-mapped
+# files do not support :class:`memoryview` on Python 2.x, so payloads
+# are returned as zero-copy :func:`buffer` objects there.
+try:  # pragma: no cover
+    zero_copy = buffer
+except NameError:  # pragma: no cover
+    zero_copy = None
+
+HEADER = struct.Struct('<4sII')
+ENTRY = struct.Struct('<QIQI')
+
+
+class PayloadStore(object):
+    """
+    Memory-mapped read-only payload store.
+
+    :param str path: Path to the file built by :meth:`build`.
+
+    The store keeps the file open, while it is used.  If the file is rebuilt
+    by :meth:`build`, the store still uses the previous version, until it is
+    reopened, because the file is replaced atomically.
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self._count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError('Unsupported file format: %s' % path)
+        self._view = memoryview(self._mmap) if zero_copy is None else None
+
+    @classmethod
+    def build(cls, path, items):
+        """
+        Builds store file.
+
+        The file is written into a temporary one, which then replaces
+        the target file atomically.
+
+        :param str path: Path to the file.
+        :param items: Iterable of pairs of names and payloads.
+                      Payloads should be bytes-like objects.
+
+        """
+        items = sorted(
+            (name.encode('utf-8'), memoryview(payload).tobytes())
+            for name, payload in items
+        )
+        keys_offset = HEADER.size + ENTRY.size * len(items)
+        records_offset = keys_offset + sum(len(key) for key, _ in items)
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, VERSION, len(items)))
+                key_offset = keys_offset
+                record_offset = records_offset
+                for key, record in items:
+                    f.write(ENTRY.pack(key_offset, len(key),
+                                       record_offset, len(record)))
+                    key_offset += len(key)
+                    record_offset += len(record)
+                for key, _ in items:
+                    f.write(key)
+                for _, record in items:
+                    f.write(record)
+            os.rename(temp, path)
+        except Exception:
+            os.unlink(temp)
+            raise
+
+    def _entry(self, index):
+        return ENTRY.unpack_from(self._mmap, HEADER.size + ENTRY.size * index)
+
+    def _key(self, index):
+        key_offset, key_length, _, _ = self._entry(index)
+        return self._mmap[key_offset:key_offset + key_length]
+
+    def _search(self, key):
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count and self._key(low) == key:
+            return low
+        return None
+
+    def get(self, name, default=None):
+        """
+        Returns payload by name.
+
+        :param str name: Name of the resource.
+        :param default: Value to return, if there is no payload.
+        :return: Zero-copy :class:`memoryview` of the payload
+                 (:func:`buffer` on Python 2.x) or ``default``.
+
+        """
+        index = self._search(name.encode('utf-8'))
+        if index is None:
+            return default
+        _, _, record_offset, record_length = self._entry(index)
+        if self._view is None:
+            return zero_copy(self._mmap, record_offset, record_length)
+        return self._view[record_offset:record_offset + record_length]
+
+    def __contains__(self, name):
+        return self._search(name.encode('utf-8')) is not None
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self._key(index).decode('utf-8')
+
+    def __len__(self):
+        return self._count
+
+    def close(self):
+        """
+        Closes the store.
+
+        All returned payloads should be released before.
+
+        """
+        if self._view is not None:
+            self._view.release()
+        self._mmap.close()